@@ -0,0 +1,80 @@
+# ruff: noqa: INP001, T201
+from collections.abc import Callable
+from time import perf_counter
+from uuid import uuid4
+
+from pydantic import TypeAdapter
+
+from tgdb.entities.horizon.transaction import Commit
+from tgdb.entities.numeration.number import Number
+from tgdb.entities.relation.relation import RelationSchemaID
+from tgdb.entities.relation.tuple import Tuple
+from tgdb.entities.relation.tuple_effect import NewTuple
+from tgdb.infrastructure.blob_compression import (
+    BlobCompression,
+    compressed_blob,
+    decompressed_blob,
+    is_blob_compression_available,
+)
+from tgdb.infrastructure.pydantic.horizon.commit import EncodableCommit
+
+
+_commit_count = 5000
+_repeat_count = 5
+_adapter = TypeAdapter[tuple[EncodableCommit, ...]](
+    tuple[EncodableCommit, ...],
+)
+_header = "codec       bytes  ratio  pack ms unpack ms"
+
+
+def _commit_batch() -> bytes:
+    schema_id = RelationSchemaID(Number(0), Number(0))
+    commits = tuple(
+        EncodableCommit.of(
+            Commit(
+                uuid4(),
+                frozenset((
+                    NewTuple(
+                        Tuple(uuid4(), schema_id, (index, f"user-{index}")),
+                    ),
+                )),
+            ),
+        )
+        for index in range(_commit_count)
+    )
+
+    return _adapter.dump_json(commits)
+
+
+def _seconds(func: Callable[..., object], *args: object) -> float:
+    started_at = perf_counter()
+
+    for _ in range(_repeat_count):
+        func(*args)
+
+    return (perf_counter() - started_at) / _repeat_count
+
+
+def main() -> None:
+    blob = _commit_batch()
+
+    print(_header)
+
+    for compression in BlobCompression:
+        if not is_blob_compression_available(compression):
+            print(f"{compression:<6} unavailable")
+            continue
+
+        compressed = compressed_blob(blob, compression)
+        pack_seconds = _seconds(compressed_blob, blob, compression)
+        unpack_seconds = _seconds(decompressed_blob, compressed)
+
+        print(
+            f"{compression:<6} {len(compressed):>10}"
+            f" {len(blob) / len(compressed):>6.1f}"
+            f" {pack_seconds * 1000:>8.1f} {unpack_seconds * 1000:>9.1f}",
+        )
+
+
+if __name__ == "__main__":
+    main()
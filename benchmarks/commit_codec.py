@@ -0,0 +1,101 @@
+# ruff: noqa: INP001, T201
+from collections.abc import Callable
+from datetime import UTC, datetime
+from time import perf_counter
+from uuid import uuid4
+
+from pydantic import TypeAdapter
+
+from tgdb.entities.horizon.transaction import Commit, PreparedCommit
+from tgdb.entities.numeration.number import Number
+from tgdb.entities.relation.relation import RelationSchemaID
+from tgdb.entities.relation.tuple import Tuple
+from tgdb.entities.relation.tuple_effect import DeletedTuple, NewTuple
+from tgdb.infrastructure.commit_codec import decoded_commits, encoded_commits
+from tgdb.infrastructure.pydantic.horizon.commit import EncodableCommit
+
+
+_commit_count = 5000
+_repeat_count = 5
+_adapter = TypeAdapter[tuple[EncodableCommit, ...]](
+    tuple[EncodableCommit, ...],
+)
+_header = "codec          bytes  encode ms  decode ms"
+
+
+def _commits() -> tuple[Commit | PreparedCommit, ...]:
+    schema_id = RelationSchemaID(Number(0), Number(0))
+    now = datetime.now(UTC)
+
+    return tuple(
+        Commit(
+            uuid4(),
+            frozenset((
+                NewTuple(
+                    Tuple(
+                        uuid4(),
+                        schema_id,
+                        (index, f"user-{index}", now, uuid4(), None),
+                    ),
+                ),
+                DeletedTuple(uuid4()),
+            )),
+        )
+        for index in range(_commit_count)
+    )
+
+
+def _pydantic_encoded(commits: tuple[Commit, ...]) -> bytes:
+    return _adapter.dump_json(tuple(map(EncodableCommit.of, commits)))
+
+
+def _pydantic_decoded(encoded: bytes) -> tuple[Commit, ...]:
+    return tuple(commit.entity() for commit in _adapter.validate_json(encoded))
+
+
+def _seconds(func: Callable[..., object], *args: object) -> float:
+    started_at = perf_counter()
+
+    for _ in range(_repeat_count):
+        func(*args)
+
+    return (perf_counter() - started_at) / _repeat_count
+
+
+def _print(
+    name: str,
+    encoded: bytes,
+    encode_seconds: float,
+    decode_seconds: float,
+) -> None:
+    print(
+        f"{name:<8} {len(encoded):>11}"
+        f" {encode_seconds * 1000:>10.1f} {decode_seconds * 1000:>10.1f}",
+    )
+
+
+def main() -> None:
+    commits = _commits()
+    plain_commits = tuple(it for it in commits if isinstance(it, Commit))
+
+    print(_header)
+
+    pydantic_encoded = _pydantic_encoded(plain_commits)
+    _print(
+        "pydantic",
+        pydantic_encoded,
+        _seconds(_pydantic_encoded, plain_commits),
+        _seconds(_pydantic_decoded, pydantic_encoded),
+    )
+
+    binary_encoded = encoded_commits(commits)
+    _print(
+        "binary",
+        binary_encoded,
+        _seconds(encoded_commits, commits),
+        _seconds(decoded_commits, binary_encoded),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -5,3 +5,6 @@ from collections.abc import AsyncIterable, Sequence
 class Buffer[ValueT](ABC, AsyncIterable[Sequence[ValueT]]):
     @abstractmethod
     async def add(self, value: ValueT, /) -> None: ...
+
+    @abstractmethod
+    async def release(self, values: Sequence[ValueT], /) -> None: ...
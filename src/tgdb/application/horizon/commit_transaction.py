@@ -1,5 +1,5 @@
 from asyncio import gather
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 
 from tgdb.application.common.operator import (
@@ -14,8 +14,10 @@ from tgdb.application.common.ports.uuids import UUIDs
 from tgdb.application.horizon.ports.channel import Channel
 from tgdb.application.horizon.ports.shared_horizon import SharedHorizon
 from tgdb.application.relation.ports.relations import Relations
+from tgdb.application.relation.ports.tuples import Tuples
 from tgdb.entities.horizon.claim import Claim
 from tgdb.entities.horizon.transaction import XID, Commit, PreparedCommit
+from tgdb.entities.relation.tuple import TID, Tuple
 from tgdb.entities.relation.tuple_effect import (
     DeletedTuple,
     MutatedTuple,
@@ -32,6 +34,7 @@ class CommitTransaction:
     shared_horizon: SharedHorizon
     clock: Clock
     relations: Relations
+    tuples: Tuples
     channel: Channel
     commit_buffer: Buffer[Commit | PreparedCommit]
 
@@ -41,14 +44,19 @@ class CommitTransaction:
         :raises tgdb.entities.relation.tuple_effect.InvalidRelationTupleError:
         :raises tgdb.entities.horizon.horizon.NoTransactionError:
         :raises tgdb.entities.horizon.horizon.TransactionCommittingError:
+        :raises tgdb.entities.horizon.horizon.ReadOnlyTransactionError:
         :raises tgdb.entities.horizon.transaction.ConflictError:
         """
 
         effects = await gather(*map(self._effect, operators))
+        pre_images = await self._pre_images(xid, effects)
         time = await self.clock
 
-        async with self.shared_horizon as horizon:
-            commit = horizon.commit_transaction(time, xid, effects)
+        async with self.shared_horizon(xid) as horizon:
+            commit = horizon.commit_transaction(time, xid, effects, pre_images)
+
+        if isinstance(commit, Commit) and not commit.effect:
+            return
 
         notification, _ = await gather(
             self.channel.wait(commit.xid),
@@ -57,6 +65,30 @@ class CommitTransaction:
         if notification is not None:
             raise notification from notification
 
+    async def _pre_images(
+        self,
+        xid: XID,
+        effects: Sequence[NewTuple | MutatedTuple | DeletedTuple | Claim],
+    ) -> Mapping[TID, Tuple | None] | None:
+        tids = tuple(
+            effect.tid
+            for effect in effects
+            if isinstance(effect, MutatedTuple | DeletedTuple)
+        )
+
+        if not tids:
+            return None
+
+        async with self.shared_horizon(xid) as horizon:
+            is_versioning_tuples = horizon.is_versioning_tuples()
+
+        if not is_versioning_tuples:
+            return None
+
+        tuples = await self.tuples.tuples_with_tids(tids)
+
+        return dict.fromkeys(tids) | {tuple_.tid: tuple_ for tuple_ in tuples}
+
     async def _effect(
         self,
         operator: Operator,
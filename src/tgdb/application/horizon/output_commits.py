@@ -1,9 +1,11 @@
+from asyncio import gather
 from collections.abc import Sequence
 from dataclasses import dataclass
 
 from tgdb.application.common.ports.buffer import Buffer
 from tgdb.application.common.ports.clock import Clock
 from tgdb.application.common.ports.queque import Queque
+from tgdb.application.horizon.ports.applied_commits import AppliedCommits
 from tgdb.application.horizon.ports.channel import Channel
 from tgdb.application.horizon.ports.shared_horizon import SharedHorizon
 from tgdb.entities.horizon.horizon import (
@@ -18,28 +20,35 @@ class OutputCommits:
     commit_buffer: Buffer[Commit | PreparedCommit]
     channel: Channel
     output_commits: Queque[Sequence[Commit | PreparedCommit]]
+    applied_commits: AppliedCommits
     shared_horizon: SharedHorizon
     clock: Clock
 
     async def __call__(self) -> None:
+        await gather(self._output(), self._notify())
+
+    async def _output(self) -> None:
         async for commits in self.commit_buffer:
             await self.output_commits.push(commits)
-            await self.output_commits.sync()
 
-            async with self.shared_horizon as horizon:
-                for commit in commits:
-                    if isinstance(commit, Commit):
-                        await self.channel.publish(commit.xid, None)
-                        continue
+    async def _notify(self) -> None:
+        async for commits in self.applied_commits:
+            for commit in commits:
+                if isinstance(commit, Commit):
+                    await self.channel.publish(commit.xid, None)
+                    continue
 
-                    time = await self.clock
+                time = await self.clock
 
-                    try:
+                try:
+                    async with self.shared_horizon(commit.xid) as horizon:
                         horizon.complete_commit(time, commit.xid)
-                    except (
-                        NoTransactionError,
-                        TransactionNotCommittingError,
-                    ) as error:
-                        await self.channel.publish(commit.xid, error)
-                    else:
-                        await self.channel.publish(commit.xid, None)
+                except (
+                    NoTransactionError,
+                    TransactionNotCommittingError,
+                ) as error:
+                    await self.channel.publish(commit.xid, error)
+                else:
+                    await self.channel.publish(commit.xid, None)
+
+            await self.commit_buffer.release(commits)
@@ -2,6 +2,7 @@ from collections.abc import Sequence
 from dataclasses import dataclass
 
 from tgdb.application.common.ports.queque import Queque
+from tgdb.application.horizon.ports.applied_commits import AppliedCommits
 from tgdb.application.relation.ports.tuples import Tuples
 from tgdb.entities.horizon.transaction import Commit, PreparedCommit
 
@@ -10,6 +11,7 @@ from tgdb.entities.horizon.transaction import Commit, PreparedCommit
 class OutputCommitsToTuples:
     tuples: Tuples
     output_commits: Queque[Sequence[Commit | PreparedCommit]]
+    applied_commits: AppliedCommits
 
     async def __call__(self) -> None:
         is_previous_map_partial = True
@@ -22,3 +24,5 @@ class OutputCommitsToTuples:
                 is_previous_map_partial = False
             else:
                 await self.tuples.map(effects)
+
+            await self.applied_commits.push(output_commits)
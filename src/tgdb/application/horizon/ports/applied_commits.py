@@ -0,0 +1,11 @@
+from collections.abc import Sequence
+from typing import NewType
+
+from tgdb.application.common.ports.queque import Queque
+from tgdb.entities.horizon.transaction import Commit, PreparedCommit
+
+
+AppliedCommits = NewType(
+    "AppliedCommits",
+    Queque[Sequence[Commit | PreparedCommit]],
+)
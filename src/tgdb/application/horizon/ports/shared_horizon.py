@@ -1,7 +1,14 @@
-from abc import ABC
+from abc import ABC, abstractmethod
 from contextlib import AbstractAsyncContextManager
 
 from tgdb.entities.horizon.horizon import Horizon
+from tgdb.entities.horizon.transaction import XID
 
 
-class SharedHorizon(AbstractAsyncContextManager[Horizon], ABC): ...
+class SharedHorizon(ABC):
+    @abstractmethod
+    def __call__(
+        self,
+        xid: XID,
+        /,
+    ) -> AbstractAsyncContextManager[Horizon]: ...
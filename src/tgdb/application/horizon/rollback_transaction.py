@@ -20,5 +20,5 @@ class RollbackTransaction:
 
         time = await self.clock
 
-        async with self.shared_horizon as horizon:
+        async with self.shared_horizon(xid) as horizon:
             horizon.rollback_transaction(time, xid)
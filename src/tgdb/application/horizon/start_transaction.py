@@ -15,9 +15,19 @@ class StartTransaction:
     shared_horizon: SharedHorizon
     clock: Clock
 
-    async def __call__(self, isolation_level: IsolationLevel) -> XID:
+    async def __call__(
+        self,
+        isolation_level: IsolationLevel,
+        *,
+        is_read_only: bool = False,
+    ) -> XID:
         time = await self.clock
         xid = await self.uuids.random_uuid()
 
-        async with self.shared_horizon as horizon:
-            return horizon.start_transaction(time, xid, isolation_level)
+        async with self.shared_horizon(xid) as horizon:
+            return horizon.start_transaction(
+                time,
+                xid,
+                isolation_level,
+                is_read_only=is_read_only,
+            )
@@ -26,3 +26,4 @@ class CreateRelation:
         await self.tuples.assert_can_accept_tuples(new_relation)
 
         await self.relations.add(new_relation)
+        await self.tuples.track_relation(new_relation)
@@ -1,12 +1,14 @@
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
 from dataclasses import dataclass
+from enum import StrEnum
 
 from tgdb.entities.horizon.transaction import TransactionEffect
 from tgdb.entities.numeration.number import Number
+from tgdb.entities.relation.predicate import AttributePredicate, Predicate
 from tgdb.entities.relation.relation import Relation
 from tgdb.entities.relation.scalar import Scalar
-from tgdb.entities.relation.tuple import Tuple
+from tgdb.entities.relation.tuple import TID, Tuple
 
 
 @dataclass(frozen=True)
@@ -15,7 +17,42 @@ class OversizedRelationSchemaError(Exception):
     schema_max_size: int
 
 
+class UnindexedPredicateError(Exception): ...
+
+
+class TupleAccess(StrEnum):
+    memory = "memory"
+    cache = "cache"
+    index_lookup = "indexLookup"
+    search = "search"
+    scan = "scan"
+
+
+@dataclass(frozen=True)
+class TuplePlan:
+    access: TupleAccess
+    access_predicates: tuple[AttributePredicate, ...]
+    filter_predicates: tuple[AttributePredicate, ...]
+    page_count: int | None
+
+
+type TupleCursor = int
+
+
+@dataclass(frozen=True)
+class TupleChunk:
+    tuples: Sequence[Tuple]
+    cursor: TupleCursor
+
+
 class Tuples(ABC):
+    @abstractmethod
+    async def tuples_with_tids(
+        self,
+        tids: Sequence[TID],
+        /,
+    ) -> Sequence[Tuple]: ...
+
     @abstractmethod
     async def tuples_with_attribute(
         self,
@@ -25,6 +62,37 @@ class Tuples(ABC):
         /,
     ) -> Sequence[Tuple]: ...
 
+    @abstractmethod
+    async def tuples_with_predicate(
+        self,
+        relation_number: Number,
+        predicate: Predicate,
+        /,
+    ) -> Sequence[Tuple]:
+        """
+        :raises tgdb.application.relation.ports.tuples.UnindexedPredicateError:
+        """
+
+    @abstractmethod
+    def tuple_chunks(
+        self,
+        relation_number: Number,
+        predicate: Predicate,
+        cursor: TupleCursor | None,
+        /,
+    ) -> AsyncIterator[TupleChunk]:
+        """
+        :raises tgdb.application.relation.ports.tuples.UnindexedPredicateError:
+        """
+
+    @abstractmethod
+    async def plan(
+        self,
+        relation_number: Number,
+        predicate: Predicate,
+        /,
+    ) -> TuplePlan: ...
+
     @abstractmethod
     async def map(self, effects: Sequence[TransactionEffect], /) -> None: ...
 
@@ -35,6 +103,9 @@ class Tuples(ABC):
         /,
     ) -> None: ...
 
+    @abstractmethod
+    async def track_relation(self, relation: Relation) -> None: ...
+
     @abstractmethod
     async def assert_can_accept_tuples(self, relation: Relation) -> None:
         """
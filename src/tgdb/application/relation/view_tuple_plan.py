@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+
+from tgdb.application.relation.ports.relations import Relations
+from tgdb.application.relation.ports.tuples import TuplePlan, Tuples
+from tgdb.entities.numeration.number import Number
+from tgdb.entities.relation.predicate import Predicate
+
+
+@dataclass(frozen=True)
+class ViewTuplePlan:
+    tuples: Tuples
+    relations: Relations
+
+    async def __call__(
+        self,
+        relation_number: Number,
+        predicate: Predicate,
+    ) -> TuplePlan:
+        """
+        :raises tgdb.application.relation.ports.relations.NoRelationError:
+        """
+
+        await self.relations.relation(relation_number)
+
+        return await self.tuples.plan(relation_number, predicate)
@@ -0,0 +1,100 @@
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+
+from tgdb.application.common.ports.clock import Clock
+from tgdb.application.horizon.ports.shared_horizon import SharedHorizon
+from tgdb.application.relation.ports.relations import Relations
+from tgdb.application.relation.ports.tuples import (
+    TupleChunk,
+    TupleCursor,
+    Tuples,
+)
+from tgdb.entities.horizon.transaction import XID
+from tgdb.entities.numeration.number import Number
+from tgdb.entities.relation.predicate import Predicate
+from tgdb.entities.relation.relation import Relation
+from tgdb.entities.relation.tuple_effect import viewed_tuple
+from tgdb.entities.relation.versioned_tuple import versioned_tuple
+
+
+@dataclass(frozen=True)
+class ViewTupleStream:
+    shared_horizon: SharedHorizon
+    clock: Clock
+    tuples: Tuples
+    relations: Relations
+
+    async def __call__(
+        self,
+        xid: XID | None,
+        relation_number: Number,
+        predicate: Predicate,
+        cursor: TupleCursor | None,
+    ) -> AsyncIterator[TupleChunk]:
+        """
+        :raises tgdb.application.relation.ports.relations.NoRelationError:
+        :raises tgdb.application.relation.ports.tuples.UnindexedPredicateError:
+        :raises tgdb.entities.horizon.horizon.NoTransactionError:
+        :raises tgdb.entities.horizon.horizon.TransactionCommittingError:
+        :raises tgdb.entities.horizon.transaction.SnapshotTooOldError:
+        """
+
+        relation = await self.relations.relation(relation_number)
+
+        if xid is not None:
+            async with self.shared_horizon(xid) as horizon:
+                time = await self.clock
+                horizon.assert_active_transaction(time, xid)
+
+        chunks = self._chunks(xid, relation, predicate, cursor)
+        first_chunk = await anext(chunks, None)
+
+        return self._primed_chunks(first_chunk, chunks)
+
+    async def _primed_chunks(
+        self,
+        first_chunk: TupleChunk | None,
+        chunks: AsyncIterator[TupleChunk],
+    ) -> AsyncIterator[TupleChunk]:
+        if first_chunk is None:
+            return
+
+        yield first_chunk
+
+        async for chunk in chunks:
+            yield chunk
+
+    async def _chunks(
+        self,
+        xid: XID | None,
+        relation: Relation,
+        predicate: Predicate,
+        cursor: TupleCursor | None,
+    ) -> AsyncIterator[TupleChunk]:
+        chunks = self.tuples.tuple_chunks(relation.number(), predicate, cursor)
+
+        async for chunk in chunks:
+            if xid is None:
+                yield chunk
+                continue
+
+            async with self.shared_horizon(xid) as horizon:
+                time = await self.clock
+                visible_tuples = horizon.visible_tuples(
+                    time,
+                    xid,
+                    relation.number(),
+                    predicate,
+                    chunk.tuples,
+                    is_exhaustive=False,
+                )
+
+                if horizon.is_tracking_views(xid):
+                    effects = tuple(
+                        viewed_tuple(versioned_tuple(tuple_), relation)
+                        for tuple_ in visible_tuples
+                    )
+                    time = await self.clock
+                    horizon.include_many(time, xid, effects)
+
+            yield TupleChunk(visible_tuples, chunk.cursor)
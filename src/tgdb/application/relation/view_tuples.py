@@ -4,15 +4,21 @@ from dataclasses import dataclass
 from tgdb.application.common.ports.clock import Clock
 from tgdb.application.horizon.ports.shared_horizon import SharedHorizon
 from tgdb.application.relation.ports.relations import Relations
-from tgdb.application.relation.ports.tuples import Tuples
+from tgdb.application.relation.ports.tuples import TupleCursor, Tuples
 from tgdb.entities.horizon.transaction import XID
 from tgdb.entities.numeration.number import Number
-from tgdb.entities.relation.scalar import Scalar
+from tgdb.entities.relation.predicate import Predicate
 from tgdb.entities.relation.tuple import Tuple
 from tgdb.entities.relation.tuple_effect import viewed_tuple
 from tgdb.entities.relation.versioned_tuple import versioned_tuple
 
 
+@dataclass(frozen=True)
+class ViewedTuples:
+    tuples: Sequence[Tuple]
+    next_cursor: TupleCursor | None
+
+
 @dataclass(frozen=True)
 class ViewTuples:
     shared_horizon: SharedHorizon
@@ -24,32 +30,73 @@ class ViewTuples:
         self,
         xid: XID | None,
         relation_number: Number,
-        attribute_number: Number,
-        attribute_scalar: Scalar,
-    ) -> Sequence[Tuple]:
+        predicate: Predicate,
+        cursor: TupleCursor | None = None,
+        limit: int | None = None,
+    ) -> ViewedTuples:
         """
         :raises tgdb.application.relation.ports.relations.NoRelationError:
         :raises tgdb.entities.horizon.horizon.NoTransactionError:
         :raises tgdb.entities.horizon.horizon.TransactionCommittingError:
+        :raises tgdb.entities.horizon.transaction.SnapshotTooOldError:
         """
 
-        tuples = await self.tuples.tuples_with_attribute(
-            relation_number,
-            attribute_number,
-            attribute_scalar,
-        )
-        versioned_tuples = map(versioned_tuple, tuples)
+        if cursor is None and limit is None:
+            tuples = await self.tuples.tuples_with_predicate(
+                relation_number,
+                predicate,
+            )
+            viewed_tuples = ViewedTuples(tuples, None)
+        else:
+            viewed_tuples = await self._viewed_tuple_chunks(
+                relation_number,
+                predicate,
+                cursor,
+                limit,
+            )
+
         relation = await self.relartions.relation(relation_number)
 
-        viewed_tuples = (
-            viewed_tuple(versioned_tuple, relation)
-            for versioned_tuple in versioned_tuples
-        )
+        if xid is None:
+            return viewed_tuples
+
+        async with self.shared_horizon(xid) as horizon:
+            time = await self.clock
+            visible_tuples = horizon.visible_tuples(
+                time,
+                xid,
+                relation_number,
+                predicate,
+                viewed_tuples.tuples,
+                is_exhaustive=cursor is None and limit is None,
+            )
+
+            if not horizon.is_tracking_views(xid):
+                return ViewedTuples(visible_tuples, viewed_tuples.next_cursor)
+
+            effects = tuple(
+                viewed_tuple(versioned_tuple(tuple_), relation)
+                for tuple_ in visible_tuples
+            )
+            time = await self.clock
+            horizon.include_many(time, xid, effects)
+
+        return ViewedTuples(visible_tuples, viewed_tuples.next_cursor)
+
+    async def _viewed_tuple_chunks(
+        self,
+        relation_number: Number,
+        predicate: Predicate,
+        cursor: TupleCursor | None,
+        limit: int | None,
+    ) -> ViewedTuples:
+        tuples = list[Tuple]()
+        chunks = self.tuples.tuple_chunks(relation_number, predicate, cursor)
+
+        async for chunk in chunks:
+            tuples.extend(chunk.tuples)
 
-        if xid is not None:
-            async with self.shared_horizon as horizon:
-                for viewed_tuple_ in viewed_tuples:
-                    time = await self.clock
-                    horizon.include(time, xid, viewed_tuple_)
+            if limit is not None and len(tuples) >= limit:
+                return ViewedTuples(tuples, chunk.cursor)
 
-        return tuples
+        return ViewedTuples(tuples, None)
@@ -0,0 +1,638 @@
+from collections import deque
+from collections.abc import Mapping, Sequence
+from collections.abc import Set as AbstractSet
+from dataclasses import dataclass, field
+
+from tgdb.entities.horizon.claim import Claim
+from tgdb.entities.horizon.transaction import (
+    XID,
+    ConflictError,
+    SnapshotTooOldError,
+    TransactionEffect,
+    TransactionScalarEffect,
+)
+from tgdb.entities.numeration.number import Number
+from tgdb.entities.relation.predicate import Predicate
+from tgdb.entities.relation.tuple import TID, Tuple
+from tgdb.entities.relation.tuple_effect import (
+    DeletedTuple,
+    MutatedTuple,
+    NewTuple,
+)
+from tgdb.entities.time.logic_time import LogicTime
+
+
+type HorizonSequenceNumber = int
+type Footprint = Claim | TID
+
+
+@dataclass(eq=False, unsafe_hash=False)
+class _TupleVersion:
+    effect: TransactionScalarEffect
+    sequence_number: HorizonSequenceNumber
+    completion_sequence_number: HorizonSequenceNumber | None = None
+
+    def is_visible(self, sequence_number: HorizonSequenceNumber) -> bool:
+        return (
+            self.completion_sequence_number is not None
+            and self.completion_sequence_number <= sequence_number
+        )
+
+    def is_visible_to_all(
+        self,
+        oldest_start_sequence_number: HorizonSequenceNumber,
+    ) -> bool:
+        return (
+            self.completion_sequence_number is not None
+            and self.completion_sequence_number < oldest_start_sequence_number
+            and self.sequence_number < oldest_start_sequence_number
+        )
+
+
+@dataclass(unsafe_hash=False)
+class _PreparedTransaction:
+    footprint: frozenset[Footprint]
+    versions: tuple[_TupleVersion, ...]
+    completion_sequence_number: HorizonSequenceNumber | None = None
+
+
+@dataclass(unsafe_hash=False)
+class HorizonCoordinator:
+    _sequence_number: HorizonSequenceNumber = field(init=False, default=0)
+    _start_sequence_number_by_xid: dict[XID, HorizonSequenceNumber] = field(
+        init=False,
+        default_factory=dict,
+    )
+    _start_time_by_xid: dict[XID, LogicTime] = field(
+        init=False,
+        default_factory=dict,
+    )
+    _prepared_transaction_by_xid: dict[XID, _PreparedTransaction] = field(
+        init=False,
+        default_factory=dict,
+    )
+    _prepared_xids_by_footprint: dict[Footprint, set[XID]] = field(
+        init=False,
+        default_factory=dict,
+    )
+    _completed_xids: deque[tuple[HorizonSequenceNumber, XID]] = field(
+        init=False,
+        default_factory=deque,
+    )
+    _versions_by_tid: dict[TID, list[_TupleVersion]] = field(
+        init=False,
+        default_factory=dict,
+    )
+    _completed_versions: deque[tuple[HorizonSequenceNumber, TID]] = field(
+        init=False,
+        default_factory=deque,
+    )
+    _relation_number_by_tid: dict[TID, int | None] = field(
+        init=False,
+        default_factory=dict,
+    )
+    _tid_map_by_relation_number: dict[int | None, dict[TID, None]] = field(
+        init=False,
+        default_factory=dict,
+    )
+    _forgetting_sequence_number_by_tid: dict[TID, HorizonSequenceNumber] = (
+        field(init=False, default_factory=dict)
+    )
+    _forgotten_tids: deque[tuple[HorizonSequenceNumber, TID]] = field(
+        init=False,
+        default_factory=deque,
+    )
+    _versioned_xids: set[XID] = field(init=False, default_factory=set)
+
+    def start(
+        self,
+        xid: XID,
+        time: LogicTime,
+        *,
+        is_versioned: bool = False,
+    ) -> None:
+        self._sequence_number += 1
+        self._start_sequence_number_by_xid[xid] = self._sequence_number
+        self._start_time_by_xid[xid] = time
+
+        if is_versioned:
+            self._versioned_xids.add(xid)
+
+    def has_versioned_transactions(self) -> bool:
+        return bool(self._versioned_xids)
+
+    def forget_expired_transactions(
+        self,
+        time: LogicTime,
+        max_transaction_age: LogicTime,
+    ) -> None:
+        expired_xids = list[XID]()
+
+        for xid, start_time in self._start_time_by_xid.items():
+            if time - start_time <= max_transaction_age:
+                break
+
+            if xid not in self._prepared_transaction_by_xid:
+                expired_xids.append(xid)
+
+        if not expired_xids:
+            return
+
+        for xid in expired_xids:
+            del self._start_sequence_number_by_xid[xid]
+            del self._start_time_by_xid[xid]
+            self._versioned_xids.discard(xid)
+
+        self._forget_invisible_completed_transactions()
+        self._forget_invisible_versions()
+
+    def prepare(  # noqa: PLR0913
+        self,
+        xid: XID,
+        claims: AbstractSet[Claim],
+        space: AbstractSet[TID],
+        effect: TransactionEffect,
+        *,
+        is_conflict_checked: bool = True,
+        pre_images: Mapping[TID, Tuple | None] | None = None,
+    ) -> None:
+        """
+        :raises tgdb.entities.horizon.transaction.ConflictError:
+        """
+
+        footprint = frozenset[Footprint]((*claims, *space))
+
+        if is_conflict_checked:
+            self.validate(xid, claims, space)
+
+        self._sequence_number += 1
+        versions = tuple(
+            _TupleVersion(scalar_effect, self._sequence_number)
+            for scalar_effect in effect
+        )
+
+        if pre_images is not None:
+            self._remember_pre_images(xid, versions, pre_images)
+
+        for version in versions:
+            self._versions_by_tid.setdefault(version.effect.tid, []).append(
+                version,
+            )
+            self._index_versions(version.effect.tid)
+
+        self._prepared_transaction_by_xid[xid] = _PreparedTransaction(
+            footprint,
+            versions,
+        )
+
+        for footprint_item in footprint:
+            xids = self._prepared_xids_by_footprint.setdefault(
+                footprint_item,
+                set(),
+            )
+            xids.add(xid)
+
+    def validate(
+        self,
+        xid: XID,
+        claims: AbstractSet[Claim],
+        space: AbstractSet[TID],
+    ) -> None:
+        """
+        :raises tgdb.entities.horizon.transaction.ConflictError:
+        """
+
+        start_sequence_number = self._start_sequence_number_by_xid[xid]
+        conflict_claims = frozenset(
+            claim
+            for claim in claims
+            if self._is_conflict(start_sequence_number, claim)
+        )
+        has_space_conflict = any(
+            self._is_conflict(start_sequence_number, tid) for tid in space
+        )
+
+        if conflict_claims or has_space_conflict:
+            raise ConflictError(xid, rejected_claims=conflict_claims)
+
+    def complete(self, xid: XID) -> None:
+        prepared_transaction = self._prepared_transaction_by_xid.get(xid)
+
+        if prepared_transaction is not None:
+            self._sequence_number += 1
+            prepared_transaction.completion_sequence_number = (
+                self._sequence_number
+            )
+            self._completed_xids.append((self._sequence_number, xid))
+
+            for version in prepared_transaction.versions:
+                version.completion_sequence_number = self._sequence_number
+                self._completed_versions.append(
+                    (self._sequence_number, version.effect.tid),
+                )
+
+        self._end(xid)
+
+    def rollback(self, xid: XID) -> None:
+        prepared_transaction = self._prepared_transaction_by_xid.get(xid)
+
+        if prepared_transaction is not None:
+            self._forget_versions(prepared_transaction.versions)
+
+        self._forget_prepared_transaction(xid)
+        self._end(xid)
+
+    def snapshot_tuples(
+        self,
+        xid: XID,
+        relation_number: Number,
+        predicate: Predicate,
+        tuples: Sequence[Tuple],
+        *,
+        is_exhaustive: bool,
+    ) -> Sequence[Tuple]:
+        """
+        :raises tgdb.entities.horizon.transaction.SnapshotTooOldError:
+        """
+
+        return self._visible_tuples(
+            xid,
+            self._start_sequence_number_by_xid[xid],
+            relation_number,
+            predicate,
+            tuples,
+            is_exhaustive=is_exhaustive,
+            is_snapshot=True,
+        )
+
+    def committed_tuples(
+        self,
+        xid: XID,
+        relation_number: Number,
+        predicate: Predicate,
+        tuples: Sequence[Tuple],
+        *,
+        is_exhaustive: bool,
+    ) -> Sequence[Tuple]:
+        return self._visible_tuples(
+            xid,
+            self._sequence_number,
+            relation_number,
+            predicate,
+            tuples,
+            is_exhaustive=is_exhaustive,
+            is_snapshot=False,
+        )
+
+    def _visible_tuples(  # noqa: PLR0913
+        self,
+        xid: XID,
+        sequence_number: HorizonSequenceNumber,
+        relation_number: Number,
+        predicate: Predicate,
+        tuples: Sequence[Tuple],
+        *,
+        is_exhaustive: bool,
+        is_snapshot: bool,
+    ) -> Sequence[Tuple]:
+        """
+        :raises tgdb.entities.horizon.transaction.SnapshotTooOldError:
+        """
+
+        visible_tuples = list[Tuple]()
+
+        for tuple_ in tuples:
+            versions = self._versions_by_tid.get(tuple_.tid)
+            effect = (
+                None
+                if versions is None
+                else self._visible_effect(versions, sequence_number)
+            )
+
+            if versions is not None and effect is None and is_snapshot:
+                raise SnapshotTooOldError(xid)
+
+            if effect is None:
+                visible_tuples.append(tuple_)
+                continue
+
+            visible_tuple = self._visible_tuple(
+                effect,
+                relation_number,
+                predicate,
+            )
+
+            if visible_tuple is not None:
+                visible_tuples.append(visible_tuple)
+
+        if is_exhaustive:
+            visible_tuples.extend(
+                self._unviewed_visible_tuples(
+                    xid,
+                    sequence_number,
+                    relation_number,
+                    predicate,
+                    frozenset(tuple_.tid for tuple_ in tuples),
+                    is_snapshot=is_snapshot,
+                ),
+            )
+
+        return visible_tuples
+
+    def _unviewed_visible_tuples(  # noqa: PLR0913
+        self,
+        xid: XID,
+        sequence_number: HorizonSequenceNumber,
+        relation_number: Number,
+        predicate: Predicate,
+        viewed_tids: AbstractSet[TID],
+        *,
+        is_snapshot: bool,
+    ) -> list[Tuple]:
+        """
+        :raises tgdb.entities.horizon.transaction.SnapshotTooOldError:
+        """
+
+        visible_tuples = list[Tuple]()
+        tids = (
+            *self._tid_map_by_relation_number.get(int(relation_number), ()),
+            *self._tid_map_by_relation_number.get(None, ()),
+        )
+
+        for tid in tids:
+            if tid in viewed_tids:
+                continue
+
+            versions = self._versions_by_tid[tid]
+            effect = self._visible_effect(versions, sequence_number)
+
+            if (
+                effect is None
+                and is_snapshot
+                and self._may_match(versions, predicate)
+            ):
+                raise SnapshotTooOldError(xid)
+
+            if effect is None:
+                continue
+
+            visible_tuple = self._visible_tuple(
+                effect,
+                relation_number,
+                predicate,
+            )
+
+            if visible_tuple is not None:
+                visible_tuples.append(visible_tuple)
+
+        return visible_tuples
+
+    def _visible_effect(
+        self,
+        versions: Sequence[_TupleVersion],
+        sequence_number: HorizonSequenceNumber,
+    ) -> TransactionScalarEffect | None:
+        for version in reversed(versions):
+            if version.is_visible(sequence_number):
+                return version.effect
+
+        first_effect = versions[0].effect
+
+        if isinstance(first_effect, NewTuple):
+            return DeletedTuple(first_effect.tid)
+
+        return None
+
+    def _may_match(
+        self,
+        versions: Sequence[_TupleVersion],
+        predicate: Predicate,
+    ) -> bool:
+        tuples = tuple(
+            version.effect.tuple
+            for version in versions
+            if not isinstance(version.effect, DeletedTuple)
+        )
+
+        return not tuples or any(map(predicate.matches, tuples))
+
+    def _visible_tuple(
+        self,
+        effect: TransactionScalarEffect,
+        relation_number: Number,
+        predicate: Predicate,
+    ) -> Tuple | None:
+        if isinstance(effect, DeletedTuple):
+            return None
+
+        tuple_ = effect.tuple
+
+        if tuple_.relation_schema_id.relation_number != relation_number:
+            return None
+
+        if not predicate.matches(tuple_):
+            return None
+
+        return tuple_
+
+    def _remember_pre_images(
+        self,
+        xid: XID,
+        versions: Sequence[_TupleVersion],
+        pre_images: Mapping[TID, Tuple | None],
+    ) -> None:
+        start_sequence_number = self._start_sequence_number_by_xid[xid]
+
+        for version in versions:
+            tid = version.effect.tid
+            forgetting_sequence_number = (
+                self._forgetting_sequence_number_by_tid.get(tid)
+            )
+
+            if (
+                isinstance(version.effect, NewTuple)
+                or tid not in pre_images
+                or tid in self._versions_by_tid
+                or (
+                    forgetting_sequence_number is not None
+                    and forgetting_sequence_number >= start_sequence_number
+                )
+            ):
+                continue
+
+            pre_image = pre_images[tid]
+            pre_image_effect = (
+                DeletedTuple(tid)
+                if pre_image is None
+                else MutatedTuple(pre_image)
+            )
+            self._versions_by_tid[tid] = [
+                _TupleVersion(pre_image_effect, self._sequence_number, 0),
+            ]
+            self._completed_versions.append((self._sequence_number, tid))
+
+    def _index_versions(self, tid: TID) -> None:
+        self._unindex_versions(tid)
+        versions = self._versions_by_tid.get(tid)
+
+        if versions is None:
+            return
+
+        relation_number = next(
+            (
+                int(version.effect.tuple.relation_schema_id.relation_number)
+                for version in versions
+                if not isinstance(version.effect, DeletedTuple)
+            ),
+            None,
+        )
+        self._relation_number_by_tid[tid] = relation_number
+        tid_map = self._tid_map_by_relation_number.setdefault(
+            relation_number,
+            dict(),
+        )
+        tid_map[tid] = None
+
+    def _unindex_versions(self, tid: TID) -> None:
+        if tid not in self._relation_number_by_tid:
+            return
+
+        relation_number = self._relation_number_by_tid.pop(tid)
+        tid_map = self._tid_map_by_relation_number[relation_number]
+        del tid_map[tid]
+
+        if not tid_map:
+            del self._tid_map_by_relation_number[relation_number]
+
+    def _end(self, xid: XID) -> None:
+        self._start_sequence_number_by_xid.pop(xid, None)
+        self._start_time_by_xid.pop(xid, None)
+        self._versioned_xids.discard(xid)
+        self._forget_invisible_completed_transactions()
+        self._forget_invisible_versions()
+
+    def _is_conflict(
+        self,
+        start_sequence_number: HorizonSequenceNumber,
+        footprint_item: Footprint,
+    ) -> bool:
+        xids = self._prepared_xids_by_footprint.get(footprint_item, ())
+
+        for xid in xids:
+            prepared_transaction = self._prepared_transaction_by_xid[xid]
+            completion_sequence_number = (
+                prepared_transaction.completion_sequence_number
+            )
+
+            if (
+                completion_sequence_number is None
+                or completion_sequence_number > start_sequence_number
+            ):
+                return True
+
+        return False
+
+    def _forget_invisible_completed_transactions(self) -> None:
+        oldest_start_sequence_number = next(
+            iter(self._start_sequence_number_by_xid.values()),
+            None,
+        )
+
+        while self._completed_xids:
+            completion_sequence_number, xid = self._completed_xids[0]
+
+            if (
+                oldest_start_sequence_number is not None
+                and completion_sequence_number > oldest_start_sequence_number
+            ):
+                return
+
+            self._completed_xids.popleft()
+            self._forget_prepared_transaction(xid)
+
+    def _forget_prepared_transaction(self, xid: XID) -> None:
+        prepared_transaction = self._prepared_transaction_by_xid.pop(xid, None)
+
+        if prepared_transaction is None:
+            return
+
+        for footprint_item in prepared_transaction.footprint:
+            xids = self._prepared_xids_by_footprint[footprint_item]
+            xids.discard(xid)
+
+            if not xids:
+                del self._prepared_xids_by_footprint[footprint_item]
+
+    def _forget_invisible_versions(self) -> None:
+        oldest_start_sequence_number = next(
+            iter(self._start_sequence_number_by_xid.values()),
+            self._sequence_number + 1,
+        )
+        self._forget_invisible_forgetting(oldest_start_sequence_number)
+
+        while self._completed_versions:
+            completion_sequence_number, tid = self._completed_versions[0]
+
+            if completion_sequence_number >= oldest_start_sequence_number:
+                return
+
+            self._completed_versions.popleft()
+            self._forget_superseded_versions(tid, oldest_start_sequence_number)
+
+    def _forget_invisible_forgetting(
+        self,
+        oldest_start_sequence_number: HorizonSequenceNumber,
+    ) -> None:
+        while self._forgotten_tids:
+            forgetting_sequence_number, tid = self._forgotten_tids[0]
+
+            if forgetting_sequence_number >= oldest_start_sequence_number:
+                return
+
+            self._forgotten_tids.popleft()
+
+            if (
+                self._forgetting_sequence_number_by_tid.get(tid)
+                == forgetting_sequence_number
+            ):
+                del self._forgetting_sequence_number_by_tid[tid]
+
+    def _forget_superseded_versions(
+        self,
+        tid: TID,
+        oldest_start_sequence_number: HorizonSequenceNumber,
+    ) -> None:
+        versions = self._versions_by_tid.get(tid)
+
+        if versions is None:
+            return
+
+        for index in reversed(range(len(versions))):
+            if versions[index].is_visible_to_all(oldest_start_sequence_number):
+                break
+        else:
+            return
+
+        if index == len(versions) - 1:
+            del self._versions_by_tid[tid]
+            self._forgetting_sequence_number_by_tid[tid] = self._sequence_number
+            self._forgotten_tids.append((self._sequence_number, tid))
+        else:
+            del versions[:index]
+
+        self._index_versions(tid)
+
+    def _forget_versions(self, versions: Sequence[_TupleVersion]) -> None:
+        for version in versions:
+            tid = version.effect.tid
+            tid_versions = self._versions_by_tid.get(tid)
+
+            if tid_versions is None or version not in tid_versions:
+                continue
+
+            tid_versions.remove(version)
+
+            if not tid_versions:
+                del self._versions_by_tid[tid]
+
+            self._index_versions(tid)
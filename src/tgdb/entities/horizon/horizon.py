@@ -2,8 +2,10 @@ from collections import OrderedDict
 from collections.abc import Iterable, Mapping, Sequence
 from contextlib import suppress
 from dataclasses import dataclass
+from math import ceil
 
 from tgdb.entities.horizon.claim import Claim
+from tgdb.entities.horizon.coordinator import HorizonCoordinator
 from tgdb.entities.horizon.transaction import (
     XID,
     Commit,
@@ -13,9 +15,13 @@ from tgdb.entities.horizon.transaction import (
     ReadUncommitedTransaction,
     SerializableTransaction,
     SerializableTransactionState,
+    SnapshotTooOldError,
     Transaction,
     start_transaction,
 )
+from tgdb.entities.numeration.number import Number
+from tgdb.entities.relation.predicate import Predicate
+from tgdb.entities.relation.tuple import TID, Tuple
 from tgdb.entities.relation.tuple_effect import (
     DeletedTuple,
     MutatedTuple,
@@ -39,6 +45,9 @@ class TransactionCommittingError(Exception): ...
 class TransactionNotCommittingError(Exception): ...
 
 
+class ReadOnlyTransactionError(Exception): ...
+
+
 class HorizonAlwaysWithoutTransactionsError(Exception): ...
 
 
@@ -62,6 +71,8 @@ class Horizon:
         XID,
         ReadUncommitedTransaction,
     ]
+    _autorollbackable_transaction_map: OrderedDict[XID, Transaction]
+    _coordinator: HorizonCoordinator
 
     def __post_init__(self) -> None:
         assert_(
@@ -80,12 +91,16 @@ class Horizon:
         time: LogicTime,
         xid: XID,
         isolation: IsolationLevel,
+        *,
+        is_read_only: bool = False,
     ) -> XID:
         """
         :raises tgdb.entities.horizon.horizon.NotMonotonicTimeError:
         :raises tgdb.entities.horizon.horizon.DoubleStartTransactionError:
         """
 
+        self.move_to_future(time)
+
         assert_(
             all(xid not in map_ for map_ in self._transaction_maps()),
             else_=DoubleStartTransactionError,
@@ -93,15 +108,28 @@ class Horizon:
 
         started_transaction = start_transaction(
             xid,
-            self._time,
+            time,
             isolation,
-            self._serializable_transaction_map.values(),
+            is_read_only=is_read_only,
         )
 
         map_ = self._transaction_map(started_transaction)
         map_[started_transaction.xid()] = started_transaction
+        self._autorollbackable_transaction_map[started_transaction.xid()] = (
+            started_transaction
+        )
+
+        if isinstance(started_transaction, SerializableTransaction):
+            self._coordinator.start(
+                started_transaction.xid(),
+                time,
+                is_versioned=(
+                    started_transaction.isolation()
+                    is not IsolationLevel.serializable
+                ),
+            )
+
         self._limit_len()
-        self.move_to_future(time)
 
         return started_transaction.xid()
 
@@ -117,6 +145,20 @@ class Horizon:
         :raises tgdb.entities.horizon.horizon.TransactionCommittingError:
         """
 
+        self.include_many(time, xid, (effect,))
+
+    def include_many(
+        self,
+        time: LogicTime,
+        xid: XID,
+        effects: Iterable[ViewedTuple],
+    ) -> None:
+        """
+        :raises tgdb.entities.horizon.horizon.NotMonotonicTimeError:
+        :raises tgdb.entities.horizon.horizon.NoTransactionError:
+        :raises tgdb.entities.horizon.horizon.TransactionCommittingError:
+        """
+
         self.move_to_future(time)
 
         transaction = self._transaction(
@@ -124,7 +166,89 @@ class Horizon:
             SerializableTransactionState.active,
             else_=TransactionCommittingError,
         )
-        transaction.include(effect)
+
+        for effect in effects:
+            transaction.include(effect)
+
+    def assert_active_transaction(self, time: LogicTime, xid: XID) -> None:
+        """
+        :raises tgdb.entities.horizon.horizon.NotMonotonicTimeError:
+        :raises tgdb.entities.horizon.horizon.NoTransactionError:
+        :raises tgdb.entities.horizon.horizon.TransactionCommittingError:
+        """
+
+        self.move_to_future(time)
+        self._transaction(
+            xid,
+            SerializableTransactionState.active,
+            else_=TransactionCommittingError,
+        )
+
+    def is_tracking_views(self, xid: XID) -> bool:
+        """
+        :raises tgdb.entities.horizon.horizon.NoTransactionError:
+        """
+
+        transaction = self._transaction(xid, else_=NoTransactionError)
+
+        return transaction.is_tracking_views()
+
+    def is_versioning_tuples(self) -> bool:
+        return self._coordinator.has_versioned_transactions()
+
+    def visible_tuples(  # noqa: PLR0913
+        self,
+        time: LogicTime,
+        xid: XID,
+        relation_number: Number,
+        predicate: Predicate,
+        tuples: Sequence[Tuple],
+        *,
+        is_exhaustive: bool,
+    ) -> Sequence[Tuple]:
+        """
+        :raises tgdb.entities.horizon.horizon.NotMonotonicTimeError:
+        :raises tgdb.entities.horizon.horizon.NoTransactionError:
+        :raises tgdb.entities.horizon.horizon.TransactionCommittingError:
+        :raises tgdb.entities.horizon.transaction.SnapshotTooOldError:
+        """
+
+        self.move_to_future(time)
+
+        transaction = self._transaction(
+            xid,
+            SerializableTransactionState.active,
+            else_=TransactionCommittingError,
+        )
+
+        if not isinstance(transaction, SerializableTransaction):
+            return tuples
+
+        try:
+            match transaction.isolation():
+                case IsolationLevel.snapshot:
+                    return self._coordinator.snapshot_tuples(
+                        xid,
+                        relation_number,
+                        predicate,
+                        tuples,
+                        is_exhaustive=is_exhaustive,
+                    )
+                case IsolationLevel.read_committed:
+                    return self._coordinator.committed_tuples(
+                        xid,
+                        relation_number,
+                        predicate,
+                        tuples,
+                        is_exhaustive=is_exhaustive,
+                    )
+                case _:
+                    return tuples
+        except SnapshotTooOldError as error:
+            transaction.rollback()
+            self._forget(transaction)
+            self._rollback_in_coordinator(transaction)
+            raise error from error
 
     def rollback_transaction(self, time: LogicTime, xid: XID) -> None:
         """
@@ -140,18 +264,21 @@ class Horizon:
             else_=TransactionCommittingError,
         )
         transaction.rollback()
-        del self._transaction_map(transaction)[transaction.xid()]
+        self._forget(transaction)
+        self._rollback_in_coordinator(transaction)
 
     def commit_transaction(
         self,
         time: LogicTime,
         xid: XID,
         effects: Sequence[HorizonWriteEffect],
+        pre_images: Mapping[TID, Tuple | None] | None = None,
     ) -> Commit | PreparedCommit:
         """
         :raises tgdb.entities.horizon.horizon.NotMonotonicTimeError:
         :raises tgdb.entities.horizon.horizon.NoTransactionError:
         :raises tgdb.entities.horizon.horizon.TransactionCommittingError:
+        :raises tgdb.entities.horizon.horizon.ReadOnlyTransactionError:
         :raises tgdb.entities.horizon.transaction.ConflictError:
         """
         self.move_to_future(time)
@@ -162,18 +289,36 @@ class Horizon:
             else_=TransactionCommittingError(),
         )
 
+        if transaction.is_read_only():
+            return self._commit_read_only_transaction(transaction, effects)
+
         for effect in effects:
             transaction.include(effect)
 
         try:
             match transaction:
                 case SerializableTransaction():
-                    return transaction.prepare_commit()
+                    prepared_commit = transaction.prepare_commit()
+                    self._coordinator.prepare(
+                        xid,
+                        transaction.claims(),
+                        transaction.space(),
+                        prepared_commit.effect,
+                        is_conflict_checked=(
+                            transaction.isolation()
+                            is not IsolationLevel.read_committed
+                        ),
+                        pre_images=pre_images,
+                    )
+                    del self._autorollbackable_transaction_map[xid]
+                    return prepared_commit
                 case ReadUncommitedTransaction():
-                    del self._transaction_map(transaction)[xid]
+                    self._forget(transaction)
                     return transaction.commit()
         except ConflictError as error:
-            del self._transaction_map(transaction)[xid]
+            transaction.rollback()
+            self._forget(transaction)
+            self._rollback_in_coordinator(transaction)
             raise error from error
 
     def complete_commit(self, time: LogicTime, xid: XID) -> Commit:
@@ -191,7 +336,9 @@ class Horizon:
         )
 
         commit = transaction.commit()
-        del self._serializable_transaction_map[transaction.xid()]
+        self._forget(transaction)
+
+        self._coordinator.complete(transaction.xid())
 
         return commit
 
@@ -204,63 +351,88 @@ class Horizon:
         self._time = time
 
         self._limit_transaction_age()
+        self._coordinator.forget_expired_transactions(
+            time,
+            self._max_transaction_age,
+        )
+
+    def _commit_read_only_transaction(
+        self,
+        transaction: Transaction,
+        effects: Sequence[HorizonWriteEffect],
+    ) -> Commit:
+        """
+        :raises tgdb.entities.horizon.horizon.ReadOnlyTransactionError:
+        :raises tgdb.entities.horizon.transaction.ConflictError:
+        """
+
+        if effects:
+            transaction.rollback()
+            self._forget(transaction)
+            self._rollback_in_coordinator(transaction)
+            raise ReadOnlyTransactionError
+
+        if (
+            isinstance(transaction, SerializableTransaction)
+            and transaction.isolation() is IsolationLevel.serializable
+        ):
+            try:
+                self._coordinator.validate(
+                    transaction.xid(),
+                    transaction.claims(),
+                    transaction.space(),
+                )
+            except ConflictError as error:
+                transaction.rollback()
+                self._forget(transaction)
+                self._rollback_in_coordinator(transaction)
+                raise error from error
+
+        commit = transaction.commit()
+        self._forget(transaction)
+
+        if isinstance(transaction, SerializableTransaction):
+            self._coordinator.complete(transaction.xid())
+
+        return commit
 
     def _limit_transaction_age(self) -> None:
         while True:
-            oldest_transaction = self._oldest_transaction()
+            oldest_transaction = first_map_value(
+                self._autorollbackable_transaction_map,
+            )
 
             if oldest_transaction is None:
-                break
+                return
 
             if oldest_transaction.age(self._time) <= self._max_transaction_age:
-                break
-
-            if not self._is_transaction_autorollbackable(oldest_transaction):
-                continue
+                return
 
-            oldest_transaction.rollback()
-            del self._transaction_map(oldest_transaction)[
-                oldest_transaction.xid()
-            ]
+            self._autorollback(oldest_transaction)
 
     def _limit_len(self) -> None:
         while len(self) > self._max_len:
-            oldest_transaction = self._oldest_transaction()
+            oldest_transaction = first_map_value(
+                self._autorollbackable_transaction_map,
+            )
 
             if oldest_transaction is None:
                 return
 
-            if not self._is_transaction_autorollbackable(oldest_transaction):
-                continue
-
-            oldest_transaction.rollback()
-            del self._transaction_map(oldest_transaction)[
-                oldest_transaction.xid()
-            ]
-
-    def _is_transaction_autorollbackable(
-        self,
-        transaction: Transaction,
-    ) -> bool:
-        return (
-            not isinstance(transaction, SerializableTransaction)
-            or transaction.state() is not SerializableTransactionState.prepared
-        )
+            self._autorollback(oldest_transaction)
 
-    def _oldest_transaction(self) -> Transaction | None:
-        first_map_tranactions = (
-            first_map_value(map_) for map_ in self._transaction_maps()
-        )
-        oldest_transactions = tuple(
-            first_map_tranaction
-            for first_map_tranaction in first_map_tranactions
-            if first_map_tranaction is not None
-        )
+    def _autorollback(self, transaction: Transaction) -> None:
+        transaction.rollback()
+        self._forget(transaction)
+        self._rollback_in_coordinator(transaction)
 
-        if not oldest_transactions:
-            return None
+    def _forget(self, transaction: Transaction) -> None:
+        del self._transaction_map(transaction)[transaction.xid()]
+        self._autorollbackable_transaction_map.pop(transaction.xid(), None)
 
-        return min(oldest_transactions, key=lambda it: it.start_time())
+    def _rollback_in_coordinator(self, transaction: Transaction) -> None:
+        if isinstance(transaction, SerializableTransaction):
+            self._coordinator.rollback(transaction.xid())
 
     def _serializable_transaction(
         self,
@@ -281,7 +453,8 @@ class Horizon:
 
         if state is not None and transaction.state() is not state:
             transaction.rollback()
-            del self._serializable_transaction_map[xid]
+            self._forget(transaction)
+            self._rollback_in_coordinator(transaction)
 
             raise else_
 
@@ -347,4 +520,34 @@ def horizon(
         _max_transaction_age=max_transaction_age,
         _serializable_transaction_map=OrderedDict(),
         _read_uncommited_transaction_map=OrderedDict(),
+        _autorollbackable_transaction_map=OrderedDict(),
+        _coordinator=HorizonCoordinator(),
+    )
+
+
+def sharded_horizons(
+    time: LogicTime,
+    max_len: int,
+    max_transaction_age: LogicTime,
+    shard_count: int,
+) -> tuple[Horizon, ...]:
+    """
+    :raises tgdb.entities.horizon.horizon.HorizonAlwaysWithoutTransactionsError:
+    """
+
+    assert_(shard_count > 0, else_=HorizonAlwaysWithoutTransactionsError)
+
+    coordinator = HorizonCoordinator()
+
+    return tuple(
+        Horizon(
+            _time=time,
+            _max_len=ceil(max_len / shard_count),
+            _max_transaction_age=max_transaction_age,
+            _serializable_transaction_map=OrderedDict(),
+            _read_uncommited_transaction_map=OrderedDict(),
+            _autorollbackable_transaction_map=OrderedDict(),
+            _coordinator=coordinator,
+        )
+        for _ in range(shard_count)
     )
@@ -1,4 +1,4 @@
-from collections.abc import Iterable, Sequence
+from collections.abc import Sequence
 from collections.abc import Set as AbstractSet
 from dataclasses import dataclass
 from enum import Enum, auto
@@ -36,6 +36,11 @@ class ConflictError(Exception):
     rejected_claims: frozenset[Claim]
 
 
+@dataclass(frozen=True)
+class SnapshotTooOldError(Exception):
+    xid: XID
+
+
 @dataclass(frozen=True)
 class Commit:
     xid: XID
@@ -48,6 +53,13 @@ class PreparedCommit:
     effect: TransactionEffect
 
 
+class IsolationLevel(Enum):
+    serializable = auto()
+    snapshot = auto()
+    read_committed = auto()
+    read_uncommited = auto()
+
+
 class SerializableTransactionState(Enum):
     active = auto()
     rollbacked = auto()
@@ -59,11 +71,11 @@ class SerializableTransactionState(Enum):
 class SerializableTransaction:
     _xid: XID
     _start_time: LogicTime
+    _isolation: IsolationLevel
+    _is_read_only: bool
     _state: SerializableTransactionState
     _space_map: dict[TID, TupleEffect]
     _claims: set[Claim]
-    _concurrent_transactions: set["SerializableTransaction"]
-    _transactions_with_possible_conflict: set["SerializableTransaction"]
 
     def __eq__(self, other: object) -> bool:
         return (
@@ -83,6 +95,12 @@ class SerializableTransaction:
     def age(self, time: LogicTime) -> LogicTime:
         return time - self._start_time
 
+    def isolation(self) -> IsolationLevel:
+        return self._isolation
+
+    def is_read_only(self) -> bool:
+        return self._is_read_only
+
     def state(self) -> SerializableTransactionState:
         return self._state
 
@@ -92,7 +110,22 @@ class SerializableTransaction:
     def space(self) -> frozenset[TID]:
         return frozenset(self._space_map)
 
+    def is_tracking_views(self) -> bool:
+        return (
+            not self._is_read_only
+            or self._isolation is IsolationLevel.serializable
+        )
+
     def include(self, effect: ConflictableTransactionScalarEffect) -> None:
+        if (
+            isinstance(effect, JustViewedTuple)
+            and self._isolation is not IsolationLevel.serializable
+        ):
+            return
+
+        if self._is_read_only and not isinstance(effect, JustViewedTuple):
+            return
+
         if isinstance(effect, Claim):
             self._claims.add(effect)
             return
@@ -105,35 +138,12 @@ class SerializableTransaction:
         self._space_map[effect.tid] = effect
 
     def rollback(self) -> None:
-        state_before_rollback = self._state
-
         self._state = SerializableTransactionState.rollbacked
 
-        if state_before_rollback is SerializableTransactionState.prepared:
-            for transaction in self._concurrent_transactions:
-                transaction.track_rollbacked_prepared_transaction(self)
-
-        elif state_before_rollback is SerializableTransactionState.active:
-            for transaction in self._concurrent_transactions:
-                transaction.track_rollbacked_active_transaction(self)
-
-        self._complete()
-
     def prepare_commit(self) -> PreparedCommit:
-        """:raises tgdb.entities.horizon.transaction.ConflictError:"""
-        conflict = self._conflict()
-
-        if conflict is not None:
-            self.rollback()
-            raise conflict
-
         commit = PreparedCommit(self._xid, self._effect())
         self._state = SerializableTransactionState.prepared
 
-        for concurrent_transaction in self._concurrent_transactions:
-            concurrent_transaction.track_prepared_transaction(self)
-
-        self._complete()
         return commit
 
     def commit(self) -> Commit:
@@ -141,83 +151,25 @@ class SerializableTransaction:
 
         return Commit(self._xid, self._effect())
 
-    def track_concurrent_transaction(
-        self,
-        transaction: "SerializableTransaction",
-    ) -> None:
-        self._concurrent_transactions.add(transaction)
-
-        if transaction.state() is SerializableTransactionState.prepared:
-            self._transactions_with_possible_conflict.add(transaction)
-
-    def track_started_transaction(
-        self,
-        started_transaction: "SerializableTransaction",
-    ) -> None:
-        self._concurrent_transactions.add(started_transaction)
-
-    def track_prepared_transaction(
-        self,
-        prepared_transaction: "SerializableTransaction",
-    ) -> None:
-        self._transactions_with_possible_conflict.add(prepared_transaction)
-
-    def track_rollbacked_prepared_transaction(
-        self,
-        rollbacked_prepared_transaction: "SerializableTransaction",
-    ) -> None:
-        if self._state is SerializableTransactionState.active:
-            self._transactions_with_possible_conflict.remove(
-                rollbacked_prepared_transaction,
-            )
-            self._concurrent_transactions.remove(
-                rollbacked_prepared_transaction,
-            )
-
-    def track_rollbacked_active_transaction(
-        self,
-        rollbacked_active_transaction: "SerializableTransaction",
-    ) -> None:
-        if self._state is SerializableTransactionState.active:
-            self._concurrent_transactions.remove(rollbacked_active_transaction)
-
     @classmethod
     def start(
         cls,
         xid: XID,
         time: LogicTime,
-        concurrent_transactions: Iterable["SerializableTransaction"],
+        isolation: IsolationLevel,
+        *,
+        is_read_only: bool,
     ) -> "SerializableTransaction":
-        started_transaction = SerializableTransaction(
+        return SerializableTransaction(
             _xid=xid,
             _start_time=time,
+            _isolation=isolation,
+            _is_read_only=is_read_only,
             _state=SerializableTransactionState.active,
             _space_map=dict(),
             _claims=set(),
-            _concurrent_transactions=set(),
-            _transactions_with_possible_conflict=set(),
         )
 
-        for concurrent_transaction in concurrent_transactions:
-            concurrent_transaction.track_started_transaction(
-                started_transaction,
-            )
-            started_transaction.track_concurrent_transaction(
-                concurrent_transaction,
-            )
-
-        return started_transaction
-
-    def _conflict(self) -> ConflictError | None:
-        for transaction in self._transactions_with_possible_conflict:
-            conflict_claims = self.claims() & transaction.claims()
-            conflict_space = self.space() & transaction.space()
-
-            if conflict_claims or conflict_space:
-                return ConflictError(self._xid, rejected_claims=conflict_claims)
-
-        return None
-
     def _effect(self) -> TransactionEffect:
         return set(
             scalar_effect
@@ -225,20 +177,23 @@ class SerializableTransaction:
             if not isinstance(scalar_effect, JustViewedTuple)
         )
 
-    def _complete(self) -> None:
-        self._concurrent_transactions.clear()
-        self._transactions_with_possible_conflict.clear()
-
 
 @dataclass
 class ReadUncommitedTransaction:
     _xid: XID
     _start_time: LogicTime
+    _is_read_only: bool
     _space: dict[TID, TransactionScalarEffect]
 
     def xid(self) -> XID:
         return self._xid
 
+    def is_read_only(self) -> bool:
+        return self._is_read_only
+
+    def is_tracking_views(self) -> bool:
+        return not self._is_read_only
+
     def start_time(self) -> LogicTime:
         return self._start_time
 
@@ -246,7 +201,7 @@ class ReadUncommitedTransaction:
         return time - self._start_time
 
     def include(self, effect: ConflictableTransactionScalarEffect) -> None:
-        if isinstance(effect, JustViewedTuple | Claim):
+        if self._is_read_only or isinstance(effect, JustViewedTuple | Claim):
             return
 
         if effect.tid in self._space:
@@ -260,10 +215,17 @@ class ReadUncommitedTransaction:
         return Commit(self._xid, frozenset(self._space.values()))
 
     @classmethod
-    def start(cls, xid: XID, time: LogicTime) -> "ReadUncommitedTransaction":
+    def start(
+        cls,
+        xid: XID,
+        time: LogicTime,
+        *,
+        is_read_only: bool,
+    ) -> "ReadUncommitedTransaction":
         return ReadUncommitedTransaction(
             _xid=xid,
             _start_time=time,
+            _is_read_only=is_read_only,
             _space=dict(),
         )
 
@@ -280,24 +242,29 @@ class ReadUncommitedTransaction:
 type Transaction = SerializableTransaction | ReadUncommitedTransaction
 
 
-class IsolationLevel(Enum):
-    serializable = auto()
-    read_uncommited = auto()
-
-
 def start_transaction(
     xid: XID,
     time: LogicTime,
     isolation: IsolationLevel,
-    serializable_transactions: Iterable[SerializableTransaction],
+    *,
+    is_read_only: bool = False,
 ) -> Transaction:
     match isolation:
-        case IsolationLevel.serializable:
+        case (
+            IsolationLevel.serializable
+            | IsolationLevel.snapshot
+            | IsolationLevel.read_committed
+        ):
             return SerializableTransaction.start(
                 xid,
                 time,
-                serializable_transactions,
+                isolation,
+                is_read_only=is_read_only,
             )
 
         case IsolationLevel.read_uncommited:
-            return ReadUncommitedTransaction.start(xid, time)
+            return ReadUncommitedTransaction.start(
+                xid,
+                time,
+                is_read_only=is_read_only,
+            )
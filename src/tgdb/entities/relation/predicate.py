@@ -0,0 +1,143 @@
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+from tgdb.entities.numeration.number import Number
+from tgdb.entities.relation.scalar import Scalar
+from tgdb.entities.relation.tuple import Tuple
+from tgdb.entities.tools.assert_ import assert_
+
+
+@dataclass(frozen=True)
+class InvalidRangeError(Exception): ...
+
+
+@dataclass(frozen=True)
+class Bound:
+    scalar: Scalar
+    is_inclusive: bool
+
+
+@dataclass(frozen=True)
+class EqualityPredicate:
+    attribute_number: Number
+    scalar: Scalar
+
+    def matches(self, tuple_: Tuple) -> bool:
+        if len(tuple_) <= int(self.attribute_number):
+            return False
+
+        scalar = tuple_[int(self.attribute_number)]
+
+        return type(scalar) is type(self.scalar) and scalar == self.scalar
+
+
+@dataclass(frozen=True)
+class RangePredicate:
+    """
+    :raises tgdb.entities.relation.predicate.InvalidRangeError:
+    """
+
+    attribute_number: Number
+    lower_bound: Bound | None
+    upper_bound: Bound | None
+
+    def __post_init__(self) -> None:
+        bound_types = {
+            type(bound.scalar)
+            for bound in (self.lower_bound, self.upper_bound)
+            if bound is not None
+        }
+
+        assert_(len(bound_types) == 1, InvalidRangeError())
+        assert_(type(None) not in bound_types, InvalidRangeError())
+
+    def scalar_type(self) -> type[Scalar]:
+        bound = self.lower_bound or self.upper_bound
+
+        if bound is None:
+            raise InvalidRangeError
+
+        return type(bound.scalar)
+
+    def matches(self, tuple_: Tuple) -> bool:
+        if len(tuple_) <= int(self.attribute_number):
+            return False
+
+        scalar = tuple_[int(self.attribute_number)]
+
+        if type(scalar) is not self.scalar_type():
+            return False
+
+        return _is_above(scalar, self.lower_bound) and _is_below(
+            scalar,
+            self.upper_bound,
+        )
+
+
+@dataclass(frozen=True)
+class PrefixPredicate:
+    attribute_number: Number
+    prefix: str
+
+    def matches(self, tuple_: Tuple) -> bool:
+        if len(tuple_) <= int(self.attribute_number):
+            return False
+
+        scalar = tuple_[int(self.attribute_number)]
+
+        return isinstance(scalar, str) and scalar.startswith(self.prefix)
+
+
+type AttributePredicate = EqualityPredicate | RangePredicate | PrefixPredicate
+
+
+@dataclass(frozen=True)
+class ConjunctivePredicate:
+    predicates: tuple[AttributePredicate, ...]
+
+    def matches(self, tuple_: Tuple) -> bool:
+        return all(predicate.matches(tuple_) for predicate in self.predicates)
+
+
+type Predicate = AttributePredicate | ConjunctivePredicate
+
+
+def conjuncts(predicate: Predicate) -> tuple[AttributePredicate, ...]:
+    match predicate:
+        case ConjunctivePredicate(predicates):
+            return predicates
+        case _:
+            return (predicate,)
+
+
+def _is_above(scalar: Scalar, bound: Bound | None) -> bool:
+    if bound is None:
+        return True
+
+    bound_scalar = _comparable_scalar(bound.scalar)
+    scalar = _comparable_scalar(scalar)
+
+    if bound.is_inclusive:
+        return bound_scalar <= scalar  # type: ignore[operator]
+
+    return bound_scalar < scalar  # type: ignore[operator]
+
+
+def _is_below(scalar: Scalar, bound: Bound | None) -> bool:
+    if bound is None:
+        return True
+
+    bound_scalar = _comparable_scalar(bound.scalar)
+    scalar = _comparable_scalar(scalar)
+
+    if bound.is_inclusive:
+        return scalar <= bound_scalar  # type: ignore[operator]
+
+    return scalar < bound_scalar  # type: ignore[operator]
+
+
+def _comparable_scalar(scalar: Scalar) -> Scalar:
+    if isinstance(scalar, datetime) and scalar.tzinfo is not None:
+        return scalar.astimezone(UTC).replace(tzinfo=None)
+
+    return scalar
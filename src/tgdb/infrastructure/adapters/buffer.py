@@ -1,7 +1,8 @@
 from asyncio import Event, wait_for
 from collections import deque
-from collections.abc import AsyncIterator, Sequence
+from collections.abc import AsyncIterator, Callable, Sequence
 from dataclasses import dataclass, field
+from time import monotonic
 from types import TracebackType
 from typing import ClassVar, Self
 
@@ -9,33 +10,58 @@ from pydantic import TypeAdapter
 
 from tgdb.application.common.ports.buffer import Buffer
 from tgdb.entities.horizon.transaction import Commit, PreparedCommit
+from tgdb.entities.tools.assert_ import assert_
+from tgdb.infrastructure.commit_codec import (
+    decoded_commit_log_segment,
+    encoded_commit_log_segment,
+    encoded_commit_log_segment_magic,
+)
+from tgdb.infrastructure.commit_log import CommitLog, CommitLogSegment
+from tgdb.infrastructure.overflow import Overflow
 from tgdb.infrastructure.pydantic.horizon.commit import (
     EncodableCommit,
     EncodablePreparedCommit,
 )
-from tgdb.infrastructure.telethon.in_telegram_bytes import InTelegramBytes
+from tgdb.infrastructure.pydantic.horizon.commit_log import (
+    EncodableCommitLogSegment,
+)
+from tgdb.infrastructure.telethon.in_telegram_segments import (
+    InTelegramSegments,
+)
 
 
 @dataclass(frozen=True, unsafe_hash=False)
 class InMemoryBuffer[ValueT](Buffer[ValueT]):
-    _len_to_overflow: int
-    _overflow_timeout_seconds: int | float
+    _overflow: Overflow
     _values: deque[ValueT]
+    _clock: Callable[[], float] = monotonic
     _is_overflowed: Event = field(init=False, default_factory=Event)
+    _has_values: Event = field(init=False, default_factory=Event)
 
     def __post_init__(self) -> None:
         self._refresh_overflow()
 
+    def len_to_overflow(self) -> int:
+        return self._overflow.len()
+
+    def overflow_timeout_seconds(self) -> float:
+        return self._overflow.timeout_seconds()
+
     async def add(self, value: ValueT, /) -> None:
+        self._overflow.observe_value(self._clock())
         self._values.append(value)
         self._refresh_overflow()
 
+    async def release(self, values: Sequence[ValueT], /) -> None: ...
+
     async def __aiter__(self) -> AsyncIterator[Sequence[ValueT]]:
         while True:
+            await self._has_values.wait()
+
             try:
                 await wait_for(
                     self._is_overflowed.wait(),
-                    self._overflow_timeout_seconds,
+                    self._overflow.timeout_seconds(),
                 )
             except TimeoutError:
                 if not self._values:
@@ -45,32 +71,85 @@ class InMemoryBuffer[ValueT](Buffer[ValueT]):
             self._values.clear()
 
             self._is_overflowed.clear()
+            self._has_values.clear()
+
+            yielded_at = self._clock()
             yield values
+            self._overflow.observe_batch(self._clock() - yielded_at)
 
     def _refresh_overflow(self) -> None:
-        if len(self._values) >= self._len_to_overflow:
+        if self._values:
+            self._has_values.set()
+
+        if len(self._values) >= self._overflow.len():
             self._is_overflowed.set()
 
 
-@dataclass(frozen=True)
+@dataclass(unsafe_hash=False)
 class InTelegramReplicablePreparedCommitBuffer(Buffer[Commit | PreparedCommit]):
     _buffer: Buffer[Commit | PreparedCommit]
-    _in_tg_encoded_commits: InTelegramBytes
+    _in_tg_segments: InTelegramSegments
+    _max_unreleased_batch_count: int = 1
+    _log: CommitLog[Sequence[Commit | PreparedCommit]] = field(
+        init=False,
+        default_factory=CommitLog,
+    )
+    _can_pull_batch: Event = field(init=False, default_factory=Event)
+    _replayed_segment_id_by_sequence_number: dict[int, int] = field(
+        init=False,
+        default_factory=dict,
+    )
+    _unpersisted_replayed_commit_count: int = field(init=False, default=0)
 
-    _adapter: ClassVar = TypeAdapter(
-        tuple[EncodableCommit | EncodablePreparedCommit, ...],
+    _json_adapter: ClassVar = TypeAdapter(
+        EncodableCommitLogSegment
+        | tuple[EncodableCommit | EncodablePreparedCommit, ...],
     )
+    _min_compacted_segment_count: ClassVar = 16
+
+    def __post_init__(self) -> None:
+        assert_(self._max_unreleased_batch_count >= 1, ValueError)
+        self._refresh_pulling()
 
     async def __aenter__(self) -> Self:
-        encoded_commits = await self._in_tg_encoded_commits
+        last_segments = await self._in_tg_segments.last(1)
+
+        if not last_segments:
+            return self
+
+        ((_, encoded_segment),) = last_segments
+        segment = self._decoded_segment(encoded_segment)
+
+        if not isinstance(segment, CommitLogSegment):
+            for commit in segment:
+                await self._buffer.add(commit)
 
-        if encoded_commits is None:
             return self
 
-        encodable_commits = self._adapter.validate_json(encoded_commits)
+        replayed_segment_count = segment.sequence_number - segment.checkpoint
+        kept_segments = await self._in_tg_segments.last(
+            replayed_segment_count + self._min_compacted_segment_count,
+        )
 
-        for commit in encodable_commits:
-            await self._buffer.add(commit.entity())
+        for kept_segment_id, encoded_kept_segment in kept_segments:
+            kept_segment = self._decoded_segment(encoded_kept_segment)
+
+            if not isinstance(kept_segment, CommitLogSegment):
+                continue
+
+            self._replayed_segment_id_by_sequence_number[
+                kept_segment.sequence_number
+            ] = kept_segment_id
+
+            if kept_segment.sequence_number <= segment.checkpoint:
+                continue
+
+            for commit in kept_segment.batch:
+                await self._buffer.add(commit)
+                self._unpersisted_replayed_commit_count += 1
+
+        self._log.continue_from(segment.sequence_number)
+        self._register_replayed_segments(0)
 
         return self
 
@@ -84,23 +163,87 @@ class InTelegramReplicablePreparedCommitBuffer(Buffer[Commit | PreparedCommit]):
     async def add(self, commit: Commit | PreparedCommit, /) -> None:
         await self._buffer.add(commit)
 
+    async def release(
+        self,
+        commits: Sequence[Commit | PreparedCommit],
+        /,
+    ) -> None:
+        self._log.release(commits)
+        self._refresh_pulling()
+
+        compactable_segment_ids = self._log.compactable_segment_ids()
+
+        if len(compactable_segment_ids) >= self._min_compacted_segment_count:
+            await self._in_tg_segments.delete(compactable_segment_ids)
+            self._log.compact(compactable_segment_ids)
+
     async def __aiter__(
         self,
     ) -> AsyncIterator[Sequence[Commit | PreparedCommit]]:
-        async for commits in self._buffer:
-            encodable_commits = tuple(map(self._encodable_commit, commits))
-            encoded_commits = self._adapter.dump_json(encodable_commits)
-            await self._in_tg_encoded_commits.set(encoded_commits)
+        batches = aiter(self._buffer)
+
+        while True:
+            await self._can_pull_batch.wait()
+            commits = await anext(batches)
+
+            sequence_number = self._log.append(commits)
+            self._refresh_pulling()
+
+            segment = CommitLogSegment(
+                sequence_number,
+                self._log.checkpoint(),
+                commits,
+            )
+            segment_id = await self._in_tg_segments.append(
+                encoded_commit_log_segment(segment),
+            )
+            self._log.set_segment_id(sequence_number, segment_id)
+            self._register_replayed_segments(len(commits))
 
             yield commits
 
-    def _encodable_commit(
+    def _refresh_pulling(self) -> None:
+        unreleased_batch_count = self._log.unreleased_batch_count()
+
+        if unreleased_batch_count < self._max_unreleased_batch_count:
+            self._can_pull_batch.set()
+        else:
+            self._can_pull_batch.clear()
+
+    def _register_replayed_segments(self, persisted_commit_count: int) -> None:
+        self._unpersisted_replayed_commit_count -= min(
+            persisted_commit_count,
+            self._unpersisted_replayed_commit_count,
+        )
+
+        if self._unpersisted_replayed_commit_count:
+            return
+
+        for (
+            sequence_number,
+            segment_id,
+        ) in self._replayed_segment_id_by_sequence_number.items():
+            self._log.set_segment_id(sequence_number, segment_id)
+
+        self._replayed_segment_id_by_sequence_number.clear()
+
+    def _decoded_segment(
         self,
-        commit: Commit | PreparedCommit,
-    ) -> EncodableCommit | EncodablePreparedCommit:
-        match commit:
-            case Commit():
-                return EncodableCommit.of(commit)
-
-            case PreparedCommit():
-                return EncodablePreparedCommit.of(commit)
+        encoded_segment: bytes,
+    ) -> (
+        CommitLogSegment[Sequence[Commit | PreparedCommit]]
+        | Sequence[Commit | PreparedCommit]
+    ):
+        if encoded_segment.startswith(encoded_commit_log_segment_magic):
+            return decoded_commit_log_segment(encoded_segment)
+
+        segment = self._json_adapter.validate_json(encoded_segment)
+
+        if not isinstance(segment, EncodableCommitLogSegment):
+            return tuple(commit.entity() for commit in segment)
+
+        return CommitLogSegment(
+            segment.sequence_number,
+            segment.checkpoint,
+            tuple(commit.entity() for commit in segment.commits),
+        )
@@ -1,8 +1,10 @@
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Sequence
 from dataclasses import dataclass
 
 from tgdb.application.common.ports.queque import Queque
+from tgdb.entities.horizon.transaction import Commit, PreparedCommit
 from tgdb.infrastructure.async_queque import AsyncQueque
+from tgdb.infrastructure.unapplied_effects import UnappliedEffects
 
 
 @dataclass
@@ -18,3 +20,19 @@ class InMemoryQueque[ValueT](Queque[ValueT]):
 
     def __aiter__(self) -> AsyncIterator[ValueT]:
         return aiter(self._queque)
+
+
+@dataclass(frozen=True)
+class UnappliedEffectQueque(Queque[Sequence[Commit | PreparedCommit]]):
+    _queque: Queque[Sequence[Commit | PreparedCommit]]
+    _unapplied_effects: UnappliedEffects
+
+    async def push(self, commits: Sequence[Commit | PreparedCommit]) -> None:
+        self._unapplied_effects.push(tuple(commit.effect for commit in commits))
+        await self._queque.push(commits)
+
+    async def sync(self) -> None:
+        await self._queque.sync()
+
+    def __aiter__(self) -> AsyncIterator[Sequence[Commit | PreparedCommit]]:
+        return aiter(self._queque)
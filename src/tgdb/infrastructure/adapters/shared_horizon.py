@@ -1,21 +1,19 @@
+from collections.abc import Sequence
+from contextlib import AbstractAsyncContextManager, nullcontext
 from dataclasses import dataclass
-from types import TracebackType
 
 from tgdb.application.horizon.ports.shared_horizon import SharedHorizon
 from tgdb.entities.horizon.horizon import Horizon
+from tgdb.entities.horizon.transaction import XID
+from tgdb.entities.tools.assert_ import assert_
 
 
 @dataclass(frozen=True)
 class InMemorySharedHorizon(SharedHorizon):
-    _horizon: Horizon
+    _horizons: Sequence[Horizon]
 
-    async def __aenter__(self) -> Horizon:
-        return self._horizon
+    def __post_init__(self) -> None:
+        assert_(len(self._horizons) > 0, ValueError)
 
-    async def __aexit__(
-        self,
-        exc_type: type[BaseException] | None,
-        exc_value: BaseException | None,
-        traceback: TracebackType | None,
-        /,
-    ) -> None: ...
+    def __call__(self, xid: XID, /) -> AbstractAsyncContextManager[Horizon]:
+        return nullcontext(self._horizons[xid.int % len(self._horizons)])
@@ -1,11 +1,15 @@
 from asyncio import gather
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Iterable, Sequence
 from dataclasses import dataclass
 
 from in_memory_db import InMemoryDb
 
 from tgdb.application.relation.ports.tuples import (
     OversizedRelationSchemaError,
+    TupleAccess,
+    TupleChunk,
+    TupleCursor,
+    TuplePlan,
     Tuples,
 )
 from tgdb.entities.horizon.transaction import (
@@ -13,9 +17,14 @@ from tgdb.entities.horizon.transaction import (
     TransactionScalarEffect,
 )
 from tgdb.entities.numeration.number import Number
+from tgdb.entities.relation.predicate import (
+    EqualityPredicate,
+    Predicate,
+    conjuncts,
+)
 from tgdb.entities.relation.relation import Relation
 from tgdb.entities.relation.scalar import Scalar
-from tgdb.entities.relation.tuple import Tuple
+from tgdb.entities.relation.tuple import TID, Tuple
 from tgdb.entities.relation.tuple_effect import (
     DeletedTuple,
     MigratedTuple,
@@ -26,14 +35,23 @@ from tgdb.infrastructure.telethon.in_telegram_heap import (
     InTelegramHeap,
     UnacceptableTupleError,
 )
+from tgdb.infrastructure.tuple_cache import TupleCache, tuple_cache_key
+from tgdb.infrastructure.unapplied_effects import UnappliedEffects
 
 
 @dataclass(frozen=True, unsafe_hash=False)
 class InMemoryTuples(Tuples):
     _db: InMemoryDb[Tuple]
 
+    async def track_relation(self, relation: Relation) -> None: ...
+
     async def assert_can_accept_tuples(self, relation: Relation) -> None: ...
 
+    async def tuples_with_tids(self, tids: Sequence[TID]) -> Sequence[Tuple]:
+        tid_set = frozenset(tids)
+
+        return self._db.select_many(lambda it: it.tid in tid_set)
+
     async def tuples_with_attribute(
         self,
         relation_number: Number,
@@ -48,6 +66,37 @@ class InMemoryTuples(Tuples):
             ),
         )
 
+    async def tuples_with_predicate(
+        self,
+        relation_number: Number,
+        predicate: Predicate,
+    ) -> Sequence[Tuple]:
+        return self._db.select_many(
+            lambda it: (
+                it.relation_schema_id.relation_number == relation_number
+                and predicate.matches(it)
+            ),
+        )
+
+    async def tuple_chunks(
+        self,
+        relation_number: Number,
+        predicate: Predicate,
+        cursor: TupleCursor | None,
+    ) -> AsyncIterator[TupleChunk]:
+        tuples = await self.tuples_with_predicate(relation_number, predicate)
+        start = 0 if cursor is None else cursor
+
+        for next_cursor, tuple_ in enumerate(tuples[start:], start + 1):
+            yield TupleChunk((tuple_,), next_cursor)
+
+    async def plan(
+        self,
+        relation_number: Number,  # noqa: ARG002
+        predicate: Predicate,
+    ) -> TuplePlan:
+        return TuplePlan(TupleAccess.memory, (), conjuncts(predicate), None)
+
     async def map(self, effects: Sequence[TransactionEffect]) -> None:
         await gather(*map(self._map_one, effects))
 
@@ -102,6 +151,9 @@ class InMemoryTuples(Tuples):
 class InTelegramHeapTuples(Tuples):
     _heap: InTelegramHeap
 
+    async def track_relation(self, relation: Relation) -> None:
+        self._heap.track_relation(relation)
+
     async def assert_can_accept_tuples(self, relation: Relation) -> None:
         try:
             self._heap.assert_can_accept_tuples_of_relation(relation)
@@ -111,6 +163,9 @@ class InTelegramHeapTuples(Tuples):
                 self._heap.tuple_max_len(),
             ) from error
 
+    async def tuples_with_tids(self, tids: Sequence[TID]) -> Sequence[Tuple]:
+        return await self._heap.tuples_with_tids(tids)
+
     async def tuples_with_attribute(
         self,
         relation_number: Number,
@@ -123,41 +178,280 @@ class InTelegramHeapTuples(Tuples):
             attribute_scalar,
         )
 
+    async def tuples_with_predicate(
+        self,
+        relation_number: Number,
+        predicate: Predicate,
+    ) -> Sequence[Tuple]:
+        return await self._heap.tuples_with_predicate(
+            relation_number,
+            predicate,
+        )
+
+    def tuple_chunks(
+        self,
+        relation_number: Number,
+        predicate: Predicate,
+        cursor: TupleCursor | None,
+    ) -> AsyncIterator[TupleChunk]:
+        return self._heap.tuple_chunks(relation_number, predicate, cursor)
+
+    async def plan(
+        self,
+        relation_number: Number,
+        predicate: Predicate,
+    ) -> TuplePlan:
+        return self._heap.plan(relation_number, predicate)
+
     async def map(
         self,
         transaction_effects: Sequence[TransactionEffect],
     ) -> None:
-        await gather(
-            *(
-                self._map_scalar_effect(tuple_effect, idempotently=False)
-                for transaction_effect in transaction_effects
-                for tuple_effect in transaction_effect
-            ),
+        await self._map(transaction_effects, idempotently=False)
+
+    async def map_idempotently(
+        self,
+        transaction_effects: Sequence[TransactionEffect],
+    ) -> None:
+        await self._map(transaction_effects, idempotently=True)
+
+    async def _map(
+        self,
+        transaction_effects: Sequence[TransactionEffect],
+        *,
+        idempotently: bool,
+    ) -> None:
+        new_tuples = list[Tuple]()
+        mutated_tuples = list[Tuple]()
+        deleted_tids = list[TID]()
+
+        for scalar_effect in _merged_scalar_effects(transaction_effects):
+            match scalar_effect:
+                case NewTuple(tuple):
+                    new_tuples.append(tuple)
+                case MutatedTuple(tuple) | MigratedTuple(tuple):
+                    mutated_tuples.append(tuple)
+                case DeletedTuple(tid):
+                    deleted_tids.append(tid)
+
+        if idempotently:
+            insert = self._heap.insert_idempotently(new_tuples)
+        else:
+            insert = self._heap.insert(new_tuples)
+
+        await gather(insert, self._heap.rewrite(mutated_tuples, deleted_tids))
+
+
+@dataclass(frozen=True)
+class CachedTuples(Tuples):
+    _tuples: Tuples
+    _cache: TupleCache
+
+    def cache(self) -> TupleCache:
+        return self._cache
+
+    async def track_relation(self, relation: Relation) -> None:
+        await self._tuples.track_relation(relation)
+
+    async def assert_can_accept_tuples(self, relation: Relation) -> None:
+        await self._tuples.assert_can_accept_tuples(relation)
+
+    async def tuples_with_tids(self, tids: Sequence[TID]) -> Sequence[Tuple]:
+        return await self._tuples.tuples_with_tids(tids)
+
+    async def tuples_with_attribute(
+        self,
+        relation_number: Number,
+        attribute_number: Number,
+        attribute_scalar: Scalar,
+    ) -> Sequence[Tuple]:
+        key = tuple_cache_key(
+            relation_number,
+            attribute_number,
+            attribute_scalar,
+        )
+        cached_tuples = self._cache.tuples(key)
+
+        if cached_tuples is not None:
+            return cached_tuples
+
+        version = self._cache.version()
+        tuples = await self._tuples.tuples_with_attribute(
+            relation_number,
+            attribute_number,
+            attribute_scalar,
         )
+        self._cache.set_tuples(key, tuples, version)
+
+        return tuples
+
+    async def tuples_with_predicate(
+        self,
+        relation_number: Number,
+        predicate: Predicate,
+    ) -> Sequence[Tuple]:
+        match predicate:
+            case EqualityPredicate(attribute_number, scalar):
+                return await self.tuples_with_attribute(
+                    relation_number,
+                    attribute_number,
+                    scalar,
+                )
+            case _:
+                return await self._tuples.tuples_with_predicate(
+                    relation_number,
+                    predicate,
+                )
+
+    def tuple_chunks(
+        self,
+        relation_number: Number,
+        predicate: Predicate,
+        cursor: TupleCursor | None,
+    ) -> AsyncIterator[TupleChunk]:
+        return self._tuples.tuple_chunks(relation_number, predicate, cursor)
+
+    async def plan(
+        self,
+        relation_number: Number,
+        predicate: Predicate,
+    ) -> TuplePlan:
+        match predicate:
+            case EqualityPredicate(attribute_number, scalar) if (
+                self._cache.has_tuples(
+                    tuple_cache_key(relation_number, attribute_number, scalar),
+                )
+            ):
+                return TuplePlan(TupleAccess.cache, (predicate,), (), None)
+            case _:
+                return await self._tuples.plan(relation_number, predicate)
+
+    async def map(
+        self,
+        transaction_effects: Sequence[TransactionEffect],
+    ) -> None:
+        await self._tuples.map(transaction_effects)
+        self._cache.map(_merged_scalar_effects(transaction_effects))
 
     async def map_idempotently(
         self,
         transaction_effects: Sequence[TransactionEffect],
     ) -> None:
-        await gather(
-            *(
-                self._map_scalar_effect(tuple_effect, idempotently=True)
-                for transaction_effect in transaction_effects
-                for tuple_effect in transaction_effect
-            ),
+        await self._tuples.map_idempotently(transaction_effects)
+        self._cache.map(_merged_scalar_effects(transaction_effects))
+
+
+@dataclass(frozen=True)
+class UnappliedEffectTuples(Tuples):
+    _tuples: Tuples
+    _unapplied_effects: UnappliedEffects
+
+    async def track_relation(self, relation: Relation) -> None:
+        await self._tuples.track_relation(relation)
+
+    async def assert_can_accept_tuples(self, relation: Relation) -> None:
+        await self._tuples.assert_can_accept_tuples(relation)
+
+    async def tuples_with_tids(self, tids: Sequence[TID]) -> Sequence[Tuple]:
+        tuples = await self._tuples.tuples_with_tids(tids)
+
+        return self._unapplied_effects.overlaid_tuples_with_tids(tids, tuples)
+
+    async def tuples_with_attribute(
+        self,
+        relation_number: Number,
+        attribute_number: Number,
+        attribute_scalar: Scalar,
+    ) -> Sequence[Tuple]:
+        tuples = await self._tuples.tuples_with_attribute(
+            relation_number,
+            attribute_number,
+            attribute_scalar,
         )
 
-    async def _map_scalar_effect(
+        return self._unapplied_effects.overlaid_tuples(
+            relation_number,
+            EqualityPredicate(attribute_number, attribute_scalar),
+            tuples,
+            is_exhaustive=True,
+        )
+
+    async def tuples_with_predicate(
+        self,
+        relation_number: Number,
+        predicate: Predicate,
+    ) -> Sequence[Tuple]:
+        tuples = await self._tuples.tuples_with_predicate(
+            relation_number,
+            predicate,
+        )
+
+        return self._unapplied_effects.overlaid_tuples(
+            relation_number,
+            predicate,
+            tuples,
+            is_exhaustive=True,
+        )
+
+    async def tuple_chunks(
         self,
-        scalar_effect: TransactionScalarEffect,
-        idempotently: bool,  # noqa: FBT001
+        relation_number: Number,
+        predicate: Predicate,
+        cursor: TupleCursor | None,
+    ) -> AsyncIterator[TupleChunk]:
+        chunks = self._tuples.tuple_chunks(relation_number, predicate, cursor)
+
+        async for chunk in chunks:
+            tuples = self._unapplied_effects.overlaid_tuples(
+                relation_number,
+                predicate,
+                chunk.tuples,
+                is_exhaustive=False,
+            )
+            yield TupleChunk(tuples, chunk.cursor)
+
+    async def plan(
+        self,
+        relation_number: Number,
+        predicate: Predicate,
+    ) -> TuplePlan:
+        return await self._tuples.plan(relation_number, predicate)
+
+    async def map(
+        self,
+        transaction_effects: Sequence[TransactionEffect],
     ) -> None:
-        match scalar_effect, idempotently:
-            case NewTuple(tuple), False:
-                await self._heap.insert(tuple)
-            case NewTuple(tuple), True:
-                await self._heap.insert_idempotently(tuple)
-            case MutatedTuple(tuple) | MigratedTuple(tuple), _:
-                await self._heap.update(tuple)
-            case DeletedTuple(tid), _:
-                await self._heap.delete_tuple_with_tid(tid)
+        try:
+            await self._tuples.map(transaction_effects)
+        finally:
+            self._unapplied_effects.apply(transaction_effects)
+
+    async def map_idempotently(
+        self,
+        transaction_effects: Sequence[TransactionEffect],
+    ) -> None:
+        try:
+            await self._tuples.map_idempotently(transaction_effects)
+        finally:
+            self._unapplied_effects.apply(transaction_effects)
+
+
+def _merged_scalar_effects(
+    transaction_effects: Sequence[TransactionEffect],
+) -> Iterable[TransactionScalarEffect]:
+    merged_scalar_effect_map = dict[TID, TransactionScalarEffect]()
+
+    for transaction_effect in transaction_effects:
+        for scalar_effect in transaction_effect:
+            previous_scalar_effect = merged_scalar_effect_map.get(
+                scalar_effect.tid,
+            )
+
+            if previous_scalar_effect is None:
+                merged_scalar_effect_map[scalar_effect.tid] = scalar_effect
+            else:
+                merged_scalar_effect_map[scalar_effect.tid] = (
+                    previous_scalar_effect & scalar_effect
+                )
+
+    return merged_scalar_effect_map.values()
@@ -0,0 +1,80 @@
+from asyncio import Future, get_running_loop
+from collections import deque
+from dataclasses import dataclass, field
+from typing import ClassVar
+
+from tgdb.entities.tools.assert_ import assert_
+
+
+@dataclass(unsafe_hash=False)
+class AimdConcurrency:
+    _initial_window: float
+    _max_window: float
+    _latency_threshold_seconds: float
+
+    _window: float = field(init=False)
+    _in_flight_count: int = field(init=False, default=0)
+    _acquired_count: int = field(init=False, default=0)
+    _decreased_acquired_count: int = field(init=False, default=0)
+    _waiters: deque[Future[None]] = field(init=False, default_factory=deque)
+
+    _min_window: ClassVar = 1
+    _decrease_factor: ClassVar = 0.5
+
+    def __post_init__(self) -> None:
+        assert_(self._min_window <= self._initial_window, ValueError)
+        assert_(self._initial_window <= self._max_window, ValueError)
+
+        self._window = self._initial_window
+
+    def window(self) -> float:
+        return self._window
+
+    def in_flight_count(self) -> int:
+        return self._in_flight_count
+
+    async def acquire(self) -> int:
+        while self._in_flight_count >= int(self._window):
+            waiter = get_running_loop().create_future()
+            self._waiters.append(waiter)
+
+            try:
+                await waiter
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+
+        self._in_flight_count += 1
+        self._acquired_count += 1
+
+        return self._acquired_count
+
+    def release(
+        self,
+        acquisition_number: int,
+        latency_seconds: float,
+        *,
+        is_overloaded: bool,
+    ) -> None:
+        if is_overloaded or latency_seconds > self._latency_threshold_seconds:
+            if acquisition_number > self._decreased_acquired_count:
+                self._window = max(
+                    self._min_window,
+                    self._window * self._decrease_factor,
+                )
+                self._decreased_acquired_count = self._acquired_count
+        else:
+            self._window = min(
+                self._max_window,
+                self._window + 1 / self._window,
+            )
+
+        self._in_flight_count -= 1
+        free_slot_count = int(self._window) - self._in_flight_count
+
+        while self._waiters and free_slot_count > 0:
+            waiter = self._waiters.popleft()
+
+            if not waiter.done():
+                waiter.set_result(None)
+                free_slot_count -= 1
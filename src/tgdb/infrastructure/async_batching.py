@@ -0,0 +1,65 @@
+from asyncio import Future, Task, get_running_loop, shield
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True, unsafe_hash=False)
+class AsyncBatching[KeyT, ValueT]:
+    _values: Callable[[Sequence[KeyT]], Awaitable[Mapping[KeyT, ValueT]]]
+
+    _pending_future_map: dict[KeyT, Future[ValueT]] = field(
+        init=False,
+        default_factory=dict,
+    )
+    _active_future_map: dict[KeyT, Future[ValueT]] = field(
+        init=False,
+        default_factory=dict,
+    )
+    _tasks: set[Task[None]] = field(init=False, default_factory=set)
+
+    def __call__(self, key: KeyT) -> Awaitable[ValueT]:
+        future = self._active_future_map.get(key)
+
+        if future is None:
+            future = self._pending_future_map.get(key)
+
+        if future is None:
+            future = self._pending_future(key)
+
+        return shield(future)
+
+    def _pending_future(self, key: KeyT) -> Future[ValueT]:
+        loop = get_running_loop()
+
+        if not self._pending_future_map:
+            loop.call_soon(self._start_batch)
+
+        future = loop.create_future()
+        self._pending_future_map[key] = future
+
+        return future
+
+    def _start_batch(self) -> None:
+        future_map = dict(self._pending_future_map)
+        self._pending_future_map.clear()
+        self._active_future_map.update(future_map)
+
+        task = get_running_loop().create_task(self._resolve(future_map))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _resolve(self, future_map: Mapping[KeyT, Future[ValueT]]) -> None:
+        try:
+            values = await self._values(tuple(future_map))
+        except Exception as error:  # noqa: BLE001
+            for future in future_map.values():
+                future.set_exception(error)
+        else:
+            for key, future in future_map.items():
+                if key in values:
+                    future.set_result(values[key])
+                else:
+                    future.set_exception(KeyError(key))
+        finally:
+            for key in future_map:
+                del self._active_future_map[key]
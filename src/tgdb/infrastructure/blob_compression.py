@@ -0,0 +1,125 @@
+import lzma
+import zlib
+from dataclasses import dataclass
+from enum import StrEnum
+from importlib import import_module
+from types import ModuleType
+
+from tgdb.entities.tools.assert_ import assert_
+
+
+class BlobCompression(StrEnum):
+    none = "none"
+    zlib = "zlib"
+    lzma = "lzma"
+    zstd = "zstd"
+
+
+@dataclass(frozen=True)
+class UnavailableBlobCompressionError(Exception):
+    compression: BlobCompression
+
+
+@dataclass(frozen=True)
+class InvalidBlobError(Exception): ...
+
+
+_blob_magic = b"\x00tgdb"
+_blob_version = 1
+_compression_ids = {
+    BlobCompression.none: 0,
+    BlobCompression.zlib: 1,
+    BlobCompression.lzma: 2,
+    BlobCompression.zstd: 3,
+}
+_compressions_by_id = {
+    compression_id: compression
+    for compression, compression_id in _compression_ids.items()
+}
+_header_len = len(_blob_magic) + 2
+
+
+def is_blob_compression_available(compression: BlobCompression) -> bool:
+    return compression is not BlobCompression.zstd or _zstd() is not None
+
+
+def assert_blob_compression_available(compression: BlobCompression) -> None:
+    """
+    :raises tgdb.infrastructure.blob_compression.UnavailableBlobCompressionError:
+    """  # noqa: E501
+
+    assert_(
+        is_blob_compression_available(compression),
+        UnavailableBlobCompressionError(compression),
+    )
+
+
+def compressed_blob(blob: bytes, compression: BlobCompression) -> bytes:
+    """
+    :raises tgdb.infrastructure.blob_compression.UnavailableBlobCompressionError:
+    """  # noqa: E501
+
+    header = _blob_magic + bytes((_blob_version, _compression_ids[compression]))
+
+    match compression:
+        case BlobCompression.none:
+            return blob
+        case BlobCompression.zlib:
+            body = zlib.compress(blob)
+        case BlobCompression.lzma:
+            body = lzma.compress(blob)
+        case BlobCompression.zstd:
+            body = _available_zstd().compress(blob)
+
+    return header + body
+
+
+def decompressed_blob(blob: bytes) -> bytes:
+    """
+    :raises tgdb.infrastructure.blob_compression.UnavailableBlobCompressionError:
+    :raises tgdb.infrastructure.blob_compression.InvalidBlobError:
+    """  # noqa: E501
+
+    if not blob.startswith(_blob_magic):
+        return blob
+
+    assert_(len(blob) >= _header_len, InvalidBlobError())
+
+    version = blob[len(_blob_magic)]
+    compression_id = blob[len(_blob_magic) + 1]
+    body = blob[_header_len:]
+
+    assert_(version == _blob_version, InvalidBlobError())
+    assert_(compression_id in _compressions_by_id, InvalidBlobError())
+
+    compression = _compressions_by_id[compression_id]
+
+    match compression:
+        case BlobCompression.none:
+            return body
+        case BlobCompression.zlib:
+            return zlib.decompress(body)
+        case BlobCompression.lzma:
+            return lzma.decompress(body)
+        case BlobCompression.zstd:
+            decompressed_body: bytes = _available_zstd().decompress(body)
+            return decompressed_body
+
+
+def _available_zstd() -> ModuleType:
+    zstd = _zstd()
+
+    if zstd is None:
+        raise UnavailableBlobCompressionError(BlobCompression.zstd)
+
+    return zstd
+
+
+def _zstd() -> ModuleType | None:
+    for module_name in ("compression.zstd", "zstandard"):
+        try:
+            return import_module(module_name)
+        except ImportError:
+            continue
+
+    return None
@@ -0,0 +1,312 @@
+import struct
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from enum import IntEnum
+from struct import Struct
+from typing import Any
+from uuid import UUID
+
+from tgdb.entities.horizon.transaction import (
+    Commit,
+    PreparedCommit,
+    TransactionScalarEffect,
+)
+from tgdb.entities.numeration.number import Number
+from tgdb.entities.relation.relation import RelationSchemaID
+from tgdb.entities.relation.scalar import Scalar
+from tgdb.entities.relation.tuple import Tuple
+from tgdb.entities.relation.tuple_effect import (
+    DeletedTuple,
+    MigratedTuple,
+    MutatedTuple,
+    NewTuple,
+)
+from tgdb.entities.tools.assert_ import assert_
+from tgdb.infrastructure.commit_log import CommitLogSegment
+
+
+@dataclass(frozen=True)
+class InvalidEncodedCommitsError(Exception): ...
+
+
+class _CommitKind(IntEnum):
+    commit = 0
+    prepared_commit = 1
+
+
+class _EffectKind(IntEnum):
+    new_tuple = 0
+    mutated_tuple = 1
+    migrated_tuple = 2
+    deleted_tuple = 3
+
+
+class _ScalarKind(IntEnum):
+    none = 0
+    false = 1
+    true = 2
+    int = 3
+    str = 4
+    naive_datetime = 5
+    aware_datetime = 6
+    uuid = 7
+
+
+encoded_commits_magic = b"\x01tgdbc"
+encoded_commit_log_segment_magic = b"\x01tgdbs"
+
+_version = 1
+
+_header = Struct("<BI")
+_segment_header = Struct("<QQ")
+_commit_header = Struct("<B16sI")
+_deleted_tuple = Struct("<B16s")
+_tuple_header = Struct("<B16sQQH")
+_scalar_kind = Struct("<B")
+_int_header = Struct("<BI")
+_str_header = Struct("<BI")
+_naive_datetime = Struct("<Bq")
+_aware_datetime = Struct("<Bqq")
+_uuid = Struct("<B16s")
+
+_encoded_none = _scalar_kind.pack(_ScalarKind.none)
+_encoded_false = _scalar_kind.pack(_ScalarKind.false)
+_encoded_true = _scalar_kind.pack(_ScalarKind.true)
+
+_min_datetime = datetime(1, 1, 1)  # noqa: DTZ001
+_microsecond = timedelta(microseconds=1)
+
+
+def encoded_commits(commits: Sequence[Commit | PreparedCommit]) -> bytes:
+    chunks = [encoded_commits_magic, _header.pack(_version, len(commits))]
+
+    for commit in commits:
+        kind = (
+            _CommitKind.commit
+            if isinstance(commit, Commit)
+            else _CommitKind.prepared_commit
+        )
+        chunks.append(
+            _commit_header.pack(kind, commit.xid.bytes, len(commit.effect)),
+        )
+
+        for effect in commit.effect:
+            _write_effect(chunks, effect)
+
+    return b"".join(chunks)
+
+
+def decoded_commits(encoded: bytes) -> tuple[Commit | PreparedCommit, ...]:
+    """
+    :raises tgdb.infrastructure.commit_codec.InvalidEncodedCommitsError:
+    """
+
+    try:
+        return _Reader(memoryview(encoded)).commits()
+    except (ValueError, IndexError, struct.error) as error:
+        raise InvalidEncodedCommitsError from error
+
+
+def encoded_commit_log_segment(
+    segment: CommitLogSegment[Sequence[Commit | PreparedCommit]],
+) -> bytes:
+    header = _segment_header.pack(segment.sequence_number, segment.checkpoint)
+
+    return (
+        encoded_commit_log_segment_magic
+        + header
+        + encoded_commits(segment.batch)
+    )
+
+
+def decoded_commit_log_segment(
+    encoded: bytes,
+) -> CommitLogSegment[Sequence[Commit | PreparedCommit]]:
+    """
+    :raises tgdb.infrastructure.commit_codec.InvalidEncodedCommitsError:
+    """
+
+    magic_len = len(encoded_commit_log_segment_magic)
+    assert_(
+        encoded.startswith(encoded_commit_log_segment_magic),
+        InvalidEncodedCommitsError(),
+    )
+
+    try:
+        sequence_number, checkpoint = _segment_header.unpack_from(
+            encoded,
+            magic_len,
+        )
+    except struct.error as error:
+        raise InvalidEncodedCommitsError from error
+
+    commits = decoded_commits(encoded[magic_len + _segment_header.size :])
+
+    return CommitLogSegment(sequence_number, checkpoint, commits)
+
+
+def _write_effect(chunks: list[bytes], effect: TransactionScalarEffect) -> None:
+    match effect:
+        case NewTuple(tuple_):
+            _write_tuple(chunks, _EffectKind.new_tuple, tuple_)
+        case MutatedTuple(tuple_):
+            _write_tuple(chunks, _EffectKind.mutated_tuple, tuple_)
+        case MigratedTuple(tuple_):
+            _write_tuple(chunks, _EffectKind.migrated_tuple, tuple_)
+        case DeletedTuple(tid):
+            chunks.append(
+                _deleted_tuple.pack(_EffectKind.deleted_tuple, tid.bytes),
+            )
+
+
+def _write_tuple(chunks: list[bytes], kind: _EffectKind, tuple_: Tuple) -> None:
+    schema_id = tuple_.relation_schema_id
+
+    chunks.append(
+        _tuple_header.pack(
+            kind,
+            tuple_.tid.bytes,
+            int(schema_id.relation_number),
+            int(schema_id.relation_version_number),
+            len(tuple_.scalars),
+        ),
+    )
+    chunks.extend(_encoded_scalar(scalar) for scalar in tuple_.scalars)
+
+
+def _encoded_scalar(scalar: Scalar) -> bytes:  # noqa: PLR0911
+    match scalar:
+        case None:
+            return _encoded_none
+        case bool():
+            return _encoded_true if scalar else _encoded_false
+        case int():
+            encoded_int = scalar.to_bytes(
+                (scalar.bit_length() + 8) // 8,
+                signed=True,
+            )
+            header = _int_header.pack(_ScalarKind.int, len(encoded_int))
+            return header + encoded_int
+        case str():
+            encoded_str = scalar.encode(errors="surrogatepass")
+            header = _str_header.pack(_ScalarKind.str, len(encoded_str))
+            return header + encoded_str
+        case datetime():
+            microseconds = (
+                scalar.replace(tzinfo=None) - _min_datetime
+            ) // _microsecond
+            utcoffset = scalar.utcoffset()
+
+            if utcoffset is None:
+                return _naive_datetime.pack(
+                    _ScalarKind.naive_datetime,
+                    microseconds,
+                )
+
+            return _aware_datetime.pack(
+                _ScalarKind.aware_datetime,
+                microseconds,
+                utcoffset // _microsecond,
+            )
+        case UUID():
+            return _uuid.pack(_ScalarKind.uuid, scalar.bytes)
+
+
+@dataclass(unsafe_hash=False)
+class _Reader:
+    _encoded: memoryview
+    _offset: int = field(init=False, default=0)
+
+    def commits(self) -> tuple[Commit | PreparedCommit, ...]:
+        magic = self._bytes(len(encoded_commits_magic))
+        assert_(magic == encoded_commits_magic, ValueError)
+
+        version, commit_count = self._unpacked(_header)
+        assert_(version == _version, ValueError)
+
+        commits = tuple(self._commit() for _ in range(commit_count))
+        assert_(self._offset == len(self._encoded), ValueError)
+
+        return commits
+
+    def _commit(self) -> Commit | PreparedCommit:
+        kind, xid_bytes, effect_count = self._unpacked(_commit_header)
+        xid = UUID(bytes=xid_bytes)
+        effect = frozenset(self._effect() for _ in range(effect_count))
+
+        match _CommitKind(kind):
+            case _CommitKind.commit:
+                return Commit(xid, effect)
+            case _CommitKind.prepared_commit:
+                return PreparedCommit(xid, effect)
+
+    def _effect(self) -> TransactionScalarEffect:
+        kind = _EffectKind(self._encoded[self._offset])
+
+        if kind is _EffectKind.deleted_tuple:
+            _, tid_bytes = self._unpacked(_deleted_tuple)
+            return DeletedTuple(UUID(bytes=tid_bytes))
+
+        _, tid_bytes, relation_number, version_number, scalar_count = (
+            self._unpacked(_tuple_header)
+        )
+        tuple_ = Tuple(
+            UUID(bytes=tid_bytes),
+            RelationSchemaID(Number(relation_number), Number(version_number)),
+            tuple(self._scalar() for _ in range(scalar_count)),
+        )
+
+        match kind:
+            case _EffectKind.new_tuple:
+                return NewTuple(tuple_)
+            case _EffectKind.mutated_tuple:
+                return MutatedTuple(tuple_)
+            case _EffectKind.migrated_tuple:
+                return MigratedTuple(tuple_)
+
+    def _scalar(self) -> Scalar:  # noqa: PLR0911
+        match _ScalarKind(self._encoded[self._offset]):
+            case _ScalarKind.none:
+                self._offset += _scalar_kind.size
+                return None
+            case _ScalarKind.false:
+                self._offset += _scalar_kind.size
+                return False
+            case _ScalarKind.true:
+                self._offset += _scalar_kind.size
+                return True
+            case _ScalarKind.int:
+                _, int_len = self._unpacked(_int_header)
+                return int.from_bytes(self._bytes(int_len), signed=True)
+            case _ScalarKind.str:
+                _, str_len = self._unpacked(_str_header)
+                return str(self._bytes(str_len), errors="surrogatepass")
+            case _ScalarKind.naive_datetime:
+                _, microseconds = self._unpacked(_naive_datetime)
+                return self._datetime(microseconds)
+            case _ScalarKind.aware_datetime:
+                _, microseconds, utcoffset = self._unpacked(_aware_datetime)
+                tzinfo = timezone(utcoffset * _microsecond)
+                return self._datetime(microseconds).replace(tzinfo=tzinfo)
+            case _ScalarKind.uuid:
+                _, uuid_bytes = self._unpacked(_uuid)
+                return UUID(bytes=uuid_bytes)
+
+    def _datetime(self, microseconds: int) -> datetime:
+        return _min_datetime + microseconds * _microsecond
+
+    def _unpacked(self, struct_: Struct) -> tuple[Any, ...]:
+        values = struct_.unpack_from(self._encoded, self._offset)
+        self._offset += struct_.size
+
+        return values
+
+    def _bytes(self, len_: int) -> bytes:
+        end = self._offset + len_
+        assert_(end <= len(self._encoded), ValueError)
+
+        bytes_ = self._encoded[self._offset : end].tobytes()
+        self._offset = end
+
+        return bytes_
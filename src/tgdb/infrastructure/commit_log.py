@@ -0,0 +1,92 @@
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+
+type SequenceNumber = int
+
+
+@dataclass(frozen=True)
+class CommitLogSegment[BatchT]:
+    sequence_number: SequenceNumber
+    checkpoint: SequenceNumber
+    batch: BatchT
+
+
+@dataclass(unsafe_hash=False)
+class CommitLog[BatchT]:
+    _last_sequence_number: SequenceNumber = field(init=False, default=0)
+    _unreleased_batch_by_sequence_number: dict[SequenceNumber, BatchT] = field(
+        init=False,
+        default_factory=dict,
+    )
+    _segment_id_by_sequence_number: dict[SequenceNumber, int] = field(
+        init=False,
+        default_factory=dict,
+    )
+
+    def last_sequence_number(self) -> SequenceNumber:
+        return self._last_sequence_number
+
+    def checkpoint(self) -> SequenceNumber:
+        return (
+            min(
+                self._unreleased_batch_by_sequence_number,
+                default=self._last_sequence_number + 1,
+            )
+            - 1
+        )
+
+    def continue_from(self, sequence_number: SequenceNumber) -> None:
+        self._last_sequence_number = max(
+            self._last_sequence_number,
+            sequence_number,
+        )
+
+    def unreleased_batch_count(self) -> int:
+        return len(self._unreleased_batch_by_sequence_number)
+
+    def append(self, batch: BatchT) -> SequenceNumber:
+        self._last_sequence_number += 1
+        self._unreleased_batch_by_sequence_number[
+            self._last_sequence_number
+        ] = batch
+
+        return self._last_sequence_number
+
+    def set_segment_id(
+        self,
+        sequence_number: SequenceNumber,
+        segment_id: int,
+    ) -> None:
+        self._segment_id_by_sequence_number[sequence_number] = segment_id
+
+    def release(self, batch: BatchT) -> None:
+        for sequence_number, unreleased_batch in tuple(
+            self._unreleased_batch_by_sequence_number.items(),
+        ):
+            if unreleased_batch is batch:
+                del self._unreleased_batch_by_sequence_number[sequence_number]
+                return
+
+    def compactable_segment_ids(self) -> Sequence[int]:
+        checkpoint = self.checkpoint()
+
+        return [
+            segment_id
+            for sequence_number, segment_id in (
+                self._segment_id_by_sequence_number.items()
+            )
+            if sequence_number <= checkpoint
+            and sequence_number != self._last_sequence_number
+        ]
+
+    def compact(self, segment_ids: Sequence[int]) -> None:
+        compacted_segment_ids = frozenset(segment_ids)
+
+        self._segment_id_by_sequence_number = {
+            sequence_number: segment_id
+            for sequence_number, segment_id in (
+                self._segment_id_by_sequence_number.items()
+            )
+            if segment_id not in compacted_segment_ids
+        }
@@ -0,0 +1,98 @@
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from enum import StrEnum
+
+
+class Eviction[KeyT](ABC):
+    @abstractmethod
+    def add(self, key: KeyT, /) -> None: ...
+
+    @abstractmethod
+    def touch(self, key: KeyT, /) -> None: ...
+
+    @abstractmethod
+    def remove(self, key: KeyT, /) -> None: ...
+
+    @abstractmethod
+    def victim(self) -> KeyT | None: ...
+
+
+@dataclass(frozen=True, unsafe_hash=False)
+class LruEviction[KeyT](Eviction[KeyT]):
+    _keys: OrderedDict[KeyT, None] = field(
+        init=False,
+        default_factory=OrderedDict,
+    )
+
+    def add(self, key: KeyT, /) -> None:
+        self._keys[key] = None
+
+    def touch(self, key: KeyT, /) -> None:
+        self._keys.move_to_end(key)
+
+    def remove(self, key: KeyT, /) -> None:
+        del self._keys[key]
+
+    def victim(self) -> KeyT | None:
+        return next(iter(self._keys), None)
+
+
+@dataclass(unsafe_hash=False)
+class LfuEviction[KeyT](Eviction[KeyT]):
+    _frequency_map: dict[KeyT, int] = field(init=False, default_factory=dict)
+    _keys_by_frequency: dict[int, OrderedDict[KeyT, None]] = field(
+        init=False,
+        default_factory=dict,
+    )
+    _min_frequency: int = field(init=False, default=0)
+
+    def add(self, key: KeyT, /) -> None:
+        self._frequency_map[key] = 1
+        self._keys_by_frequency.setdefault(1, OrderedDict())[key] = None
+        self._min_frequency = 1
+
+    def touch(self, key: KeyT, /) -> None:
+        frequency = self._frequency_map[key]
+        self._remove_from_frequency(key, frequency)
+
+        self._frequency_map[key] = frequency + 1
+        self._keys_by_frequency.setdefault(frequency + 1, OrderedDict())[
+            key
+        ] = None
+
+        if self._min_frequency not in self._keys_by_frequency:
+            self._min_frequency = frequency + 1
+
+    def remove(self, key: KeyT, /) -> None:
+        frequency = self._frequency_map.pop(key)
+        self._remove_from_frequency(key, frequency)
+
+    def victim(self) -> KeyT | None:
+        if not self._frequency_map:
+            return None
+
+        if self._min_frequency not in self._keys_by_frequency:
+            self._min_frequency = min(self._keys_by_frequency)
+
+        return next(iter(self._keys_by_frequency[self._min_frequency]))
+
+    def _remove_from_frequency(self, key: KeyT, frequency: int) -> None:
+        keys = self._keys_by_frequency[frequency]
+        del keys[key]
+
+        if not keys:
+            del self._keys_by_frequency[frequency]
+
+
+class EvictionPolicy(StrEnum):
+    lru = "lru"
+    lfu = "lfu"
+
+
+def eviction[KeyT](policy: EvictionPolicy) -> Eviction[KeyT]:
+    match policy:
+        case EvictionPolicy.lru:
+            return LruEviction()
+        case EvictionPolicy.lfu:
+            return LfuEviction()
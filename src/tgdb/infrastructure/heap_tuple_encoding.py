@@ -1,5 +1,6 @@
+from collections.abc import Iterable
 from datetime import datetime, timedelta, timezone
-from enum import Enum
+from enum import Enum, StrEnum
 from uuid import UUID
 
 from tgdb.entities.numeration.number import Number
@@ -17,20 +18,32 @@ from tgdb.entities.relation.schema import Schema
 from tgdb.entities.relation.tuple import TID, Tuple
 from tgdb.infrastructure.primitive_encoding import (
     ReversibleTranslationTable,
+    compact_decoded_primitive,
+    compact_decoded_uuid,
+    compact_decoded_varuint,
+    compact_encoded_primitive,
+    compact_encoded_uuid,
+    compact_encoded_varuint,
     decoded_int,
     decoded_primitive_with_type,
     decoded_uuid,
     encoded_int,
     encoded_primitive_with_type,
-    encoded_primitive_without_type,
     encoded_uuid,
 )
 
 
 class Separator(Enum):
+    top_page = "\ufffc"
     top_tuple = "\uffff"
     top_metadata = "\ufffe"
     top_attribute = "\ufffd"
+    compact_tuple = "\ufff9"
+
+
+class HeapTupleCodec(StrEnum):
+    text = "text"
+    compact = "compact"
 
 
 heap_tuple_table = ReversibleTranslationTable({
@@ -38,19 +51,32 @@ heap_tuple_table = ReversibleTranslationTable({
 })
 
 
+type Page = tuple[Tuple, ...]
+
+
 class HeapTupleEncoding:
     @staticmethod
     def largest_tuple(
         schema: Schema,
         schema_id: RelationSchemaID,
+        codec: HeapTupleCodec = HeapTupleCodec.text,
     ) -> Tuple:
         xid, schema_id = _HeapTupleMetadataEncoding.largest_metadata(schema_id)
-        scalars = map(_HeapTupleAttributeEncoding.largest_scalar, schema)
+        scalars = (
+            _HeapTupleAttributeEncoding.largest_scalar(domain, codec)
+            for domain in schema
+        )
 
         return Tuple(xid, schema_id, tuple(scalars))
 
     @staticmethod
-    def encoded_tuple(tuple_: Tuple) -> str:
+    def encoded_tuple(
+        tuple_: Tuple,
+        codec: HeapTupleCodec = HeapTupleCodec.text,
+    ) -> str:
+        if codec is HeapTupleCodec.compact:
+            return _CompactHeapTupleEncoding.encoded_tuple(tuple_)
+
         encoded_metadata = _HeapTupleMetadataEncoding.encoded_metadata(
             int(tuple_.relation_schema_id.relation_number),
             int(tuple_.relation_schema_id.relation_version_number),
@@ -72,6 +98,9 @@ class HeapTupleEncoding:
 
     @staticmethod
     def decoded_tuple(encoded_tuple: str) -> Tuple:
+        if encoded_tuple.startswith(Separator.compact_tuple.value):
+            return _CompactHeapTupleEncoding.decoded_tuple(encoded_tuple)
+
         encoded_metadata, *encoded_attributes = encoded_tuple.split(
             Separator.top_tuple.value,
         )
@@ -85,12 +114,33 @@ class HeapTupleEncoding:
 
         return Tuple(tid, relation_schema_id, scalars)
 
+    @staticmethod
+    def encoded_page(encoded_tuples: Iterable[str]) -> str:
+        return Separator.top_page.value.join(encoded_tuples)
+
+    @staticmethod
+    def decoded_page(encoded_page: str) -> Page:
+        if not encoded_page:
+            return tuple()
+
+        encoded_tuples = encoded_page.split(Separator.top_page.value)
+
+        return tuple(map(HeapTupleEncoding.decoded_tuple, encoded_tuples))
+
     @staticmethod
     def id_of_encoded_tuple_with_attribute(
         relation_number: int,
         attribute_number: int,
         attribute_scalar: Scalar,
+        codec: HeapTupleCodec = HeapTupleCodec.text,
     ) -> str:
+        if codec is HeapTupleCodec.compact:
+            return _CompactHeapTupleEncoding.encoded_attribute(
+                relation_number,
+                attribute_number,
+                attribute_scalar,
+            )
+
         return _HeapTupleAttributeEncoding.encoded_attribute(
             relation_number,
             attribute_number,
@@ -98,7 +148,13 @@ class HeapTupleEncoding:
         )
 
     @staticmethod
-    def id_of_encoded_tuple_with_tid(tid: TID) -> str:
+    def id_of_encoded_tuple_with_tid(
+        tid: TID,
+        codec: HeapTupleCodec = HeapTupleCodec.text,
+    ) -> str:
+        if codec is HeapTupleCodec.compact:
+            return _CompactHeapTupleEncoding.id_of_encoded_tuple_with_tid(tid)
+
         return _HeapTupleMetadataEncoding.id_of_encoded_tuple_with_tid(tid)
 
 
@@ -163,10 +219,20 @@ class _HeapTupleAttributeEncoding:
         return decoded_primitive_with_type(encoded_scalar, heap_tuple_table)
 
     @staticmethod
-    def largest_scalar(domain: Domain) -> Scalar:
+    def largest_scalar(domain: Domain, codec: HeapTupleCodec) -> Scalar:
+        def encoded_len(scalar: Scalar) -> int:
+            return len(
+                HeapTupleEncoding.id_of_encoded_tuple_with_attribute(
+                    0,
+                    0,
+                    scalar,
+                    codec,
+                ),
+            )
+
         match domain:
             case IntDomain():
-                return max(domain.min, domain.max, key=lambda it: len(str(it)))
+                return max(domain.min, domain.max, key=encoded_len)
             case StrDomain():
                 return "x" * domain.max_len
             case BoolDomain():
@@ -177,9 +243,81 @@ class _HeapTupleAttributeEncoding:
             case UuidDomain():
                 return UUID(int=0)
             case tuple():
-                return max(
-                    domain,
-                    key=lambda it: (
-                        encoded_primitive_without_type(it, heap_tuple_table)
-                    ),
-                )
+                return max(domain, key=encoded_len)
+
+
+class _CompactHeapTupleEncoding:
+    @staticmethod
+    def encoded_tuple(tuple_: Tuple) -> str:
+        relation_number = int(tuple_.relation_schema_id.relation_number)
+        encoded_metadata = "".join((
+            _CompactHeapTupleEncoding.id_of_encoded_tuple_with_tid(tuple_.tid),
+            compact_encoded_varuint(
+                int(tuple_.relation_schema_id.relation_version_number),
+            ),
+            compact_encoded_varuint(relation_number),
+        ))
+        encoded_attributes = (
+            _CompactHeapTupleEncoding.encoded_attribute(
+                relation_number,
+                attribute_number,
+                tuple_[attribute_number],
+            )
+            for attribute_number in range(len(tuple_))
+        )
+
+        return Separator.top_tuple.value.join((
+            encoded_metadata,
+            *encoded_attributes,
+        ))
+
+    @staticmethod
+    def decoded_tuple(encoded_tuple: str) -> Tuple:
+        encoded_metadata, *encoded_attributes = encoded_tuple.split(
+            Separator.top_tuple.value,
+        )
+
+        tid_end = len(Separator.compact_tuple.value) + len(
+            compact_encoded_uuid(UUID(int=0)),
+        )
+        tid = compact_decoded_uuid(
+            encoded_metadata[len(Separator.compact_tuple.value) : tid_end],
+        )
+        relation_version_number, position = compact_decoded_varuint(
+            encoded_metadata,
+            tid_end,
+        )
+        relation_number, _ = compact_decoded_varuint(encoded_metadata, position)
+
+        schema_id = RelationSchemaID(
+            Number(relation_number),
+            Number(relation_version_number),
+        )
+        scalars = tuple(
+            map(_CompactHeapTupleEncoding.decoded_scalar, encoded_attributes),
+        )
+
+        return Tuple(tid, schema_id, scalars)
+
+    @staticmethod
+    def encoded_attribute(
+        relation_number: int,
+        attribute_number: int,
+        scalar: Scalar,
+    ) -> str:
+        return "".join((
+            compact_encoded_varuint(relation_number),
+            compact_encoded_varuint(attribute_number),
+            compact_encoded_primitive(scalar, heap_tuple_table),
+        ))
+
+    @staticmethod
+    def decoded_scalar(encoded_attribute: str) -> Scalar:
+        _, position = compact_decoded_varuint(encoded_attribute, 0)
+        _, position = compact_decoded_varuint(encoded_attribute, position)
+
+        return compact_decoded_primitive(encoded_attribute[position:])
+
+    @staticmethod
+    def id_of_encoded_tuple_with_tid(tid: TID) -> str:
+        return f"{Separator.compact_tuple.value}{compact_encoded_uuid(tid)}"
@@ -24,6 +24,7 @@ type ExternalValue[ValueT] = ValueT | NoExternalValue
 class LazyMap[KeyT, ValueT]:
     _cache_map_max_len: int
     _external_value: Callable[[KeyT], Awaitable[ExternalValue[ValueT]]]
+    _set_external_value: Callable[[KeyT, ValueT], object] | None = None
 
     _cache_map: OrderedDict[KeyT, ExternalValue[ValueT]] = field(
         init=False,
@@ -45,6 +46,9 @@ class LazyMap[KeyT, ValueT]:
     def __setitem__(self, key: KeyT, value: ValueT) -> None:
         self._insert_to_cache_map(key, value)
 
+        if self._set_external_value is not None:
+            self._set_external_value(key, value)
+
     def _output(self, value: ExternalValue[ValueT]) -> ValueT:
         if isinstance(value, NoExternalValue):
             raise KeyError
@@ -0,0 +1,109 @@
+from abc import ABC, abstractmethod
+from collections import deque
+from dataclasses import dataclass, field
+from math import ceil
+
+from tgdb.entities.tools.assert_ import assert_
+
+
+_observed_batch_max_count = 100
+_batch_seconds_quantile = 0.99
+_interval_smoothing = 0.1
+_min_timeout_seconds = 0.001
+
+
+class Overflow(ABC):
+    @abstractmethod
+    def len(self) -> int: ...
+
+    @abstractmethod
+    def timeout_seconds(self) -> float: ...
+
+    @abstractmethod
+    def observe_value(self, now: float) -> None: ...
+
+    @abstractmethod
+    def observe_batch(self, seconds: float) -> None: ...
+
+
+@dataclass(frozen=True)
+class FixedOverflow(Overflow):
+    _len: int
+    _timeout_seconds: float
+
+    def len(self) -> int:
+        return self._len
+
+    def timeout_seconds(self) -> float:
+        return self._timeout_seconds
+
+    def observe_value(self, now: float) -> None: ...
+
+    def observe_batch(self, seconds: float) -> None: ...
+
+
+@dataclass(unsafe_hash=False)
+class AdaptiveOverflow(Overflow):
+    _max_len: int
+    _max_timeout_seconds: float
+    _latency_target_seconds: float
+
+    _value_interval_seconds: float | None = field(init=False, default=None)
+    _last_value_time: float | None = field(init=False, default=None)
+    _batch_seconds: deque[float] = field(
+        init=False,
+        default_factory=lambda: deque(
+            maxlen=_observed_batch_max_count,
+        ),
+    )
+
+    def __post_init__(self) -> None:
+        assert_(self._max_len >= 1, ValueError)
+        assert_(self._max_timeout_seconds > 0, ValueError)
+
+    def len(self) -> int:
+        if not self._value_interval_seconds:
+            return self._max_len
+
+        expected_value_count = self.timeout_seconds() / (
+            self._value_interval_seconds
+        )
+
+        return min(self._max_len, max(1, ceil(expected_value_count)))
+
+    def timeout_seconds(self) -> float:
+        timeout_seconds = (
+            self._latency_target_seconds - self._quantile_batch_seconds()
+        )
+
+        return min(
+            self._max_timeout_seconds,
+            max(_min_timeout_seconds, timeout_seconds),
+        )
+
+    def observe_value(self, now: float) -> None:
+        if self._last_value_time is not None:
+            interval_seconds = max(0, now - self._last_value_time)
+
+            if self._value_interval_seconds is None:
+                self._value_interval_seconds = interval_seconds
+            else:
+                self._value_interval_seconds += _interval_smoothing * (
+                    interval_seconds - self._value_interval_seconds
+                )
+
+        self._last_value_time = now
+
+    def observe_batch(self, seconds: float) -> None:
+        self._batch_seconds.append(seconds)
+
+    def _quantile_batch_seconds(self) -> float:
+        if not self._batch_seconds:
+            return 0
+
+        sorted_batch_seconds = sorted(self._batch_seconds)
+        index = int(
+            _batch_seconds_quantile * (len(sorted_batch_seconds) - 1),
+        )
+
+        return sorted_batch_seconds[index]
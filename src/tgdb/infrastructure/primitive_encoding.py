@@ -1,6 +1,7 @@
 from collections.abc import Callable, Mapping
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import UTC, datetime, timedelta, timezone
+from string import digits
 from typing import Any, cast
 from uuid import UUID
 
@@ -24,6 +25,21 @@ _encoded_primitive_type_map = dict(
     ),
 )
 
+_max_digit_count = 9999
+
+_compact_digit_start = 0x4E00
+_compact_digit_bits = 14
+_compact_digit_mask = (1 << _compact_digit_bits) - 1
+_compact_varuint_digit_bits = 13
+_compact_varuint_digit_mask = (1 << _compact_varuint_digit_bits) - 1
+_compact_varuint_continuation = 1 << _compact_varuint_digit_bits
+_compact_uuid_digit_count = 10
+_compact_datetime_digit_count = 5
+_compact_utcoffset_digit_count = 2
+_min_datetime = datetime(1, 1, 1)  # noqa: DTZ001
+_max_utcoffset_seconds = 24 * 60 * 60
+_digit_complement_table = str.maketrans(digits, digits[::-1])
+
 
 @dataclass
 class ReversibleTranslationTable:
@@ -98,6 +114,51 @@ def encoded_primitive_with_type(
     return f"{header}{body}"
 
 
+def encoded_primitive_type(type_: type[Primitive]) -> str:
+    return _encoded_primitive_type_map[type_]
+
+
+def ordered_encoded_primitive(
+    primitive: Primitive,
+    table: ReversibleTranslationTable,
+) -> str:
+    header = encoded_primitive_type(type(primitive))
+
+    match primitive:
+        case bool():
+            body = encoded_bool(primitive)
+        case int():
+            body = ordered_encoded_int(primitive)
+        case str():
+            body = encoded_str(primitive, table)
+        case datetime():
+            body = ordered_encoded_datetime(primitive)
+        case None:
+            body = encoded_none()
+        case UUID():
+            body = encoded_uuid(primitive)
+
+    return f"{header}{body}"
+
+
+def ordered_encoded_int(int_: int) -> str:
+    abs_digits = str(abs(int_))
+
+    if int_ >= 0:
+        return f"1{len(abs_digits):04}{abs_digits}"
+
+    complement_digits = abs_digits.translate(_digit_complement_table)
+
+    return f"0{_max_digit_count - len(abs_digits):04}{complement_digits}"
+
+
+def ordered_encoded_datetime(datetime: datetime) -> str:
+    if datetime.tzinfo is not None:
+        datetime = datetime.astimezone(UTC).replace(tzinfo=None)
+
+    return datetime.isoformat(timespec="microseconds")
+
+
 def decoded_bool(encoded_value: str) -> bool:
     match encoded_value:
         case "1":
@@ -165,3 +226,165 @@ def decoded_primitive_without_type[PrimitiveT: Primitive](
     )
 
     return decoded_body(encoded_value)
+
+
+def compact_encoded_primitive(
+    primitive: Primitive,
+    table: ReversibleTranslationTable,
+) -> str:
+    header = encoded_primitive_type(type(primitive))
+
+    match primitive:
+        case bool():
+            body = encoded_bool(primitive)
+        case int():
+            body = compact_encoded_int(primitive)
+        case str():
+            body = encoded_str(primitive, table)
+        case datetime():
+            body = compact_encoded_datetime(primitive)
+        case None:
+            body = encoded_none()
+        case UUID():
+            body = compact_encoded_uuid(primitive)
+
+    return f"{header}{body}"
+
+
+def compact_encoded_uint(uint: int, digit_count: int) -> str:
+    digits = [
+        chr(
+            _compact_digit_start
+            + (
+                (uint >> (digit_index * _compact_digit_bits))
+                & _compact_digit_mask
+            ),
+        )
+        for digit_index in reversed(range(digit_count))
+    ]
+
+    return "".join(digits)
+
+
+def compact_decoded_uint(encoded_value: str) -> int:
+    uint = 0
+
+    for digit in encoded_value:
+        uint = (uint << _compact_digit_bits) | (
+            ord(digit) - _compact_digit_start
+        )
+
+    return uint
+
+
+def compact_encoded_varuint(varuint: int) -> str:
+    groups = [varuint & _compact_varuint_digit_mask]
+    varuint >>= _compact_varuint_digit_bits
+
+    while varuint:
+        groups.append(
+            (varuint & _compact_varuint_digit_mask)
+            | _compact_varuint_continuation,
+        )
+        varuint >>= _compact_varuint_digit_bits
+
+    return "".join(
+        chr(_compact_digit_start + group) for group in reversed(groups)
+    )
+
+
+def compact_decoded_varuint(
+    encoded_value: str,
+    position: int,
+) -> tuple[int, int]:
+    varuint = 0
+
+    while True:
+        group = ord(encoded_value[position]) - _compact_digit_start
+        position += 1
+        varuint = (varuint << _compact_varuint_digit_bits) | (
+            group & _compact_varuint_digit_mask
+        )
+
+        if not group & _compact_varuint_continuation:
+            return varuint, position
+
+
+def compact_encoded_int(int_: int) -> str:
+    return compact_encoded_varuint(_zigzag_encoded_int(int_))
+
+
+def compact_decoded_int(encoded_value: str) -> int:
+    varuint, _ = compact_decoded_varuint(encoded_value, 0)
+    return _zigzag_decoded_int(varuint)
+
+
+def compact_encoded_uuid(uuid: UUID) -> str:
+    return compact_encoded_uint(uuid.int, _compact_uuid_digit_count)
+
+
+def compact_decoded_uuid(encoded_value: str) -> UUID:
+    return UUID(int=compact_decoded_uint(encoded_value))
+
+
+def compact_encoded_datetime(datetime_: datetime) -> str:
+    wall_datetime = datetime_.replace(tzinfo=None)
+    microseconds = (wall_datetime - _min_datetime) // timedelta(microseconds=1)
+    utcoffset = datetime_.utcoffset()
+
+    if utcoffset is None:
+        encoded_utcoffset = 0
+    else:
+        encoded_utcoffset = (
+            int(utcoffset.total_seconds()) + _max_utcoffset_seconds
+        )
+
+    return compact_encoded_uint(
+        microseconds,
+        _compact_datetime_digit_count,
+    ) + compact_encoded_uint(encoded_utcoffset, _compact_utcoffset_digit_count)
+
+
+def compact_decoded_datetime(encoded_value: str) -> datetime:
+    encoded_microseconds = encoded_value[:_compact_datetime_digit_count]
+    encoded_utcoffset = encoded_value[_compact_datetime_digit_count:]
+
+    microseconds = compact_decoded_uint(encoded_microseconds)
+    utcoffset = compact_decoded_uint(encoded_utcoffset)
+
+    datetime_ = _min_datetime + timedelta(microseconds=microseconds)
+
+    if not utcoffset:
+        return datetime_
+
+    utcoffset_seconds = utcoffset - _max_utcoffset_seconds
+    tzinfo = timezone(timedelta(seconds=utcoffset_seconds))
+
+    return datetime_.replace(tzinfo=tzinfo)
+
+
+_compact_decoded_body_func_by_type = _decoded_body_func_by_type | {
+    int: compact_decoded_int,
+    datetime: compact_decoded_datetime,
+    UUID: compact_decoded_uuid,
+}
+
+
+def compact_decoded_primitive(encoded_value: str) -> Primitive:
+    header = encoded_value[0]
+    body = encoded_value[1:]
+
+    decoded_primitive_type = _decoded_primitive_type_map[header]
+    decoded_body_func = _compact_decoded_body_func_by_type[
+        decoded_primitive_type
+    ]
+
+    return decoded_body_func(body)
+
+
+def _zigzag_encoded_int(int_: int) -> int:
+    return int_ * 2 if int_ >= 0 else -int_ * 2 - 1
+
+
+def _zigzag_decoded_int(uint: int) -> int:
+    return uint // 2 if uint % 2 == 0 else -(uint + 1) // 2
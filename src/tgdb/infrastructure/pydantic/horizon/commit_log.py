@@ -0,0 +1,12 @@
+from pydantic import BaseModel
+
+from tgdb.infrastructure.pydantic.horizon.commit import (
+    EncodableCommit,
+    EncodablePreparedCommit,
+)
+
+
+class EncodableCommitLogSegment(BaseModel):
+    sequence_number: int
+    checkpoint: int
+    commits: tuple[EncodableCommit | EncodablePreparedCommit, ...]
@@ -3,6 +3,10 @@ from pathlib import Path
 import yaml
 from pydantic import BaseModel, Field
 
+from tgdb.infrastructure.blob_compression import BlobCompression
+from tgdb.infrastructure.eviction import EvictionPolicy
+from tgdb.infrastructure.heap_tuple_encoding import HeapTupleCodec
+
 
 class UvicornConfig(BaseModel):
     host: str
@@ -17,6 +21,10 @@ class APIConfig(BaseModel):
 class ClientsConfig(BaseModel):
     bots: Path
     userbots: Path
+    calls_per_second: float = 20
+    call_burst: float = 20
+    initial_concurrency: float = 8
+    max_concurrency: float = 64
 
 
 class TransactionConfig(BaseModel):
@@ -26,23 +34,41 @@ class TransactionConfig(BaseModel):
 class HorizonConfig(BaseModel):
     max_len: int
     transaction: TransactionConfig
+    shard_count: int = 1
 
 
 class MessageCacheConfig(BaseModel):
     max_len: int
+    log: Path | None = None
+
+
+class TupleCacheConfig(BaseModel):
+    max_size_bytes: int
+    eviction: EvictionPolicy = EvictionPolicy.lru
 
 
 class PageConfig(BaseModel):
     max_fullness: float
+    packing: bool = False
+    codec: HeapTupleCodec = HeapTupleCodec.text
+    migrated_codec: HeapTupleCodec | None = None
+
+    def codecs(self) -> tuple[HeapTupleCodec, ...]:
+        if self.migrated_codec is None or self.migrated_codec is self.codec:
+            return (self.codec,)
+
+        return (self.codec, self.migrated_codec)
 
 
 class HeapConfig(BaseModel):
     chat: int
     page: PageConfig
+    attribute_index: Path | None = None
 
 
 class RelationsConfig(BaseModel):
     chat: int
+    compression: BlobCompression = BlobCompression.none
 
 
 class OverflowConfig(BaseModel):
@@ -50,9 +76,16 @@ class OverflowConfig(BaseModel):
     timeout_seconds: int | float
 
 
+class AdaptiveOverflowConfig(BaseModel):
+    latency_target_seconds: float
+
+
 class BufferConfig(BaseModel):
     chat: int
     overflow: OverflowConfig
+    adaptive_overflow: AdaptiveOverflowConfig | None = None
+    compression: BlobCompression = BlobCompression.none
+    pipeline_depth: int = 2
 
 
 class TgdbConfig(BaseModel):
@@ -61,6 +94,7 @@ class TgdbConfig(BaseModel):
     clients: ClientsConfig
     horizon: HorizonConfig
     message_cache: MessageCacheConfig
+    tuple_cache: TupleCacheConfig | None = None
     heap: HeapConfig
     relations: RelationsConfig
     buffer: BufferConfig
@@ -0,0 +1,397 @@
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Iterator, Sequence
+from contextlib import AbstractContextManager
+from dataclasses import dataclass, field
+from enum import IntEnum
+from pathlib import Path
+from struct import Struct
+from types import TracebackType
+from typing import BinaryIO, ClassVar, Self
+
+from tgdb.entities.numeration.number import Number
+from tgdb.entities.relation.predicate import (
+    AttributePredicate,
+    Bound,
+    EqualityPredicate,
+    PrefixPredicate,
+    RangePredicate,
+)
+from tgdb.entities.relation.scalar import Scalar
+from tgdb.infrastructure.heap_tuple_encoding import (
+    Page,
+    Separator,
+    heap_tuple_table,
+)
+from tgdb.infrastructure.primitive_encoding import (
+    encoded_int,
+    encoded_primitive_type,
+    ordered_encoded_primitive,
+)
+from tgdb.infrastructure.telethon.index import MessageID
+
+
+class _RecordKind(IntEnum):
+    relation = 0
+    page = 1
+    clean_exit = 2
+
+
+type _Record = tuple[_RecordKind, int, frozenset[str]]
+
+
+@dataclass(unsafe_hash=False)
+class AttributeIndex(AbstractContextManager["AttributeIndex"]):
+    _path: Path
+    _relation_numbers: set[int] = field(init=False, default_factory=set)
+    _message_ids_by_attribute_id: dict[str, set[MessageID]] = field(
+        init=False,
+        default_factory=dict,
+    )
+    _attribute_ids_by_message_id: dict[MessageID, frozenset[str]] = field(
+        init=False,
+        default_factory=dict,
+    )
+    _sorted_attribute_ids: list[str] = field(init=False, default_factory=list)
+    _is_sorting: bool = field(init=False, default=False)
+    _is_dirty: bool = field(init=False, default=False)
+    _file: BinaryIO | None = field(init=False, default=None)
+    _record_count: int = field(init=False, default=0)
+
+    _record_header: ClassVar = Struct("<BqI")
+    _compaction_ratio: ClassVar = 2
+
+    def __enter__(self) -> Self:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._path.touch()
+
+        size = 0
+        last_record_kind = _RecordKind.clean_exit
+
+        for record, record_end in self._loaded_records():
+            last_record_kind = record[0]
+
+            if last_record_kind is not _RecordKind.clean_exit:
+                self._apply(record)
+                self._record_count += 1
+                size = record_end
+
+        self._truncate(size)
+
+        if last_record_kind is not _RecordKind.clean_exit:
+            self._is_dirty = True
+            self._attribute_ids_by_message_id.clear()
+            self._message_ids_by_attribute_id.clear()
+            self._compact()
+
+        live_record_count = len(self._relation_numbers) + len(
+            self._attribute_ids_by_message_id,
+        )
+
+        if self._record_count > live_record_count * self._compaction_ratio:
+            self._compact()
+
+        self._sorted_attribute_ids = sorted(self._message_ids_by_attribute_id)
+        self._is_sorting = True
+
+        self._file = self._path.open("ab", buffering=0)
+        return self
+
+    def __exit__(
+        self,
+        error_type: type[BaseException] | None,
+        error: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if self._file is None:
+            return
+
+        if error_type is None and not self._is_dirty:
+            self._file.write(
+                self._encoded_record(
+                    (_RecordKind.clean_exit, 0, frozenset()),
+                ),
+            )
+
+        self._file.close()
+        self._file = None
+
+    def is_dirty(self) -> bool:
+        return self._is_dirty
+
+    def mark_rebuilt(self) -> None:
+        self._is_dirty = False
+
+    def add_relation(self, relation_number: Number) -> None:
+        if int(relation_number) in self._relation_numbers:
+            return
+
+        self._write((_RecordKind.relation, int(relation_number), frozenset()))
+
+    def add_existing_relation(self, relation_number: Number) -> None:
+        if int(relation_number) in self._relation_numbers:
+            return
+
+        self._is_dirty = True
+        self.add_relation(relation_number)
+
+    def is_relation_indexed(self, relation_number: Number) -> bool:
+        return (
+            not self._is_dirty
+            and int(relation_number) in self._relation_numbers
+        )
+
+    def message_ids(
+        self,
+        relation_number: Number,
+        attribute_number: Number,
+        attribute_scalar: Scalar,
+    ) -> Sequence[MessageID]:
+        return self.message_ids_with_predicate(
+            relation_number,
+            EqualityPredicate(attribute_number, attribute_scalar),
+        )
+
+    def message_ids_with_predicate(
+        self,
+        relation_number: Number,
+        predicate: AttributePredicate,
+    ) -> Sequence[MessageID]:
+        message_ids = {
+            message_id
+            for attribute_id in self._attribute_ids(relation_number, predicate)
+            for message_id in self._message_ids_by_attribute_id[attribute_id]
+        }
+
+        return sorted(message_ids)
+
+    def set_page(self, message_id: MessageID, page: Page) -> None:
+        attribute_ids = frozenset(
+            _attribute_id(
+                int(tuple_.relation_schema_id.relation_number),
+                attribute_number,
+                tuple_[attribute_number],
+            )
+            for tuple_ in page
+            if int(tuple_.relation_schema_id.relation_number)
+            in self._relation_numbers
+            for attribute_number in range(len(tuple_))
+        )
+
+        previous_attribute_ids = self._attribute_ids_by_message_id.get(
+            message_id,
+            frozenset(),
+        )
+
+        if previous_attribute_ids == attribute_ids:
+            return
+
+        self._write((_RecordKind.page, message_id, attribute_ids))
+
+    def _apply(self, record: _Record) -> None:
+        kind, number, attribute_ids = record
+
+        if kind is _RecordKind.relation:
+            self._relation_numbers.add(number)
+            return
+
+        previous_attribute_ids = self._attribute_ids_by_message_id.pop(
+            number,
+            frozenset(),
+        )
+
+        for attribute_id in previous_attribute_ids:
+            message_ids = self._message_ids_by_attribute_id[attribute_id]
+            message_ids.discard(number)
+
+            if not message_ids:
+                del self._message_ids_by_attribute_id[attribute_id]
+                self._remove_sorted_attribute_id(attribute_id)
+
+        if not attribute_ids:
+            return
+
+        self._attribute_ids_by_message_id[number] = attribute_ids
+
+        for attribute_id in attribute_ids:
+            if attribute_id not in self._message_ids_by_attribute_id:
+                self._message_ids_by_attribute_id[attribute_id] = set()
+                self._add_sorted_attribute_id(attribute_id)
+
+            self._message_ids_by_attribute_id[attribute_id].add(number)
+
+    def _add_sorted_attribute_id(self, attribute_id: str) -> None:
+        if self._is_sorting:
+            insort(self._sorted_attribute_ids, attribute_id)
+
+    def _remove_sorted_attribute_id(self, attribute_id: str) -> None:
+        if self._is_sorting:
+            index = bisect_left(self._sorted_attribute_ids, attribute_id)
+            del self._sorted_attribute_ids[index]
+
+    def _attribute_ids(
+        self,
+        relation_number: Number,
+        predicate: AttributePredicate,
+    ) -> Iterator[str]:
+        match predicate:
+            case EqualityPredicate(attribute_number, scalar):
+                attribute_id = _attribute_id(
+                    int(relation_number),
+                    int(attribute_number),
+                    scalar,
+                )
+
+                if attribute_id in self._message_ids_by_attribute_id:
+                    yield attribute_id
+
+            case PrefixPredicate(attribute_number, prefix):
+                attribute_id_prefix = _attribute_id(
+                    int(relation_number),
+                    int(attribute_number),
+                    prefix,
+                )
+                yield from self._sorted_attribute_ids_in_range(
+                    attribute_id_prefix,
+                    None,
+                    None,
+                )
+
+            case RangePredicate(attribute_number, lower_bound, upper_bound):
+                attribute_id_prefix = _attribute_id_prefix(
+                    int(relation_number),
+                    int(attribute_number),
+                    predicate.scalar_type(),
+                )
+                yield from self._sorted_attribute_ids_in_range(
+                    attribute_id_prefix,
+                    lower_bound,
+                    upper_bound,
+                )
+
+    def _sorted_attribute_ids_in_range(
+        self,
+        attribute_id_prefix: str,
+        lower_bound: Bound | None,
+        upper_bound: Bound | None,
+    ) -> Iterator[str]:
+        ids = self._sorted_attribute_ids
+
+        if lower_bound is None:
+            start = bisect_left(ids, attribute_id_prefix)
+        else:
+            lower_id = attribute_id_prefix + _encoded_body(lower_bound.scalar)
+            bisect = bisect_left if lower_bound.is_inclusive else bisect_right
+            start = bisect(ids, lower_id)
+
+        if upper_bound is None:
+            end = len(ids)
+        else:
+            upper_id = attribute_id_prefix + _encoded_body(upper_bound.scalar)
+            bisect = bisect_right if upper_bound.is_inclusive else bisect_left
+            end = bisect(ids, upper_id)
+
+        for attribute_id in ids[start:end]:
+            if not attribute_id.startswith(attribute_id_prefix):
+                return
+
+            yield attribute_id
+
+    def _write(self, record: _Record) -> None:
+        self._apply(record)
+
+        if self._file is not None:
+            self._file.write(self._encoded_record(record))
+            self._record_count += 1
+
+    def _loaded_records(self) -> Iterator[tuple[_Record, int]]:
+        with self._path.open("rb") as file:
+            while True:
+                header = file.read(self._record_header.size)
+
+                if len(header) < self._record_header.size:
+                    return
+
+                kind, number, body_len = self._record_header.unpack(header)
+                body = file.read(body_len)
+
+                if len(body) < body_len:
+                    return
+
+                attribute_ids = self._decoded_attribute_ids(body)
+
+                yield (_RecordKind(kind), number, attribute_ids), file.tell()
+
+    def _truncate(self, size: int) -> None:
+        if self._path.stat().st_size > size:
+            with self._path.open("r+b") as file:
+                file.truncate(size)
+
+    def _compact(self) -> None:
+        compacted_path = self._path.with_suffix(".compacted")
+
+        with compacted_path.open("wb") as file:
+            for relation_number in self._relation_numbers:
+                file.write(
+                    self._encoded_record(
+                        (_RecordKind.relation, relation_number, frozenset()),
+                    ),
+                )
+
+            for (
+                message_id,
+                attribute_ids,
+            ) in self._attribute_ids_by_message_id.items():
+                file.write(
+                    self._encoded_record(
+                        (_RecordKind.page, message_id, attribute_ids),
+                    ),
+                )
+
+        compacted_path.replace(self._path)
+        self._record_count = len(self._relation_numbers) + len(
+            self._attribute_ids_by_message_id,
+        )
+
+    def _encoded_record(self, record: _Record) -> bytes:
+        kind, number, attribute_ids = record
+        encoded_attribute_ids = Separator.top_page.value.join(attribute_ids)
+        body = encoded_attribute_ids.encode(errors="surrogatepass")
+        header: bytes = self._record_header.pack(kind, number, len(body))
+
+        return header + body
+
+    def _decoded_attribute_ids(self, body: bytes) -> frozenset[str]:
+        if not body:
+            return frozenset()
+
+        encoded_attribute_ids = body.decode(errors="surrogatepass")
+
+        return frozenset(encoded_attribute_ids.split(Separator.top_page.value))
+
+
+def _attribute_id(
+    relation_number: int,
+    attribute_number: int,
+    scalar: Scalar,
+) -> str:
+    return Separator.top_attribute.value.join((
+        encoded_int(relation_number),
+        encoded_int(attribute_number),
+        ordered_encoded_primitive(scalar, heap_tuple_table),
+    ))
+
+
+def _attribute_id_prefix(
+    relation_number: int,
+    attribute_number: int,
+    scalar_type: type[Scalar],
+) -> str:
+    return Separator.top_attribute.value.join((
+        encoded_int(relation_number),
+        encoded_int(attribute_number),
+        encoded_primitive_type(scalar_type),
+    ))
+
+
+def _encoded_body(scalar: Scalar) -> str:
+    return ordered_encoded_primitive(scalar, heap_tuple_table)[1:]
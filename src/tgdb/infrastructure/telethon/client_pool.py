@@ -1,30 +1,125 @@
-from asyncio import gather
-from collections import deque
-from collections.abc import Iterator
+from asyncio import gather, sleep
+from collections.abc import Awaitable, Callable, Iterator, Sequence
 from contextlib import AbstractAsyncContextManager
 from dataclasses import dataclass, field
+from enum import StrEnum
 from pathlib import Path
+from time import monotonic
 from types import TracebackType
 from typing import Self, cast
 from warnings import filterwarnings
 
 from telethon import TelegramClient
+from telethon.errors import FloodWaitError
 from telethon.types import InputPeerUser
 
+from tgdb.entities.tools.assert_ import assert_
+from tgdb.infrastructure.aimd_concurrency import AimdConcurrency
 from tgdb.infrastructure.telethon.string_session_without_entites import (
     StringSessionWithoutEntites,
 )
+from tgdb.infrastructure.token_bucket import TokenBucket
+
+
+class TelegramCallKind(StrEnum):
+    insert = "insert"
+    edit = "edit"
+    delete = "delete"
+    search = "search"
+
+
+@dataclass(frozen=True)
+class TelegramClientUtilization:
+    client_id: int | None
+    in_flight_call_count: int
+    call_count: int
+    flood_wait_count: int
+    available_call_count: float
+    parked_seconds: float
+
+
+@dataclass(unsafe_hash=False)
+class _ClientState:
+    client: TelegramClient
+    bucket: TokenBucket
+    client_id: int | None = None
+    in_flight_call_count: int = 0
+    call_count: int = 0
+    flood_wait_count: int = 0
+    parked_until: float = 0
+
+    def is_eligible(self, now: float) -> bool:
+        return self.parked_until <= now and self.bucket.tokens(now) >= 1
+
+    def seconds_until_eligible(self, now: float) -> float:
+        parked_seconds = max(0, self.parked_until - now)
+        token_seconds = self.bucket.seconds_until_token(
+            max(now, self.parked_until),
+        )
+
+        return parked_seconds + token_seconds
+
+    def load(self, now: float) -> tuple[int, float, int]:
+        return (
+            self.in_flight_call_count,
+            -self.bucket.tokens(now),
+            self.call_count,
+        )
+
+    def utilization(self, now: float) -> TelegramClientUtilization:
+        return TelegramClientUtilization(
+            client_id=self.client_id,
+            in_flight_call_count=self.in_flight_call_count,
+            call_count=self.call_count,
+            flood_wait_count=self.flood_wait_count,
+            available_call_count=self.bucket.tokens(now),
+            parked_seconds=max(0, self.parked_until - now),
+        )
 
 
 @dataclass(frozen=True, unsafe_hash=False)
 class TelegramClientPool(AbstractAsyncContextManager["TelegramClientPool"]):
-    _clients: deque[TelegramClient]
+    _clients: Sequence[TelegramClient]
+    _calls_per_second: float = 20
+    _call_burst: float = 20
+    _initial_concurrency: float = 8
+    _max_concurrency: float = 64
+    _latency_threshold_seconds: float = 2
+    _clock: Callable[[], float] = monotonic
 
-    _client_by_id: dict[int, TelegramClient] = field(
+    _states: list[_ClientState] = field(init=False, default_factory=list)
+    _state_by_id: dict[int, _ClientState] = field(
+        init=False,
+        default_factory=dict,
+    )
+    _concurrency_by_kind: dict[TelegramCallKind, AimdConcurrency] = field(
         init=False,
         default_factory=dict,
     )
 
+    def __post_init__(self) -> None:
+        assert_(bool(self._clients), ValueError)
+
+        now = self._clock()
+        self._states.extend(
+            _ClientState(
+                client,
+                TokenBucket(self._calls_per_second, self._call_burst, now),
+            )
+            for client in self._clients
+        )
+        self._concurrency_by_kind.update(
+            (
+                kind,
+                AimdConcurrency(
+                    self._initial_concurrency,
+                    self._max_concurrency,
+                    self._latency_threshold_seconds,
+                ),
+            )
+            for kind in TelegramCallKind
+        )
+
     async def __aenter__(self) -> Self:
         await gather(
             *(
@@ -33,14 +128,14 @@ class TelegramClientPool(AbstractAsyncContextManager["TelegramClientPool"]):
             ),
         )
 
-        for client in self._clients:
+        for state in self._states:
             client_info = cast(
                 InputPeerUser,
-                await client.get_me(input_peer=True),
+                await state.client.get_me(input_peer=True),
             )
-            client_id = client_info.user_id
+            state.client_id = client_info.user_id
 
-            self._client_by_id[client_id] = client
+            self._state_by_id[state.client_id] = state
 
         return self
 
@@ -58,36 +153,123 @@ class TelegramClientPool(AbstractAsyncContextManager["TelegramClientPool"]):
         )
 
     def __call__(self, client_id: int | None = None) -> TelegramClient:
-        if client_id is None:
-            client = self._clients.pop()
-            self._clients.appendleft(client)
+        now = self._clock()
+        state = self._scheduled_state(client_id, now)
+        state.bucket.take(now)
+        state.call_count += 1
+        state.in_flight_call_count += 1
 
-            return client
+        return state.client
 
-        client = self._client_by_id[client_id]
-
-        self._clients.remove(client)
-        self._clients.appendleft(client)
-
-        return client
+    def release(self, client: TelegramClient) -> None:
+        for state in self._states:
+            if state.client is client:
+                state.in_flight_call_count -= 1
+                return
 
     def __iter__(self) -> Iterator[TelegramClient]:
         while True:
             yield self()
 
+    async def run[ResultT](
+        self,
+        kind: TelegramCallKind,
+        operation: Callable[[TelegramClient], Awaitable[ResultT]],
+        client_id: int | None = None,
+    ) -> ResultT:
+        concurrency = self._concurrency_by_kind[kind]
+
+        while True:
+            acquisition_number = await concurrency.acquire()
+            latency_seconds = 0.0
+            is_overloaded = False
+
+            try:
+                state = await self._acquired_state(client_id)
+                started_at = self._clock()
+
+                try:
+                    return await operation(state.client)
+                except FloodWaitError as error:
+                    is_overloaded = True
+                    state.flood_wait_count += 1
+                    state.parked_until = max(
+                        state.parked_until,
+                        self._clock() + error.seconds,
+                    )
+                finally:
+                    latency_seconds = self._clock() - started_at
+                    state.in_flight_call_count -= 1
+            finally:
+                concurrency.release(
+                    acquisition_number,
+                    latency_seconds,
+                    is_overloaded=is_overloaded,
+                )
+
+    def concurrency_window(self, kind: TelegramCallKind) -> float:
+        return self._concurrency_by_kind[kind].window()
+
+    def utilization(self) -> tuple[TelegramClientUtilization, ...]:
+        now = self._clock()
+
+        return tuple(state.utilization(now) for state in self._states)
+
+    async def _acquired_state(self, client_id: int | None) -> _ClientState:
+        while True:
+            now = self._clock()
+            state = self._scheduled_state(client_id, now)
+
+            if state.is_eligible(now):
+                state.bucket.take(now)
+                state.call_count += 1
+                state.in_flight_call_count += 1
+
+                return state
+
+            await sleep(state.seconds_until_eligible(now))
+
+    def _scheduled_state(
+        self,
+        client_id: int | None,
+        now: float,
+    ) -> _ClientState:
+        if client_id is not None:
+            return self._state_by_id[client_id]
+
+        eligible_states = [
+            state for state in self._states if state.is_eligible(now)
+        ]
+
+        if eligible_states:
+            return min(eligible_states, key=lambda state: state.load(now))
+
+        return min(
+            self._states,
+            key=lambda state: state.seconds_until_eligible(now),
+        )
+
 
-def loaded_client_pool_from_farm_file(
+def loaded_client_pool_from_farm_file(  # noqa: PLR0913, PLR0917
     farm_file_path: Path,
     app_api_id: int,
     app_api_hash: str,
+    calls_per_second: float = 20,
+    call_burst: float = 20,
+    initial_concurrency: float = 8,
+    max_concurrency: float = 64,
 ) -> TelegramClientPool:
     with farm_file_path.open() as farm_file:
         return TelegramClientPool(
-            deque(
+            tuple(
                 pool_client(session_token, app_api_id, app_api_hash)
                 for session_token in map(_clean_line, farm_file)
                 if session_token
             ),
+            calls_per_second,
+            call_burst,
+            initial_concurrency,
+            max_concurrency,
         )
 
 
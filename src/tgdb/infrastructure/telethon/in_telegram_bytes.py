@@ -1,3 +1,4 @@
+from asyncio import to_thread
 from collections.abc import Awaitable, Generator
 from dataclasses import dataclass
 from io import BytesIO
@@ -5,7 +6,16 @@ from typing import Any, cast
 
 from telethon.hints import TotalList
 
-from tgdb.infrastructure.telethon.client_pool import TelegramClientPool
+from tgdb.infrastructure.blob_compression import (
+    BlobCompression,
+    assert_blob_compression_available,
+    compressed_blob,
+    decompressed_blob,
+)
+from tgdb.infrastructure.telethon.client_pool import (
+    TelegramCallKind,
+    TelegramClientPool,
+)
 
 
 @dataclass
@@ -13,17 +23,26 @@ class InTelegramBytes(Awaitable[bytes | None]):
     _pool_to_insert: TelegramClientPool
     _pool_to_select: TelegramClientPool
     _chat_id: int
+    _compression: BlobCompression = BlobCompression.none
+
+    def __post_init__(self) -> None:
+        assert_blob_compression_available(self._compression)
 
     def __await__(self) -> Generator[Any, Any, bytes | None]:
         return self._get().__await__()
 
     async def set(self, bytes_: bytes) -> None:
-        await self._pool_to_insert().send_message(self._chat_id, file=bytes_)
+        blob = await to_thread(compressed_blob, bytes_, self._compression)
+
+        await self._pool_to_insert.run(
+            TelegramCallKind.insert,
+            lambda client: client.send_message(self._chat_id, file=blob),
+        )
 
     async def _get(self) -> bytes | None:
-        messages = await self._pool_to_select().get_messages(
-            self._chat_id,
-            min_id=1,
+        messages = await self._pool_to_select.run(
+            TelegramCallKind.search,
+            lambda client: client.get_messages(self._chat_id, min_id=1),
         )
         messages = cast(TotalList, messages)
 
@@ -33,5 +52,8 @@ class InTelegramBytes(Awaitable[bytes | None]):
         last_message = messages[-1]
 
         with BytesIO() as stream:
-            await self._pool_to_select().download_file(last_message, stream)
-            return stream.getvalue()
+            await self._pool_to_select.run(
+                TelegramCallKind.search,
+                lambda client: client.download_file(last_message, stream),
+            )
+            return decompressed_blob(stream.getvalue())
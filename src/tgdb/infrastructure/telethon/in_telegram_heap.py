@@ -1,19 +1,47 @@
-from collections.abc import Sequence
+from asyncio import gather
+from collections.abc import AsyncIterator, Iterable, Mapping, Sequence
 from dataclasses import dataclass
+from datetime import datetime
+from itertools import batched, starmap
 from typing import ClassVar, cast
+from uuid import UUID
 
 from telethon.hints import TotalList
-
+from telethon.tl.types import Message
+
+from tgdb.application.relation.ports.tuples import (
+    TupleAccess,
+    TupleChunk,
+    TupleCursor,
+    TuplePlan,
+    UnindexedPredicateError,
+)
 from tgdb.entities.numeration.number import Number
+from tgdb.entities.relation.predicate import (
+    AttributePredicate,
+    EqualityPredicate,
+    Predicate,
+    conjuncts,
+)
 from tgdb.entities.relation.relation import Relation
 from tgdb.entities.relation.scalar import Scalar
 from tgdb.entities.relation.tuple import TID, Tuple
 from tgdb.entities.tools.assert_ import assert_
-from tgdb.infrastructure.heap_tuple_encoding import HeapTupleEncoding
+from tgdb.infrastructure.heap_tuple_encoding import (
+    HeapTupleCodec,
+    HeapTupleEncoding,
+    Page,
+)
 from tgdb.infrastructure.lazy_map import LazyMap
-from tgdb.infrastructure.telethon.client_pool import TelegramClientPool
+from tgdb.infrastructure.telethon.attribute_index import AttributeIndex
+from tgdb.infrastructure.telethon.client_pool import (
+    TelegramCallKind,
+    TelegramClientPool,
+)
 from tgdb.infrastructure.telethon.index import (
+    MessageID,
     MessageIndex,
+    PageIndex,
     TupleIndex,
     message_index,
 )
@@ -24,6 +52,9 @@ class UnacceptableTupleError(Exception):
     encoded_tuple_len: int
 
 
+type _EncodedPage = tuple[Page, str]
+
+
 @dataclass(frozen=True, unsafe_hash=False)
 class InTelegramHeap:
     _pool_to_insert: TelegramClientPool
@@ -33,8 +64,14 @@ class InTelegramHeap:
     _heap_id: int
     _encoded_tuple_max_len: int
     _index_map: LazyMap[TupleIndex, MessageIndex | None]
+    _page_map: LazyMap[PageIndex, Page | None]
+    _is_packing: bool
+    _attribute_index: AttributeIndex | None
+    _codecs: tuple[HeapTupleCodec, ...] = (HeapTupleCodec.text,)
 
     _page_len: ClassVar = 4000
+    _deleted_message_batch_max_len: ClassVar = 100
+    _fetched_page_batch_max_len: ClassVar = 100
 
     @staticmethod
     def encoded_tuple_max_len(page_max_fullness: float) -> int:
@@ -48,6 +85,7 @@ class InTelegramHeap:
             self._encoded_tuple_max_len <= InTelegramHeap._page_len,
             ValueError,
         )
+        assert_(bool(self._codecs), ValueError)
 
     def tuple_max_len(self) -> int:
         return self._encoded_tuple_max_len
@@ -57,7 +95,10 @@ class InTelegramHeap:
         :raises tgdb.infrastructure.telethon.in_telegram_heap.UnacceptableTupleError:
         """  # noqa: E501
 
-        encoded_largest_tuple = HeapTupleEncoding.encoded_tuple(tuple_)
+        encoded_largest_tuple = HeapTupleEncoding.encoded_tuple(
+            tuple_,
+            self._codec(),
+        )
 
         if len(encoded_largest_tuple) > self._encoded_tuple_max_len:
             raise UnacceptableTupleError(len(encoded_largest_tuple))
@@ -70,76 +111,565 @@ class InTelegramHeap:
         schema = relation.last_version().schema
         schema_id = relation.last_version_schema_id()
 
-        largest_tuple = HeapTupleEncoding.largest_tuple(schema, schema_id)
+        largest_tuple = HeapTupleEncoding.largest_tuple(
+            schema,
+            schema_id,
+            self._codec(),
+        )
 
         self.assert_can_accept_tuple(largest_tuple)
 
+    async def rebuild_dirty_attribute_index(
+        self,
+        relation_numbers: Iterable[Number],
+    ) -> None:
+        if self._attribute_index is None:
+            return
+
+        for relation_number in relation_numbers:
+            self._attribute_index.add_existing_relation(relation_number)
+
+        if not self._attribute_index.is_dirty():
+            return
+
+        async for message in self._messages(None, 0):
+            page = HeapTupleEncoding.decoded_page(message.text)  # type: ignore[attr-defined]
+            self._attribute_index.set_page(message.id, page)
+
+        self._attribute_index.mark_rebuilt()
+
+    def track_relation(self, relation: Relation) -> None:
+        if self._attribute_index is not None:
+            self._attribute_index.add_relation(relation.number())
+
+    async def tuples_with_tids(self, tids: Sequence[TID]) -> Sequence[Tuple]:
+        message_indexes = await gather(
+            *(self._index_map[self._heap_id, tid] for tid in tids),
+        )
+        message_ids = tuple(
+            {
+                message_index_[0]: None
+                for message_index_ in message_indexes
+                if message_index_ is not None
+            },
+        )
+        pages = await gather(
+            *(
+                self._page_map[self._heap_id, message_id]
+                for message_id in message_ids
+            ),
+        )
+        tid_set = frozenset(tids)
+
+        return tuple(
+            tuple_
+            for page in pages
+            if page is not None
+            for tuple_ in page
+            if tuple_.tid in tid_set
+        )
+
     async def tuples_with_attribute(
         self,
         relation_number: Number,
         attribute_number: Number,
         attribute_scalar: Scalar,
     ) -> Sequence[Tuple]:
-        search = HeapTupleEncoding.id_of_encoded_tuple_with_attribute(
-            int(relation_number),
-            int(attribute_number),
-            attribute_scalar,
+        return await self.tuples_with_predicate(
+            relation_number,
+            EqualityPredicate(attribute_number, attribute_scalar),
         )
 
-        messages = await self._pool_to_select().get_messages(
-            self._heap_id,
-            search=search,
-            reverse=True,
+    async def tuples_with_predicate(
+        self,
+        relation_number: Number,
+        predicate: Predicate,
+    ) -> Sequence[Tuple]:
+        chunks = self.tuple_chunks(relation_number, predicate, None)
+
+        return [tuple_ async for chunk in chunks for tuple_ in chunk.tuples]
+
+    async def tuple_chunks(
+        self,
+        relation_number: Number,
+        predicate: Predicate,
+        cursor: TupleCursor | None,
+    ) -> AsyncIterator[TupleChunk]:
+        plan, message_ids = self._plan(relation_number, predicate)
+
+        match plan:
+            case TuplePlan(access=TupleAccess.index_lookup):
+                pages = self._pages(message_ids, cursor)
+            case TuplePlan(
+                access=TupleAccess.search,
+                access_predicates=(
+                    EqualityPredicate(attribute_number, scalar),
+                ),
+            ):
+                pages = self._searched_pages(
+                    relation_number,
+                    attribute_number,
+                    scalar,
+                    cursor,
+                )
+            case _:
+                raise UnindexedPredicateError
+
+        async for message_id, page in pages:
+            tuples = tuple(
+                tuple_
+                for tuple_ in page
+                if tuple_.relation_schema_id.relation_number == relation_number
+                and predicate.matches(tuple_)
+            )
+
+            if tuples:
+                yield TupleChunk(tuples, message_id)
+
+    def plan(self, relation_number: Number, predicate: Predicate) -> TuplePlan:
+        plan, _ = self._plan(relation_number, predicate)
+        return plan
+
+    def _plan(
+        self,
+        relation_number: Number,
+        predicate: Predicate,
+    ) -> tuple[TuplePlan, Sequence[MessageID]]:
+        predicates = conjuncts(predicate)
+
+        if not predicates:
+            return TuplePlan(TupleAccess.scan, (), (), None), ()
+
+        if (
+            self._attribute_index is not None
+            and self._attribute_index.is_relation_indexed(relation_number)
+        ):
+            return self._index_plan(
+                self._attribute_index,
+                relation_number,
+                predicates,
+            )
+
+        equality_predicates = [
+            predicate_
+            for predicate_ in predicates
+            if isinstance(predicate_, EqualityPredicate)
+        ]
+
+        if not equality_predicates:
+            return TuplePlan(TupleAccess.scan, (), predicates, None), ()
+
+        searched_predicate = min(
+            equality_predicates,
+            key=lambda it: _search_selectivity_rank(it.scalar),
+        )
+        filter_predicates = tuple(
+            predicate_
+            for predicate_ in predicates
+            if predicate_ is not searched_predicate
+        )
+        plan = TuplePlan(
+            TupleAccess.search,
+            (searched_predicate,),
+            filter_predicates,
+            None,
         )
-        messages = cast(TotalList, messages)
 
-        return tuple(
-            HeapTupleEncoding.decoded_tuple(message.text)
-            for message in messages
+        return plan, ()
+
+    def _index_plan(
+        self,
+        attribute_index: AttributeIndex,
+        relation_number: Number,
+        predicates: Sequence[AttributePredicate],
+    ) -> tuple[TuplePlan, Sequence[MessageID]]:
+        message_id_sets = sorted(
+            (
+                (
+                    predicate,
+                    frozenset(
+                        attribute_index.message_ids_with_predicate(
+                            relation_number,
+                            predicate,
+                        ),
+                    ),
+                )
+                for predicate in predicates
+            ),
+            key=lambda it: len(it[1]),
         )
 
-    async def insert_idempotently(self, tuple_: Tuple) -> None:
-        message_index_ = await self._index_map[self._heap_id, tuple_.tid]
+        message_ids = message_id_sets[0][1]
 
-        if message_index_ is not None:
-            return
+        for _, other_message_ids in message_id_sets[1:]:
+            if not message_ids:
+                break
 
-        new_message = await self._pool_to_insert().send_message(
-            self._heap_id,
-            HeapTupleEncoding.encoded_tuple(tuple_),
+            message_ids &= other_message_ids
+
+        plan = TuplePlan(
+            TupleAccess.index_lookup,
+            tuple(predicate for predicate, _ in message_id_sets),
+            (),
+            len(message_ids),
         )
-        self._index_map[self._heap_id, tuple_.tid] = message_index(new_message)
 
-    async def insert(self, tuple_: Tuple) -> None:
-        new_message = await self._pool_to_insert().send_message(
-            self._heap_id,
-            HeapTupleEncoding.encoded_tuple(tuple_),
+        return plan, sorted(message_ids)
+
+    async def _pages(
+        self,
+        message_ids: Sequence[MessageID],
+        cursor: TupleCursor | None,
+    ) -> AsyncIterator[tuple[MessageID, Page]]:
+        message_ids = [
+            message_id
+            for message_id in message_ids
+            if cursor is None or message_id > cursor
+        ]
+
+        for message_id_batch in batched(
+            message_ids,
+            InTelegramHeap._fetched_page_batch_max_len,
+            strict=False,
+        ):
+            pages = await gather(
+                *(
+                    self._page_map[self._heap_id, message_id]
+                    for message_id in message_id_batch
+                ),
+            )
+
+            for message_id, page in zip(message_id_batch, pages, strict=True):
+                if page is not None:
+                    yield message_id, page
+
+    async def _searched_pages(
+        self,
+        relation_number: Number,
+        attribute_number: Number,
+        attribute_scalar: Scalar,
+        cursor: TupleCursor | None,
+    ) -> AsyncIterator[tuple[MessageID, Page]]:
+        page_streams = [
+            self._searched_codec_pages(
+                HeapTupleEncoding.id_of_encoded_tuple_with_attribute(
+                    int(relation_number),
+                    int(attribute_number),
+                    attribute_scalar,
+                    codec,
+                ),
+                cursor,
+            )
+            for codec in self._codecs
+        ]
+
+        async for message_id, page in _merged_pages(page_streams):
+            yield message_id, page
+
+    async def _searched_codec_pages(
+        self,
+        search: str,
+        cursor: TupleCursor | None,
+    ) -> AsyncIterator[tuple[MessageID, Page]]:
+        async for message in self._messages(search, cursor or 0):
+            yield message.id, self._cached_page(message)
+
+    async def _messages(
+        self,
+        search: str | None,
+        offset_id: MessageID,
+    ) -> AsyncIterator[Message]:
+        while True:
+            messages = cast(
+                TotalList,
+                await self._pool_to_select.run(
+                    TelegramCallKind.search,
+                    lambda client: client.get_messages(
+                        self._heap_id,
+                        limit=InTelegramHeap._fetched_page_batch_max_len,
+                        search=search,
+                        reverse=True,
+                        offset_id=offset_id,  # noqa: B023
+                    ),
+                ),
+            )
+
+            for message in messages:
+                yield message
+
+            if len(messages) < InTelegramHeap._fetched_page_batch_max_len:
+                return
+
+            offset_id = messages[-1].id
+
+    async def insert(self, tuples: Sequence[Tuple]) -> None:
+        await gather(*map(self._insert_page, self._encoded_pages(tuples)))
+
+    async def insert_idempotently(self, tuples: Sequence[Tuple]) -> None:
+        message_indexes = await gather(
+            *(self._index_map[self._heap_id, tuple_.tid] for tuple_ in tuples),
         )
-        self._index_map[self._heap_id, tuple_.tid] = message_index(new_message)
 
-    async def update(self, tuple_: Tuple) -> None:
-        message_index = await self._index_map[self._heap_id, tuple_.tid]
+        tuples_to_insert = tuple(
+            tuple_
+            for tuple_, message_index_ in zip(
+                tuples,
+                message_indexes,
+                strict=True,
+            )
+            if message_index_ is None
+        )
 
-        if message_index is None:
-            return
+        await self.insert(tuples_to_insert)
 
-        message_id, sender_id = message_index
+    async def rewrite(
+        self,
+        tuples: Sequence[Tuple],
+        deleted_tids: Sequence[TID],
+    ) -> None:
+        next_tuple_map: dict[TID, Tuple | None] = {
+            tuple_.tid: tuple_ for tuple_ in tuples
+        }
+        next_tuple_map |= dict.fromkeys(deleted_tids)
+
+        message_indexes = await gather(
+            *(self._index_map[self._heap_id, tid] for tid in next_tuple_map),
+        )
 
-        await self._pool_to_edit(sender_id).edit_message(
-            self._heap_id,
-            message_id,
-            HeapTupleEncoding.encoded_tuple(tuple_),
+        next_tuple_map_by_message_index = dict[
+            MessageIndex,
+            dict[TID, Tuple | None],
+        ]()
+
+        for (tid, next_tuple), message_index_ in zip(
+            next_tuple_map.items(),
+            message_indexes,
+            strict=True,
+        ):
+            if message_index_ is None:
+                continue
+
+            page_next_tuple_map = next_tuple_map_by_message_index.setdefault(
+                message_index_,
+                dict(),
+            )
+            page_next_tuple_map[tid] = next_tuple
+
+        page_indexes = tuple(next_tuple_map_by_message_index)
+        next_pages = await gather(
+            *starmap(
+                self._next_page,
+                next_tuple_map_by_message_index.items(),
+            ),
         )
 
-    async def delete_tuple_with_tid(self, tid: TID) -> None:
-        message_index = await self._index_map[self._heap_id, tid]
+        deleted_message_ids = list[MessageID]()
+        edited_pages = list[tuple[MessageIndex, Page]]()
+
+        for message_index_, next_page in zip(
+            page_indexes,
+            next_pages,
+            strict=True,
+        ):
+            if next_page is None:
+                continue
+
+            if next_page:
+                edited_pages.append((message_index_, next_page))
+            else:
+                deleted_message_ids.append(message_index_[0])
+
+        await gather(
+            self._delete_messages(deleted_message_ids),
+            *starmap(self._edit_page, edited_pages),
+        )
 
-        if message_index is None:
-            return
+    async def _next_page(
+        self,
+        message_index_: MessageIndex,
+        next_tuple_map: Mapping[TID, Tuple | None],
+    ) -> Page | None:
+        message_id, _ = message_index_
+
+        page = await self._page_map[self._heap_id, message_id]
+
+        if page is None:
+            return None
+
+        for tid, next_tuple in next_tuple_map.items():
+            if next_tuple is None:
+                self._index_map[self._heap_id, tid] = None
+
+        return tuple(
+            next_tuple
+            for tuple_ in page
+            if (next_tuple := next_tuple_map.get(tuple_.tid, tuple_))
+            is not None
+        )
+
+    async def _edit_page(
+        self,
+        message_index_: MessageIndex,
+        page: Page,
+    ) -> None:
+        message_id, sender_id = message_index_
 
-        message_id, _ = message_index
+        (first_page, encoded_first_page), *other_pages = self._encoded_pages(
+            page,
+        )
 
-        await self._pool_to_delete().delete_messages(
-            self._heap_id,
-            [message_id],
+        await gather(
+            self._pool_to_edit.run(
+                TelegramCallKind.edit,
+                lambda client: client.edit_message(
+                    self._heap_id,
+                    message_id,
+                    encoded_first_page,
+                ),
+                sender_id,
+            ),
+            *map(self._insert_page, other_pages),
         )
+        self._set_page(message_id, first_page)
+
+    async def _delete_messages(self, message_ids: Sequence[MessageID]) -> None:
+        for message_id in message_ids:
+            self._set_page(message_id, None)
+
+        await gather(
+            *(
+                self._delete_message_batch(message_id_batch)
+                for message_id_batch in batched(
+                    message_ids,
+                    InTelegramHeap._deleted_message_batch_max_len,
+                    strict=False,
+                )
+            ),
+        )
+
+    async def _delete_message_batch(
+        self,
+        message_ids: Sequence[MessageID],
+    ) -> None:
+        await self._pool_to_delete.run(
+            TelegramCallKind.delete,
+            lambda client: client.delete_messages(
+                self._heap_id,
+                list(message_ids),
+            ),
+        )
+
+    async def _insert_page(self, encoded_page: _EncodedPage) -> None:
+        page, encoded_page_text = encoded_page
+
+        new_message = await self._pool_to_insert.run(
+            TelegramCallKind.insert,
+            lambda client: client.send_message(
+                self._heap_id,
+                encoded_page_text,
+            ),
+        )
+        new_message_index = message_index(new_message)
+
+        self._set_page(new_message.id, page)
+
+        for tuple_ in page:
+            self._index_map[self._heap_id, tuple_.tid] = new_message_index
+
+    def _set_page(self, message_id: MessageID, page: Page | None) -> None:
+        self._page_map[self._heap_id, message_id] = page
+
+        if self._attribute_index is not None:
+            self._attribute_index.set_page(message_id, page or tuple())
+
+    def _cached_page(self, message: Message) -> Page:
+        page = HeapTupleEncoding.decoded_page(message.text)  # type: ignore[attr-defined]
+        message_index_ = message_index(message)
+
+        self._page_map[self._heap_id, message.id] = page
+
+        for tuple_ in page:
+            self._index_map[self._heap_id, tuple_.tid] = message_index_
+
+        return page
+
+    def _codec(self) -> HeapTupleCodec:
+        return self._codecs[0]
+
+    def _encoded_pages(self, tuples: Iterable[Tuple]) -> list[_EncodedPage]:
+        encoded_tuples = (
+            (tuple_, HeapTupleEncoding.encoded_tuple(tuple_, self._codec()))
+            for tuple_ in tuples
+        )
+
+        if not self._is_packing:
+            return [
+                ((tuple_,), encoded_tuple)
+                for tuple_, encoded_tuple in encoded_tuples
+            ]
+
+        pages = list[list[tuple[Tuple, str]]]()
+        page_len = 0
+
+        for tuple_, encoded_tuple in encoded_tuples:
+            next_page_len = page_len + 1 + len(encoded_tuple)
+
+            if pages and next_page_len <= self._encoded_tuple_max_len:
+                pages[-1].append((tuple_, encoded_tuple))
+                page_len = next_page_len
+            else:
+                pages.append([(tuple_, encoded_tuple)])
+                page_len = len(encoded_tuple)
+
+        return [
+            (
+                tuple(tuple_ for tuple_, _ in page),
+                HeapTupleEncoding.encoded_page(
+                    encoded_tuple for _, encoded_tuple in page
+                ),
+            )
+            for page in pages
+        ]
+
+
+_search_selectivity_ranks: dict[type[Scalar], int] = {
+    UUID: 0,
+    str: 1,
+    datetime: 2,
+    int: 3,
+    bool: 4,
+    type(None): 5,
+}
+
+
+def _search_selectivity_rank(scalar: Scalar) -> int:
+    return _search_selectivity_ranks[type(scalar)]
+
+
+async def _merged_pages(
+    page_streams: Sequence[AsyncIterator[tuple[MessageID, Page]]],
+) -> AsyncIterator[tuple[MessageID, Page]]:
+    heads = dict[int, tuple[MessageID, Page]]()
+
+    for stream_index, page_stream in enumerate(page_streams):
+        head = await anext(page_stream, None)
+
+        if head is not None:
+            heads[stream_index] = head
+
+    last_message_id: MessageID | None = None
+
+    while heads:
+        stream_index = min(heads, key=lambda index: heads[index][0])
+        message_id, page = heads[stream_index]
+
+        if message_id != last_message_id:
+            yield message_id, page
+            last_message_id = message_id
+
+        head = await anext(page_streams[stream_index], None)
+
+        if head is None:
+            del heads[stream_index]
+        else:
+            heads[stream_index] = head
@@ -0,0 +1,80 @@
+from asyncio import gather, to_thread
+from collections.abc import Sequence
+from dataclasses import dataclass
+from io import BytesIO
+from typing import cast
+
+from telethon.hints import TotalList
+from telethon.tl.types import Message
+
+from tgdb.infrastructure.blob_compression import (
+    BlobCompression,
+    assert_blob_compression_available,
+    compressed_blob,
+    decompressed_blob,
+)
+from tgdb.infrastructure.telethon.client_pool import (
+    TelegramCallKind,
+    TelegramClientPool,
+)
+from tgdb.infrastructure.telethon.index import MessageID
+
+
+type Segment = tuple[MessageID, bytes]
+
+
+@dataclass(frozen=True)
+class InTelegramSegments:
+    _pool_to_insert: TelegramClientPool
+    _pool_to_select: TelegramClientPool
+    _pool_to_delete: TelegramClientPool
+    _chat_id: int
+    _compression: BlobCompression = BlobCompression.none
+
+    def __post_init__(self) -> None:
+        assert_blob_compression_available(self._compression)
+
+    async def append(self, bytes_: bytes) -> MessageID:
+        blob = await to_thread(compressed_blob, bytes_, self._compression)
+
+        message = await self._pool_to_insert.run(
+            TelegramCallKind.insert,
+            lambda client: client.send_message(self._chat_id, file=blob),
+        )
+
+        return message.id
+
+    async def last(self, count: int) -> Sequence[Segment]:
+        messages = await self._pool_to_select.run(
+            TelegramCallKind.search,
+            lambda client: client.get_messages(
+                self._chat_id,
+                min_id=1,
+                limit=count,
+            ),
+        )
+        messages = cast(TotalList, messages)
+
+        segments = await gather(*map(self._segment, messages))
+
+        return sorted(segments)
+
+    async def delete(self, message_ids: Sequence[MessageID]) -> None:
+        if not message_ids:
+            return
+
+        await self._pool_to_delete.run(
+            TelegramCallKind.delete,
+            lambda client: client.delete_messages(
+                self._chat_id,
+                list(message_ids),
+            ),
+        )
+
+    async def _segment(self, message: Message) -> Segment:
+        with BytesIO() as stream:
+            await self._pool_to_select.run(
+                TelegramCallKind.search,
+                lambda client: client.download_file(message, stream),  # type: ignore[arg-type]
+            )
+            return message.id, decompressed_blob(stream.getvalue())
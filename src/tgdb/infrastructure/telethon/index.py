@@ -9,6 +9,7 @@ type ChatID = int
 
 type MessageIndex = tuple[MessageID, SenderID]
 type TupleIndex = tuple[ChatID, TID]
+type PageIndex = tuple[ChatID, MessageID]
 
 
 def message_index(message: Message) -> MessageIndex:
@@ -1,38 +1,227 @@
+from asyncio import gather
+from collections.abc import Iterable, Mapping, Sequence
+from itertools import starmap
 from typing import cast
 
 from telethon.hints import TotalList
 from telethon.tl.types import Message
 
-from tgdb.infrastructure.heap_tuple_encoding import HeapTupleEncoding
+from tgdb.entities.relation.tuple import TID
+from tgdb.infrastructure.async_batching import AsyncBatching
+from tgdb.infrastructure.heap_tuple_encoding import (
+    HeapTupleCodec,
+    HeapTupleEncoding,
+    Page,
+)
 from tgdb.infrastructure.lazy_map import LazyMap
-from tgdb.infrastructure.telethon.client_pool import TelegramClientPool
+from tgdb.infrastructure.telethon.client_pool import (
+    TelegramCallKind,
+    TelegramClientPool,
+)
 from tgdb.infrastructure.telethon.index import (
+    ChatID,
+    MessageID,
     MessageIndex,
+    PageIndex,
     TupleIndex,
     message_index,
 )
+from tgdb.infrastructure.telethon.message_index_log import MessageIndexLog
 
 
 type MessageIndexLazyMap = LazyMap[TupleIndex, MessageIndex | None]
+type PageLazyMap = LazyMap[PageIndex, Page | None]
+
+
+_scanned_window_len = 100
+_scanned_window_max_count = 10
 
 
 def message_index_lazy_map(
     pool: TelegramClientPool,
     cache_map_max_len: int,
+    log: MessageIndexLog | None = None,
+    codecs: Sequence[HeapTupleCodec] = (HeapTupleCodec.text,),
 ) -> LazyMap[TupleIndex, MessageIndex | None]:
-    async def tuple_message(tuple_index: TupleIndex) -> MessageIndex | None:
-        chat_id, tid = tuple_index
+    async def tuple_messages(
+        tuple_indexes: Sequence[TupleIndex],
+    ) -> Mapping[TupleIndex, MessageIndex | None]:
+        message_index_maps = await gather(
+            *starmap(chat_tuple_messages, _chat_groups(tuple_indexes).items()),
+        )
+
+        return {
+            tuple_index: message_index_
+            for message_index_map in message_index_maps
+            for tuple_index, message_index_ in message_index_map.items()
+        }
+
+    async def chat_tuple_messages(
+        chat_id: ChatID,
+        tids: Sequence[TID],
+    ) -> Mapping[TupleIndex, MessageIndex | None]:
+        message_index_map = dict[TID, MessageIndex | None]()
+
+        if log is not None:
+            message_index_map |= log.chat_message_indexes(chat_id, tids)
+
+        unresolved_tids = [tid for tid in tids if tid not in message_index_map]
+
+        if len(unresolved_tids) > 1:
+            message_index_map |= await _scanned_tuple_messages(
+                pool,
+                chat_id,
+                unresolved_tids,
+            )
+
+        unresolved_tids = [tid for tid in tids if tid not in message_index_map]
+        searched_message_indexes = await gather(
+            *(searched_tuple_message(chat_id, tid) for tid in unresolved_tids),
+        )
+        message_index_map |= zip(
+            unresolved_tids,
+            searched_message_indexes,
+            strict=True,
+        )
+
+        if log is not None:
+            log.update_chat_message_indexes(
+                chat_id,
+                {
+                    tid: message_index_
+                    for tid, message_index_ in message_index_map.items()
+                    if message_index_ is not None
+                },
+            )
+
+        return {
+            (chat_id, tid): message_index_
+            for tid, message_index_ in message_index_map.items()
+        }
+
+    async def searched_tuple_message(
+        chat_id: ChatID,
+        tid: TID,
+    ) -> MessageIndex | None:
+        for codec in codecs:
+            search = HeapTupleEncoding.id_of_encoded_tuple_with_tid(tid, codec)
+            messages = cast(
+                TotalList,
+                await pool.run(
+                    TelegramCallKind.search,
+                    lambda client: client.get_messages(
+                        chat_id,
+                        search=search,  # noqa: B023
+                        limit=1,
+                    ),
+                ),
+            )
+
+            if messages:
+                message = cast(Message, messages[0])
+                return message_index(message)
+
+        return None
+
+    return LazyMap(
+        cache_map_max_len,
+        AsyncBatching(tuple_messages),
+        None if log is None else log.__setitem__,
+    )
+
 
-        search = HeapTupleEncoding.id_of_encoded_tuple_with_tid(tid)
+def page_lazy_map(
+    pool: TelegramClientPool,
+    cache_map_max_len: int,
+) -> LazyMap[PageIndex, Page | None]:
+    async def pages(
+        page_indexes: Sequence[PageIndex],
+    ) -> Mapping[PageIndex, Page | None]:
+        page_maps = await gather(
+            *starmap(chat_pages, _chat_groups(page_indexes).items()),
+        )
+
+        return {
+            page_index: page
+            for page_map in page_maps
+            for page_index, page in page_map.items()
+        }
+
+    async def chat_pages(
+        chat_id: ChatID,
+        message_ids: Sequence[MessageID],
+    ) -> Mapping[PageIndex, Page | None]:
+        messages = cast(
+            TotalList,
+            await pool.run(
+                TelegramCallKind.search,
+                lambda client: client.get_messages(
+                    chat_id,
+                    ids=list(message_ids),
+                ),
+            ),
+        )
+
+        return {
+            (chat_id, message_id): (
+                None
+                if message is None
+                else HeapTupleEncoding.decoded_page(message.text)
+            )
+            for message_id, message in zip(message_ids, messages, strict=True)
+        }
+
+    return LazyMap(cache_map_max_len, AsyncBatching(pages))
+
+
+async def _scanned_tuple_messages(
+    pool: TelegramClientPool,
+    chat_id: ChatID,
+    tids: Sequence[TID],
+) -> Mapping[TID, MessageIndex]:
+    unresolved_tids = set(tids)
+    message_index_map = dict[TID, MessageIndex]()
+    offset_id = 0
+
+    for _ in range(_scanned_window_max_count):
         messages = cast(
             TotalList,
-            await pool().get_messages(chat_id, search=search, limit=1),
+            await pool.run(
+                TelegramCallKind.search,
+                lambda client: client.get_messages(
+                    chat_id,
+                    limit=_scanned_window_len,
+                    offset_id=offset_id,  # noqa: B023
+                ),
+            ),
         )
 
-        if not messages:
-            return None
+        unresolved_tid_count = len(unresolved_tids)
+
+        for message in messages:
+            for tuple_ in HeapTupleEncoding.decoded_page(message.text):
+                if tuple_.tid in unresolved_tids:
+                    unresolved_tids.remove(tuple_.tid)
+                    message_index_map[tuple_.tid] = message_index(message)
+
+        if (
+            not unresolved_tids
+            or len(unresolved_tids) == unresolved_tid_count
+            or len(messages) < _scanned_window_len
+        ):
+            break
+
+        offset_id = messages[-1].id
+
+    return message_index_map
+
+
+def _chat_groups[ValueT](
+    indexes: Iterable[tuple[ChatID, ValueT]],
+) -> dict[ChatID, list[ValueT]]:
+    groups = dict[ChatID, list[ValueT]]()
 
-        message = cast(Message, messages[0])
-        return message_index(message)
+    for chat_id, value in indexes:
+        groups.setdefault(chat_id, list()).append(value)
 
-    return LazyMap(cache_map_max_len, tuple_message)
+    return groups
@@ -0,0 +1,162 @@
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import AbstractContextManager
+from dataclasses import dataclass, field
+from pathlib import Path
+from struct import Struct
+from types import TracebackType
+from typing import BinaryIO, ClassVar, Self, cast
+from uuid import UUID
+
+from tgdb.entities.relation.tuple import TID
+from tgdb.infrastructure.lazy_map import ExternalValue, NoExternalValue
+from tgdb.infrastructure.telethon.index import ChatID, MessageIndex, TupleIndex
+
+
+@dataclass(unsafe_hash=False)
+class MessageIndexLog(AbstractContextManager["MessageIndexLog"]):
+    _path: Path
+    _map: dict[TupleIndex, MessageIndex | None] = field(
+        init=False,
+        default_factory=dict,
+    )
+    _file: BinaryIO | None = field(init=False, default=None)
+    _record_count: int = field(init=False, default=0)
+
+    _record: ClassVar = Struct("<q16sqq")
+    _no_message_id: ClassVar = 0
+    _compaction_ratio: ClassVar = 2
+
+    def __enter__(self) -> Self:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._path.touch()
+        self._truncate_torn_record()
+
+        for tuple_index, message_index in self._loaded_records():
+            self._map[tuple_index] = message_index
+            self._record_count += 1
+
+        if self._record_count > len(self._map) * self._compaction_ratio:
+            self._compact()
+
+        self._file = self._path.open("ab", buffering=0)
+        return self
+
+    def __exit__(
+        self,
+        error_type: type[BaseException] | None,
+        error: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __len__(self) -> int:
+        return len(self._map)
+
+    def get(
+        self,
+        tuple_index: TupleIndex,
+    ) -> ExternalValue[MessageIndex | None]:
+        return self._map.get(tuple_index, NoExternalValue())
+
+    def chat_message_indexes(
+        self,
+        chat_id: ChatID,
+        tids: Iterable[TID],
+    ) -> dict[TID, MessageIndex | None]:
+        return {
+            tid: self._map[chat_id, tid]
+            for tid in tids
+            if (chat_id, tid) in self._map
+        }
+
+    def update_chat_message_indexes(
+        self,
+        chat_id: ChatID,
+        message_index_map: Mapping[TID, MessageIndex | None],
+    ) -> None:
+        for tid, message_index in message_index_map.items():
+            self[chat_id, tid] = message_index
+
+    def __setitem__(
+        self,
+        tuple_index: TupleIndex,
+        message_index: MessageIndex | None,
+    ) -> None:
+        if self.get(tuple_index) == message_index:
+            return
+
+        self._map[tuple_index] = message_index
+
+        if self._file is not None:
+            self._file.write(self._encoded_record(tuple_index, message_index))
+            self._record_count += 1
+
+    def _truncate_torn_record(self) -> None:
+        size = self._path.stat().st_size
+        torn_record_size = size % self._record.size
+
+        if torn_record_size:
+            with self._path.open("r+b") as file:
+                file.truncate(size - torn_record_size)
+
+    def _loaded_records(
+        self,
+    ) -> Iterator[tuple[TupleIndex, MessageIndex | None]]:
+        with self._path.open("rb") as file:
+            while True:
+                encoded_record = file.read(self._record.size)
+
+                if len(encoded_record) < self._record.size:
+                    return
+
+                yield self._decoded_record(encoded_record)
+
+    def _compact(self) -> None:
+        compacted_path = self._path.with_suffix(".compacted")
+
+        with compacted_path.open("wb") as file:
+            for tuple_index, message_index in self._map.items():
+                if message_index is not None:
+                    file.write(self._encoded_record(tuple_index, message_index))
+
+        compacted_path.replace(self._path)
+
+        self._map = {
+            tuple_index: message_index
+            for tuple_index, message_index in self._map.items()
+            if message_index is not None
+        }
+        self._record_count = len(self._map)
+
+    def _encoded_record(
+        self,
+        tuple_index: TupleIndex,
+        message_index: MessageIndex | None,
+    ) -> bytes:
+        chat_id, tid = tuple_index
+
+        if message_index is None:
+            message_id, sender_id = self._no_message_id, 0
+        else:
+            message_id, sender_id = message_index
+
+        return cast(
+            bytes,
+            self._record.pack(chat_id, tid.bytes, message_id, sender_id),
+        )
+
+    def _decoded_record(
+        self,
+        encoded_record: bytes,
+    ) -> tuple[TupleIndex, MessageIndex | None]:
+        chat_id, tid_bytes, message_id, sender_id = self._record.unpack(
+            encoded_record,
+        )
+        tuple_index = (chat_id, UUID(bytes=tid_bytes))
+
+        if message_id == self._no_message_id:
+            return tuple_index, None
+
+        return tuple_index, (message_id, sender_id)
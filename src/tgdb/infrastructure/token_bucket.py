@@ -0,0 +1,43 @@
+from dataclasses import dataclass, field
+
+
+@dataclass(unsafe_hash=False)
+class TokenBucket:
+    _rate: float
+    _capacity: float
+    _now: float
+
+    _tokens: float = field(init=False)
+
+    def __post_init__(self) -> None:
+        self._tokens = self._capacity
+
+    def tokens(self, now: float) -> float:
+        self._refill(now)
+        return self._tokens
+
+    def take(self, now: float) -> bool:
+        self._refill(now)
+
+        if self._tokens < 1:
+            return False
+
+        self._tokens -= 1
+        return True
+
+    def seconds_until_token(self, now: float) -> float:
+        self._refill(now)
+
+        if self._tokens >= 1:
+            return 0
+
+        return (1 - self._tokens) / self._rate
+
+    def _refill(self, now: float) -> None:
+        elapsed_seconds = max(0, now - self._now)
+
+        self._tokens = min(
+            self._capacity,
+            self._tokens + elapsed_seconds * self._rate,
+        )
+        self._now = max(self._now, now)
@@ -0,0 +1,201 @@
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from sys import getsizeof
+
+from tgdb.entities.horizon.transaction import TransactionScalarEffect
+from tgdb.entities.numeration.number import Number
+from tgdb.entities.relation.scalar import Scalar
+from tgdb.entities.relation.tuple import TID, Tuple
+from tgdb.entities.relation.tuple_effect import (
+    DeletedTuple,
+    MigratedTuple,
+    MutatedTuple,
+    NewTuple,
+)
+from tgdb.infrastructure.eviction import Eviction
+
+
+type TupleCacheKey = tuple[int, int, type[Scalar], Scalar]
+
+
+_key_size = 256
+_tid_size = 64
+_tuple_size = 128
+
+
+def tuple_cache_key(
+    relation_number: Number,
+    attribute_number: Number,
+    attribute_scalar: Scalar,
+) -> TupleCacheKey:
+    return (
+        int(relation_number),
+        int(attribute_number),
+        type(attribute_scalar),
+        attribute_scalar,
+    )
+
+
+@dataclass(frozen=True)
+class TupleCacheStats:
+    hits: int
+    misses: int
+    size: int
+    max_size: int
+    key_count: int
+    tuple_count: int
+
+
+@dataclass(unsafe_hash=False)
+class TupleCache:
+    _max_size: int
+    _eviction: Eviction[TupleCacheKey]
+
+    _tid_map_by_key: dict[TupleCacheKey, dict[TID, None]] = field(
+        init=False,
+        default_factory=dict,
+    )
+    _tuple_by_tid: dict[TID, Tuple] = field(init=False, default_factory=dict)
+    _keys_by_tid: dict[TID, set[TupleCacheKey]] = field(
+        init=False,
+        default_factory=dict,
+    )
+    _size: int = field(init=False, default=0)
+    _hits: int = field(init=False, default=0)
+    _misses: int = field(init=False, default=0)
+    _version: int = field(init=False, default=0)
+
+    def stats(self) -> TupleCacheStats:
+        return TupleCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            size=self._size,
+            max_size=self._max_size,
+            key_count=len(self._tid_map_by_key),
+            tuple_count=len(self._tuple_by_tid),
+        )
+
+    def version(self) -> int:
+        return self._version
+
+    def has_tuples(self, key: TupleCacheKey) -> bool:
+        return key in self._tid_map_by_key
+
+    def tuples(self, key: TupleCacheKey) -> Sequence[Tuple] | None:
+        tid_map = self._tid_map_by_key.get(key)
+
+        if tid_map is None:
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        self._eviction.touch(key)
+
+        return tuple(self._tuple_by_tid[tid] for tid in tid_map)
+
+    def set_tuples(
+        self,
+        key: TupleCacheKey,
+        tuples: Sequence[Tuple],
+        version: int,
+    ) -> None:
+        if version != self._version or key in self._tid_map_by_key:
+            return
+
+        self._tid_map_by_key[key] = dict()
+        self._size += _key_size
+        self._eviction.add(key)
+
+        for tuple_ in tuples:
+            self._add_to_key(key, tuple_)
+
+        self._evict()
+
+    def map(self, effects: Iterable[TransactionScalarEffect]) -> None:
+        self._version += 1
+
+        for effect in effects:
+            match effect:
+                case DeletedTuple(tid):
+                    for key in tuple(self._keys_by_tid.get(tid, set())):
+                        self._remove_from_key(key, tid)
+                case (
+                    NewTuple(tuple_)
+                    | MutatedTuple(tuple_)
+                    | MigratedTuple(tuple_)
+                ):
+                    self._map_tuple(tuple_)
+
+        self._evict()
+
+    def _map_tuple(self, tuple_: Tuple) -> None:
+        next_keys = {
+            tuple_cache_key(
+                tuple_.relation_schema_id.relation_number,
+                Number(attribute_number),
+                scalar,
+            )
+            for attribute_number, scalar in enumerate(tuple_)
+        }
+        previous_keys = self._keys_by_tid.get(tuple_.tid, set())
+
+        for key in previous_keys - next_keys:
+            self._remove_from_key(key, tuple_.tid)
+
+        if tuple_.tid in self._tuple_by_tid:
+            self._remove_tuple(tuple_.tid)
+            self._insert_tuple(tuple_)
+
+        for key in next_keys:
+            if key in self._tid_map_by_key:
+                self._add_to_key(key, tuple_)
+
+    def _add_to_key(self, key: TupleCacheKey, tuple_: Tuple) -> None:
+        tid_map = self._tid_map_by_key[key]
+
+        if tuple_.tid in tid_map:
+            return
+
+        tid_map[tuple_.tid] = None
+        self._size += _tid_size
+
+        if tuple_.tid not in self._tuple_by_tid:
+            self._insert_tuple(tuple_)
+
+        self._keys_by_tid.setdefault(tuple_.tid, set()).add(key)
+
+    def _remove_from_key(self, key: TupleCacheKey, tid: TID) -> None:
+        del self._tid_map_by_key[key][tid]
+        self._size -= _tid_size
+
+        keys = self._keys_by_tid[tid]
+        keys.remove(key)
+
+        if not keys:
+            del self._keys_by_tid[tid]
+            self._remove_tuple(tid)
+
+    def _insert_tuple(self, tuple_: Tuple) -> None:
+        self._tuple_by_tid[tuple_.tid] = tuple_
+        self._size += self._estimated_tuple_size(tuple_)
+
+    def _remove_tuple(self, tid: TID) -> None:
+        tuple_ = self._tuple_by_tid.pop(tid)
+        self._size -= self._estimated_tuple_size(tuple_)
+
+    def _evict(self) -> None:
+        while self._size > self._max_size:
+            key = self._eviction.victim()
+
+            if key is None:
+                return
+
+            for tid in tuple(self._tid_map_by_key[key]):
+                self._remove_from_key(key, tid)
+
+            del self._tid_map_by_key[key]
+            self._size -= _key_size
+            self._eviction.remove(key)
+
+    def _estimated_tuple_size(self, tuple_: Tuple) -> int:
+        return _tuple_size + sum(map(getsizeof, tuple_))
@@ -0,0 +1,147 @@
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+from tgdb.entities.horizon.transaction import (
+    TransactionEffect,
+    TransactionScalarEffect,
+)
+from tgdb.entities.numeration.number import Number
+from tgdb.entities.relation.predicate import Predicate
+from tgdb.entities.relation.tuple import TID, Tuple
+from tgdb.entities.relation.tuple_effect import DeletedTuple
+
+
+@dataclass(unsafe_hash=False)
+class UnappliedEffects:
+    _effect_by_tid: dict[TID, TransactionScalarEffect] = field(
+        init=False,
+        default_factory=dict,
+    )
+    _unapplied_count_by_tid: dict[TID, int] = field(
+        init=False,
+        default_factory=dict,
+    )
+    _tid_map_by_relation_number: dict[int, dict[TID, None]] = field(
+        init=False,
+        default_factory=dict,
+    )
+
+    def __len__(self) -> int:
+        return len(self._effect_by_tid)
+
+    def push(self, effects: Sequence[TransactionEffect]) -> None:
+        for effect in effects:
+            for scalar_effect in effect:
+                self._push_scalar_effect(scalar_effect)
+
+    def apply(self, effects: Sequence[TransactionEffect]) -> None:
+        for effect in effects:
+            for scalar_effect in effect:
+                self._apply_scalar_effect(scalar_effect.tid)
+
+    def overlaid_tuples(
+        self,
+        relation_number: Number,
+        predicate: Predicate,
+        tuples: Sequence[Tuple],
+        *,
+        is_exhaustive: bool,
+    ) -> Sequence[Tuple]:
+        if not self._effect_by_tid:
+            return tuples
+
+        overlaid_tuples = list[Tuple]()
+
+        for tuple_ in tuples:
+            effect = self._effect_by_tid.get(tuple_.tid)
+
+            if effect is None:
+                overlaid_tuples.append(tuple_)
+                continue
+
+            if isinstance(effect, DeletedTuple):
+                continue
+
+            if predicate.matches(effect.tuple):
+                overlaid_tuples.append(effect.tuple)
+
+        if not is_exhaustive:
+            return overlaid_tuples
+
+        viewed_tids = frozenset(tuple_.tid for tuple_ in tuples)
+        tid_map = self._tid_map_by_relation_number.get(int(relation_number))
+
+        for tid in tid_map or ():
+            effect = self._effect_by_tid[tid]
+
+            if tid in viewed_tids or isinstance(effect, DeletedTuple):
+                continue
+
+            if predicate.matches(effect.tuple):
+                overlaid_tuples.append(effect.tuple)
+
+        return overlaid_tuples
+
+    def overlaid_tuples_with_tids(
+        self,
+        tids: Sequence[TID],
+        tuples: Sequence[Tuple],
+    ) -> Sequence[Tuple]:
+        if not self._effect_by_tid:
+            return tuples
+
+        tuple_by_tid = {tuple_.tid: tuple_ for tuple_ in tuples}
+
+        for tid in tids:
+            effect = self._effect_by_tid.get(tid)
+
+            if isinstance(effect, DeletedTuple):
+                tuple_by_tid.pop(tid, None)
+            elif effect is not None:
+                tuple_by_tid[tid] = effect.tuple
+
+        return tuple(tuple_by_tid.values())
+
+    def _push_scalar_effect(self, effect: TransactionScalarEffect) -> None:
+        self._forget_relation_tid(effect.tid)
+        self._effect_by_tid[effect.tid] = effect
+        self._unapplied_count_by_tid[effect.tid] = (
+            self._unapplied_count_by_tid.get(effect.tid, 0) + 1
+        )
+
+        if isinstance(effect, DeletedTuple):
+            return
+
+        relation_number = effect.tuple.relation_schema_id.relation_number
+        tid_map = self._tid_map_by_relation_number.setdefault(
+            int(relation_number),
+            dict(),
+        )
+        tid_map[effect.tid] = None
+
+    def _apply_scalar_effect(self, tid: TID) -> None:
+        unapplied_count = self._unapplied_count_by_tid.get(tid)
+
+        if unapplied_count is None:
+            return
+
+        if unapplied_count > 1:
+            self._unapplied_count_by_tid[tid] = unapplied_count - 1
+            return
+
+        self._forget_relation_tid(tid)
+        del self._effect_by_tid[tid]
+        del self._unapplied_count_by_tid[tid]
+
+    def _forget_relation_tid(self, tid: TID) -> None:
+        effect = self._effect_by_tid.get(tid)
+
+        if effect is None or isinstance(effect, DeletedTuple):
+            return
+
+        relation_number = int(effect.tuple.relation_schema_id.relation_number)
+        tid_map = self._tid_map_by_relation_number[relation_number]
+        del tid_map[tid]
+
+        if not tid_map:
+            del self._tid_map_by_relation_number[relation_number]
@@ -1,5 +1,5 @@
 from collections import deque
-from collections.abc import AsyncIterator, Sequence
+from collections.abc import AsyncIterator, Iterator, Sequence
 from typing import NewType
 
 from dishka import AnyOf, Provider, Scope, make_container, provide
@@ -14,6 +14,7 @@ from tgdb.application.horizon.output_commits import OutputCommits
 from tgdb.application.horizon.output_commits_to_tuples import (
     OutputCommitsToTuples,
 )
+from tgdb.application.horizon.ports.applied_commits import AppliedCommits
 from tgdb.application.horizon.ports.channel import Channel
 from tgdb.application.horizon.ports.shared_horizon import SharedHorizon
 from tgdb.application.horizon.rollback_transaction import RollbackTransaction
@@ -21,8 +22,10 @@ from tgdb.application.horizon.start_transaction import StartTransaction
 from tgdb.application.relation.create_relation import CreateRelation
 from tgdb.application.relation.ports.relations import Relations
 from tgdb.application.relation.ports.tuples import Tuples
+from tgdb.application.relation.view_tuple_plan import ViewTuplePlan
+from tgdb.application.relation.view_tuple_stream import ViewTupleStream
 from tgdb.application.relation.view_tuples import ViewTuples
-from tgdb.entities.horizon.horizon import Horizon, horizon
+from tgdb.entities.horizon.horizon import horizon, sharded_horizons
 from tgdb.entities.horizon.transaction import Commit, PreparedCommit
 from tgdb.entities.relation.relation import Relation
 from tgdb.infrastructure.adapters.buffer import (
@@ -31,25 +34,47 @@ from tgdb.infrastructure.adapters.buffer import (
 )
 from tgdb.infrastructure.adapters.channel import AsyncMapChannel
 from tgdb.infrastructure.adapters.clock import PerfCounterClock
-from tgdb.infrastructure.adapters.queque import InMemoryQueque
+from tgdb.infrastructure.adapters.queque import (
+    InMemoryQueque,
+    UnappliedEffectQueque,
+)
 from tgdb.infrastructure.adapters.relations import InTelegramReplicableRelations
 from tgdb.infrastructure.adapters.shared_horizon import InMemorySharedHorizon
-from tgdb.infrastructure.adapters.tuples import InTelegramHeapTuples
+from tgdb.infrastructure.adapters.tuples import (
+    CachedTuples,
+    InTelegramHeapTuples,
+    UnappliedEffectTuples,
+)
 from tgdb.infrastructure.adapters.uuids import UUIDs4
 from tgdb.infrastructure.async_map import AsyncMap
 from tgdb.infrastructure.async_queque import AsyncQueque
+from tgdb.infrastructure.eviction import eviction
+from tgdb.infrastructure.overflow import (
+    AdaptiveOverflow,
+    FixedOverflow,
+    Overflow,
+)
 from tgdb.infrastructure.pyyaml.config import TgdbConfig
+from tgdb.infrastructure.telethon.attribute_index import AttributeIndex
 from tgdb.infrastructure.telethon.client_pool import (
     TelegramClientPool,
     loaded_client_pool_from_farm_file,
 )
 from tgdb.infrastructure.telethon.in_telegram_bytes import InTelegramBytes
 from tgdb.infrastructure.telethon.in_telegram_heap import InTelegramHeap
+from tgdb.infrastructure.telethon.in_telegram_segments import (
+    InTelegramSegments,
+)
 from tgdb.infrastructure.telethon.lazy_map import (
     MessageIndexLazyMap,
+    PageLazyMap,
     message_index_lazy_map,
+    page_lazy_map,
 )
+from tgdb.infrastructure.telethon.message_index_log import MessageIndexLog
+from tgdb.infrastructure.tuple_cache import TupleCache
 from tgdb.infrastructure.typenv.envs import Envs
+from tgdb.infrastructure.unapplied_effects import UnappliedEffects
 
 
 BotPool = NewType("BotPool", TelegramClientPool)
@@ -69,12 +94,23 @@ class MainIOProvider(Provider):
 class CommonProvider(Provider):
     provide_clock = provide(PerfCounterClock, provides=Clock, scope=Scope.APP)
     provide_uuids = provide(UUIDs4, provides=UUIDs, scope=Scope.APP)
-    provide_commit_queque = provide(
-        staticmethod(lambda: InMemoryQueque(AsyncQueque())),
-        provides=Queque[Sequence[Commit | PreparedCommit]],
+    provide_unapplied_effects = provide(UnappliedEffects, scope=Scope.APP)
+    provide_applied_commit_queque = provide(
+        staticmethod(lambda: AppliedCommits(InMemoryQueque(AsyncQueque()))),
+        provides=AppliedCommits,
         scope=Scope.APP,
     )
 
+    @provide(scope=Scope.APP)
+    def provide_commit_queque(
+        self,
+        unapplied_effects: UnappliedEffects,
+    ) -> Queque[Sequence[Commit | PreparedCommit]]:
+        return UnappliedEffectQueque(
+            InMemoryQueque(AsyncQueque()),
+            unapplied_effects,
+        )
+
     @provide(scope=Scope.APP)
     def provide_channel(self, config: TgdbConfig) -> Channel:
         return AsyncMapChannel(
@@ -92,6 +128,10 @@ class CommonProvider(Provider):
                 config.clients.bots,
                 config.api.id,
                 config.api.hash,
+                config.clients.calls_per_second,
+                config.clients.call_burst,
+                config.clients.initial_concurrency,
+                config.clients.max_concurrency,
             ),
         )
         async with pool:
@@ -107,43 +147,93 @@ class CommonProvider(Provider):
                 config.clients.userbots,
                 config.api.id,
                 config.api.hash,
+                config.clients.calls_per_second,
+                config.clients.call_burst,
+                config.clients.initial_concurrency,
+                config.clients.max_concurrency,
             ),
         )
         async with pool:
             yield pool
 
     @provide(scope=Scope.APP)
-    def provide_horizon(self, config: TgdbConfig) -> Horizon:
-        return horizon(
-            0,
-            config.horizon.max_len,
-            int(config.horizon.transaction.max_age_seconds * 1_000_000_000),
+    def provide_shared_horizon(self, config: TgdbConfig) -> SharedHorizon:
+        max_transaction_age = int(
+            config.horizon.transaction.max_age_seconds * 1_000_000_000,
+        )
+
+        if config.horizon.shard_count == 1:
+            return InMemorySharedHorizon((
+                horizon(0, config.horizon.max_len, max_transaction_age),
+            ))
+
+        return InMemorySharedHorizon(
+            sharded_horizons(
+                0,
+                config.horizon.max_len,
+                max_transaction_age,
+                config.horizon.shard_count,
+            ),
         )
 
     @provide(scope=Scope.APP)
-    def provide_shared_horizon(self, horizon: Horizon) -> SharedHorizon:
-        return InMemorySharedHorizon(horizon)
+    def provide_message_index_log(
+        self,
+        config: TgdbConfig,
+    ) -> Iterator[MessageIndexLog | None]:
+        if config.message_cache.log is None:
+            yield None
+            return
+
+        with MessageIndexLog(config.message_cache.log) as log:
+            yield log
 
     @provide(scope=Scope.APP)
     def provide_lazy_message_map(
         self,
         user_bot_pool: UserBotPool,
         config: TgdbConfig,
+        message_index_log: MessageIndexLog | None,
     ) -> MessageIndexLazyMap:
         return message_index_lazy_map(
             user_bot_pool,
             config.message_cache.max_len,
+            message_index_log,
+            config.heap.page.codecs(),
         )
 
     @provide(scope=Scope.APP)
-    def provide_in_telegram_heap(
+    def provide_lazy_page_map(
+        self,
+        user_bot_pool: UserBotPool,
+        config: TgdbConfig,
+    ) -> PageLazyMap:
+        return page_lazy_map(user_bot_pool, config.message_cache.max_len)
+
+    @provide(scope=Scope.APP)
+    def provide_attribute_index(
+        self,
+        config: TgdbConfig,
+    ) -> Iterator[AttributeIndex | None]:
+        if config.heap.attribute_index is None:
+            yield None
+            return
+
+        with AttributeIndex(config.heap.attribute_index) as attribute_index:
+            yield attribute_index
+
+    @provide(scope=Scope.APP)
+    async def provide_in_telegram_heap(  # noqa: PLR0913, PLR0917
         self,
         bot_pool: BotPool,
         user_bot_pool: UserBotPool,
         config: TgdbConfig,
         message_index_lazy_map: MessageIndexLazyMap,
+        page_lazy_map: PageLazyMap,
+        attribute_index: AttributeIndex | None,
+        relations: InTelegramReplicableRelations,
     ) -> InTelegramHeap:
-        return InTelegramHeap(
+        heap = InTelegramHeap(
             bot_pool,
             user_bot_pool,
             bot_pool,
@@ -151,24 +241,58 @@ class CommonProvider(Provider):
             config.heap.chat,
             InTelegramHeap.encoded_tuple_max_len(config.heap.page.max_fullness),
             message_index_lazy_map,
+            page_lazy_map,
+            config.heap.page.packing,
+            attribute_index,
+            config.heap.page.codecs(),
+        )
+        await heap.rebuild_dirty_attribute_index(
+            relation.number() for relation in relations.cache()
         )
 
-    provide_tuples = provide(
-        InTelegramHeapTuples,
-        provides=Tuples,
-        scope=Scope.APP,
-    )
+        return heap
+
+    @provide(scope=Scope.APP)
+    def provide_tuples(
+        self,
+        config: TgdbConfig,
+        heap: InTelegramHeap,
+        unapplied_effects: UnappliedEffects,
+    ) -> Tuples:
+        tuples: Tuples = InTelegramHeapTuples(heap)
+
+        if config.tuple_cache is not None:
+            cache = TupleCache(
+                config.tuple_cache.max_size_bytes,
+                eviction(config.tuple_cache.eviction),
+            )
+            tuples = CachedTuples(tuples, cache)
+
+        return UnappliedEffectTuples(tuples, unapplied_effects)
 
     @provide(scope=Scope.APP)
     def provide_in_memory_buffer[ValueT](
         self,
         config: TgdbConfig,
     ) -> InMemoryBuffer[ValueT]:
-        return InMemoryBuffer(
-            config.buffer.overflow.len,
-            config.buffer.overflow.timeout_seconds,
-            deque(),
-        )
+        overflow_config = config.buffer.overflow
+        adaptive_overflow_config = config.buffer.adaptive_overflow
+
+        overflow: Overflow
+
+        if adaptive_overflow_config is None:
+            overflow = FixedOverflow(
+                overflow_config.len,
+                overflow_config.timeout_seconds,
+            )
+        else:
+            overflow = AdaptiveOverflow(
+                overflow_config.len,
+                overflow_config.timeout_seconds,
+                adaptive_overflow_config.latency_target_seconds,
+            )
+
+        return InMemoryBuffer(overflow, deque())
 
     @provide(scope=Scope.APP)
     async def provide_buffer(
@@ -178,15 +302,18 @@ class CommonProvider(Provider):
         user_bot_pool: UserBotPool,
         in_memory_buffer: InMemoryBuffer[Commit | PreparedCommit],
     ) -> AsyncIterator[Buffer[Commit | PreparedCommit]]:
-        in_tg_bytes = InTelegramBytes(
+        in_tg_segments = InTelegramSegments(
             bot_pool,
             user_bot_pool,
+            bot_pool,
             config.buffer.chat,
+            config.buffer.compression,
         )
 
         buffer = InTelegramReplicablePreparedCommitBuffer(
             in_memory_buffer,
-            in_tg_bytes,
+            in_tg_segments,
+            config.buffer.pipeline_depth,
         )
 
         async with buffer:
@@ -205,6 +332,7 @@ class CommonProvider(Provider):
             bot_pool,
             user_bot_pool,
             config.relations.chat,
+            config.relations.compression,
         )
         relations = InTelegramReplicableRelations(in_tg_bytes, InMemoryDb())
 
@@ -223,6 +351,8 @@ class CommonProvider(Provider):
     provide_create_relations = provide(CreateRelation, scope=Scope.APP)
 
     provide_view_tuples = provide(ViewTuples, scope=Scope.APP)
+    provide_view_tuple_stream = provide(ViewTupleStream, scope=Scope.APP)
+    provide_view_tuple_plan = provide(ViewTuplePlan, scope=Scope.APP)
 
 
 main_io_container = make_container(MainIOProvider())
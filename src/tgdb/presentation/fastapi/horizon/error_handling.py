@@ -3,11 +3,17 @@ from fastapi.responses import JSONResponse
 
 from tgdb.entities.horizon.horizon import (
     NoTransactionError,
+    ReadOnlyTransactionError,
     TransactionCommittingError,
 )
-from tgdb.entities.horizon.transaction import ConflictError
+from tgdb.entities.horizon.transaction import (
+    ConflictError,
+    SnapshotTooOldError,
+)
 from tgdb.presentation.fastapi.horizon.schemas.error import (
     NoTransactionSchema,
+    ReadOnlyTransactionSchema,
+    SnapshotTooOldSchema,
     TransactionCommittingSchema,
     TransactionConflictSchema,
 )
@@ -37,3 +43,18 @@ def add_horizon_error_handling(app: FastAPI) -> None:
             schema.model_dump(mode="json", by_alias=True),
             status_code=status.HTTP_400_BAD_REQUEST,
         )
+
+    @app.exception_handler(ReadOnlyTransactionError)
+    def _(_: object, __: object) -> Response:
+        schema = ReadOnlyTransactionSchema()
+        return JSONResponse(
+            schema.model_dump(mode="json", by_alias=True),
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
+
+    @app.exception_handler(SnapshotTooOldError)
+    def _(_: object, __: object) -> Response:
+        return JSONResponse(
+            SnapshotTooOldSchema().model_dump(mode="json", by_alias=True),
+            status_code=status.HTTP_409_CONFLICT,
+        )
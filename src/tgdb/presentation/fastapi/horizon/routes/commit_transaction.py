@@ -11,6 +11,7 @@ from tgdb.presentation.fastapi.common.schemas.operator import OperatorSchema
 from tgdb.presentation.fastapi.common.tags import Tag
 from tgdb.presentation.fastapi.horizon.schemas.error import (
     NoTransactionSchema,
+    ReadOnlyTransactionSchema,
     TransactionCommittingSchema,
     TransactionConflictSchema,
 )
@@ -33,7 +34,11 @@ class CommitTransactionSchema(BaseModel):
         status.HTTP_204_NO_CONTENT: {"content": None},
         status.HTTP_404_NOT_FOUND: {"model": NoTransactionSchema},
         status.HTTP_400_BAD_REQUEST: {
-            "model": InvalidRelationTupleSchema | TransactionCommittingSchema,
+            "model": (
+                InvalidRelationTupleSchema
+                | TransactionCommittingSchema
+                | ReadOnlyTransactionSchema
+            ),
         },
         status.HTTP_409_CONFLICT: {"model": TransactionConflictSchema},
     },
@@ -16,6 +16,7 @@ start_transaction_router = APIRouter()
 
 class StartTransactionSchema(BaseModel):
     isolation_level: IsolationLevelSchema = Field(alias="isolationLevel")
+    is_read_only: bool = Field(alias="isReadOnly", default=False)
 
 
 class StartedTransactionSchema(BaseModel):
@@ -37,7 +38,10 @@ async def _(
     start_transaction: FromDishka[StartTransaction],
     request_body: StartTransactionSchema,
 ) -> Response:
-    xid = await start_transaction(request_body.isolation_level.decoded())
+    xid = await start_transaction(
+        request_body.isolation_level.decoded(),
+        is_read_only=request_body.is_read_only,
+    )
 
     response_body_model = StartedTransactionSchema(xid=xid)
     response_body = response_body_model.model_dump(mode="json", by_alias=True)
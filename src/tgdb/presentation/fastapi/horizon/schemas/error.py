@@ -36,3 +36,21 @@ class TransactionCommittingSchema(BaseModel):
     """
 
     type: Literal["transactionCommitting"] = "transactionCommitting"
+
+
+class ReadOnlyTransactionSchema(BaseModel):
+    """
+    Read-only transaction cannot be committed with operators, so it was rolled
+    back.
+    """
+
+    type: Literal["readOnlyTransaction"] = "readOnlyTransaction"
+
+
+class SnapshotTooOldSchema(BaseModel):
+    """
+    Versions visible to the transaction snapshot are no longer kept, so the
+    transaction was rolled back.
+    """
+
+    type: Literal["snapshotTooOld"] = "snapshotTooOld"
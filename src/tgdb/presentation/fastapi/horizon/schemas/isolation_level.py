@@ -5,12 +5,18 @@ from tgdb.entities.horizon.transaction import IsolationLevel
 
 class IsolationLevelSchema(StrEnum):
     serializable = "serializable"
+    snapshot = "snapshot"
+    read_committed = "readCommitted"
     read_uncommited = "readUncommited"
 
     def decoded(self) -> IsolationLevel:
         match self:
             case IsolationLevelSchema.serializable:
                 return IsolationLevel.serializable
+            case IsolationLevelSchema.snapshot:
+                return IsolationLevel.snapshot
+            case IsolationLevelSchema.read_committed:
+                return IsolationLevel.read_committed
             case IsolationLevelSchema.read_uncommited:
                 return IsolationLevel.read_uncommited
 
@@ -19,5 +25,9 @@ class IsolationLevelSchema(StrEnum):
         match level:
             case IsolationLevel.serializable:
                 return IsolationLevelSchema.serializable
+            case IsolationLevel.snapshot:
+                return IsolationLevelSchema.snapshot
+            case IsolationLevel.read_committed:
+                return IsolationLevelSchema.read_committed
             case IsolationLevel.read_uncommited:
                 return IsolationLevelSchema.read_uncommited
@@ -5,13 +5,19 @@ from tgdb.application.relation.ports.relations import (
     NoRelationError,
     NotUniqueRelationNumberError,
 )
-from tgdb.application.relation.ports.tuples import OversizedRelationSchemaError
+from tgdb.application.relation.ports.tuples import (
+    OversizedRelationSchemaError,
+    UnindexedPredicateError,
+)
+from tgdb.entities.relation.predicate import InvalidRangeError
 from tgdb.entities.relation.tuple_effect import InvalidRelationTupleError
 from tgdb.presentation.fastapi.relation.schemas.error import (
+    InvalidRangeSchema,
     InvalidRelationTupleSchema,
     NoRelationSchema,
     NotUniqueRelationNumberSchema,
     OversizedRelationSchemaSchema,
+    UnindexedPredicateSchema,
 )
 
 
@@ -51,3 +57,21 @@ def add_relation_error_handling(app: FastAPI) -> None:
             schema.model_dump(mode="json", by_alias=True),
             status_code=status.HTTP_400_BAD_REQUEST,
         )
+
+    @app.exception_handler(InvalidRangeError)
+    def _(_: object, __: object) -> Response:
+        schema = InvalidRangeSchema()
+
+        return JSONResponse(
+            schema.model_dump(mode="json", by_alias=True),
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
+
+    @app.exception_handler(UnindexedPredicateError)
+    def _(_: object, __: object) -> Response:
+        schema = UnindexedPredicateSchema()
+
+        return JSONResponse(
+            schema.model_dump(mode="json", by_alias=True),
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
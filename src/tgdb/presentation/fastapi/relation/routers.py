@@ -7,6 +7,12 @@ from tgdb.presentation.fastapi.relation.routes.view_all_relations import (
 from tgdb.presentation.fastapi.relation.routes.view_relation import (
     view_relation_router,
 )
+from tgdb.presentation.fastapi.relation.routes.view_tuple_plan import (
+    view_tuple_plan_router,
+)
+from tgdb.presentation.fastapi.relation.routes.view_tuple_stream import (
+    view_tuple_stream_router,
+)
 from tgdb.presentation.fastapi.relation.routes.view_tuples import (
     view_tuples_router,
 )
@@ -17,4 +23,6 @@ relation_routers = (
     view_relation_router,
     create_relation_router,
     view_tuples_router,
+    view_tuple_stream_router,
+    view_tuple_plan_router,
 )
@@ -0,0 +1,50 @@
+from typing import Annotated
+
+from annotated_types import Ge
+from dishka.integrations.fastapi import FromDishka, inject
+from fastapi import APIRouter, status
+from fastapi.responses import JSONResponse, Response
+
+from tgdb.application.relation.view_tuple_plan import ViewTuplePlan
+from tgdb.entities.numeration.number import Number
+from tgdb.presentation.fastapi.common.tags import Tag
+from tgdb.presentation.fastapi.relation.schemas.error import (
+    InvalidRangeSchema,
+    NoRelationSchema,
+)
+from tgdb.presentation.fastapi.relation.schemas.plan import TuplePlanSchema
+from tgdb.presentation.fastapi.relation.schemas.predicate import (
+    PredicateSchema,
+)
+
+
+view_tuple_plan_router = APIRouter()
+
+
+@view_tuple_plan_router.post(
+    "/relations/{relation_number}/viewed-tuples/plan",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {"model": TuplePlanSchema},
+        status.HTTP_400_BAD_REQUEST: {"model": InvalidRangeSchema},
+        status.HTTP_404_NOT_FOUND: {"model": NoRelationSchema},
+    },
+    summary="View tuple plan",
+    description="View how tuples matching a predicate would be found.",
+    tags=[Tag.relation],
+)
+@inject
+async def _(
+    view_tuple_plan: FromDishka[ViewTuplePlan],
+    relation_number: Annotated[int, Ge(0)],
+    request_body: PredicateSchema,
+) -> Response:
+    plan = await view_tuple_plan(
+        Number(relation_number),
+        request_body.decoded(),
+    )
+
+    response_body_model = TuplePlanSchema.of(plan)
+    response_body = response_body_model.model_dump(mode="json", by_alias=True)
+
+    return JSONResponse(response_body, status_code=status.HTTP_200_OK)
@@ -0,0 +1,145 @@
+from collections.abc import AsyncIterator
+from typing import Annotated
+
+from annotated_types import Ge
+from dishka.integrations.fastapi import FromDishka, inject
+from fastapi import APIRouter, status
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel
+
+from tgdb.application.relation.ports.tuples import (
+    TupleChunk,
+    UnindexedPredicateError,
+)
+from tgdb.application.relation.view_tuple_stream import ViewTupleStream
+from tgdb.entities.horizon.horizon import (
+    NoTransactionError,
+    TransactionCommittingError,
+)
+from tgdb.entities.horizon.transaction import XID, SnapshotTooOldError
+from tgdb.entities.numeration.number import Number
+from tgdb.presentation.fastapi.common.tags import Tag
+from tgdb.presentation.fastapi.horizon.schemas.error import (
+    NoTransactionSchema,
+    SnapshotTooOldSchema,
+    TransactionCommittingSchema,
+)
+from tgdb.presentation.fastapi.relation.schemas.error import (
+    InvalidRangeSchema,
+    NoRelationSchema,
+    UnindexedPredicateSchema,
+)
+from tgdb.presentation.fastapi.relation.schemas.predicate import (
+    PredicateSchema,
+)
+from tgdb.presentation.fastapi.relation.schemas.tuple import TupleSchema
+
+
+view_tuple_stream_router = APIRouter()
+
+
+class ViewedTupleChunkSchema(BaseModel):
+    tuples: tuple[TupleSchema, ...]
+    cursor: int
+
+    @classmethod
+    def of(cls, chunk: TupleChunk) -> "ViewedTupleChunkSchema":
+        tuple_schemas = tuple(map(TupleSchema.of, chunk.tuples))
+
+        return ViewedTupleChunkSchema(tuples=tuple_schemas, cursor=chunk.cursor)
+
+
+class ViewedTupleStreamErrorSchema(BaseModel):
+    """
+    Last line of a stream that was interrupted after its start.
+    """
+
+    error: (
+        NoTransactionSchema
+        | TransactionCommittingSchema
+        | SnapshotTooOldSchema
+        | UnindexedPredicateSchema
+    )
+
+
+@view_tuple_stream_router.post(
+    "/relations/{relation_number}/viewed-tuples/stream",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {
+            "content": {"application/x-ndjson": {}},
+            "model": ViewedTupleChunkSchema | ViewedTupleStreamErrorSchema,
+        },
+        status.HTTP_400_BAD_REQUEST: {
+            "model": (
+                TransactionCommittingSchema
+                | InvalidRangeSchema
+                | UnindexedPredicateSchema
+            ),
+        },
+        status.HTTP_404_NOT_FOUND: {
+            "model": NoRelationSchema | NoTransactionSchema,
+        },
+        status.HTTP_409_CONFLICT: {"model": SnapshotTooOldSchema},
+    },
+    summary="Stream viewed tuples",
+    description=(
+        "Stream tuples as NDJSON, one line per fetched heap page, optionally"
+        " in an active transaction. A `cursor` of a line continues the stream"
+        " after it. If the stream is interrupted after its start, its last"
+        " line is an `error` object."
+    ),
+    tags=[Tag.relation],
+)
+@inject
+async def _(
+    view_tuple_stream: FromDishka[ViewTupleStream],
+    relation_number: Annotated[int, Ge(0)],
+    request_body: PredicateSchema,
+    xid: XID | None = None,
+    cursor: int | None = None,
+) -> Response:
+    chunks = await view_tuple_stream(
+        xid,
+        Number(relation_number),
+        request_body.decoded(),
+        cursor,
+    )
+
+    return StreamingResponse(
+        _encoded_chunks(chunks),
+        status_code=status.HTTP_200_OK,
+        media_type="application/x-ndjson",
+    )
+
+
+async def _encoded_chunks(
+    chunks: AsyncIterator[TupleChunk],
+) -> AsyncIterator[str]:
+    try:
+        async for chunk in chunks:
+            chunk_schema = ViewedTupleChunkSchema.of(chunk)
+
+            yield f"{chunk_schema.model_dump_json(by_alias=True)}\n"
+
+    except NoTransactionError:
+        yield _encoded_error(NoTransactionSchema())
+    except TransactionCommittingError:
+        yield _encoded_error(TransactionCommittingSchema())
+    except SnapshotTooOldError:
+        yield _encoded_error(SnapshotTooOldSchema())
+    except UnindexedPredicateError:
+        yield _encoded_error(UnindexedPredicateSchema())
+
+
+def _encoded_error(
+    error_schema: (
+        NoTransactionSchema
+        | TransactionCommittingSchema
+        | SnapshotTooOldSchema
+        | UnindexedPredicateSchema
+    ),
+) -> str:
+    schema = ViewedTupleStreamErrorSchema(error=error_schema)
+
+    return f"{schema.model_dump_json(by_alias=True)}\n"
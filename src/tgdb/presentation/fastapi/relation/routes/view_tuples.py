@@ -1,4 +1,3 @@
-from collections.abc import Iterable
 from typing import Annotated
 
 from annotated_types import Ge
@@ -7,36 +6,41 @@ from fastapi import APIRouter, status
 from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel, Field
 
-from tgdb.application.relation.view_tuples import ViewTuples
+from tgdb.application.relation.view_tuples import ViewedTuples, ViewTuples
 from tgdb.entities.horizon.transaction import XID
 from tgdb.entities.numeration.number import Number
-from tgdb.entities.relation.scalar import Scalar
-from tgdb.entities.relation.tuple import Tuple
 from tgdb.presentation.fastapi.common.tags import Tag
 from tgdb.presentation.fastapi.horizon.schemas.error import (
     NoTransactionSchema,
+    SnapshotTooOldSchema,
     TransactionCommittingSchema,
 )
-from tgdb.presentation.fastapi.relation.schemas.error import NoRelationSchema
+from tgdb.presentation.fastapi.relation.schemas.error import (
+    InvalidRangeSchema,
+    NoRelationSchema,
+    UnindexedPredicateSchema,
+)
+from tgdb.presentation.fastapi.relation.schemas.predicate import (
+    PredicateSchema,
+)
 from tgdb.presentation.fastapi.relation.schemas.tuple import TupleSchema
 
 
 view_tuples_router = APIRouter()
 
 
-class ViewTupleSchema(BaseModel):
-    attribute_number: Annotated[int, Ge(0)] = Field(alias="attributeNumber")
-    attribute_scalar: Scalar = Field(alias="attributeScalar")
-
-
 class ViewedTuplesSchema(BaseModel):
     tuples: tuple[TupleSchema, ...]
+    next_cursor: int | None = Field(alias="nextCursor")
 
     @classmethod
-    def of(cls, tuples: Iterable[Tuple]) -> "ViewedTuplesSchema":
-        tuple_schemas = tuple(map(TupleSchema.of, tuples))
+    def of(cls, viewed_tuples: ViewedTuples) -> "ViewedTuplesSchema":
+        tuple_schemas = tuple(map(TupleSchema.of, viewed_tuples.tuples))
 
-        return ViewedTuplesSchema(tuples=tuple_schemas)
+        return ViewedTuplesSchema(
+            tuples=tuple_schemas,
+            nextCursor=viewed_tuples.next_cursor,
+        )
 
 
 @view_tuples_router.post(
@@ -44,30 +48,45 @@ class ViewedTuplesSchema(BaseModel):
     status_code=status.HTTP_200_OK,
     responses={
         status.HTTP_200_OK: {"model": ViewedTuplesSchema},
-        status.HTTP_400_BAD_REQUEST: {"model": TransactionCommittingSchema},
+        status.HTTP_400_BAD_REQUEST: {
+            "model": (
+                TransactionCommittingSchema
+                | InvalidRangeSchema
+                | UnindexedPredicateSchema
+            ),
+        },
         status.HTTP_404_NOT_FOUND: {
             "model": NoRelationSchema | NoTransactionSchema,
         },
+        status.HTTP_409_CONFLICT: {"model": SnapshotTooOldSchema},
     },
     summary="View tuples",
-    description="View tuples, optionally in an active transaction.",
+    description=(
+        "View tuples whose attribute is equal to a scalar, lies in a range"
+        " or starts with a prefix, optionally in an active transaction."
+        " With `limit`, at least `limit` tuples are returned when there are"
+        " enough of them, and `nextCursor` continues the view."
+    ),
     tags=[Tag.relation],
 )
 @inject
-async def _(
+async def _(  # noqa: PLR0913, PLR0917
     view_tuples: FromDishka[ViewTuples],
     relation_number: Annotated[int, Ge(0)],
-    request_body: ViewTupleSchema,
+    request_body: PredicateSchema,
     xid: XID | None = None,
+    cursor: int | None = None,
+    limit: Annotated[int, Ge(1)] | None = None,
 ) -> Response:
-    tuples = await view_tuples(
+    viewed_tuples = await view_tuples(
         xid,
         Number(relation_number),
-        Number(request_body.attribute_number),
-        request_body.attribute_scalar,
+        request_body.decoded(),
+        cursor,
+        limit,
     )
 
-    response_body_model = ViewedTuplesSchema.of(tuples)
+    response_body_model = ViewedTuplesSchema.of(viewed_tuples)
     response_body = response_body_model.model_dump(mode="json", by_alias=True)
 
     return JSONResponse(response_body, status_code=status.HTTP_200_OK)
@@ -21,6 +21,23 @@ class NotUniqueRelationNumberSchema(BaseModel):
     type: Literal["notUniqueRelationNumber"] = "notUniqueRelationNumber"
 
 
+class InvalidRangeSchema(BaseModel):
+    """
+    Range bounds are missing, have different types or are nones.
+    """
+
+    type: Literal["invalidRange"] = "invalidRange"
+
+
+class UnindexedPredicateSchema(BaseModel):
+    """
+    Predicate needs a scan of the whole heap, because it has no equality
+    and the relation has no attribute index.
+    """
+
+    type: Literal["unindexedPredicate"] = "unindexedPredicate"
+
+
 class OversizedRelationSchemaSchema(BaseModel):
     type: Literal["oversizedSchema"] = "oversizedSchema"
     schema_size: int = Field(alias="schemaSize")
@@ -0,0 +1,31 @@
+from pydantic import BaseModel, Field
+
+from tgdb.application.relation.ports.tuples import TupleAccess, TuplePlan
+from tgdb.presentation.fastapi.relation.schemas.predicate import (
+    AttributePredicateSchema,
+    attribute_predicate_schema,
+)
+
+
+class TuplePlanSchema(BaseModel):
+    access: TupleAccess
+    access_predicates: tuple[AttributePredicateSchema, ...] = Field(
+        alias="accessPredicates",
+    )
+    filter_predicates: tuple[AttributePredicateSchema, ...] = Field(
+        alias="filterPredicates",
+    )
+    page_count: int | None = Field(alias="pageCount")
+
+    @classmethod
+    def of(cls, plan: TuplePlan) -> "TuplePlanSchema":
+        return TuplePlanSchema(
+            access=plan.access,
+            accessPredicates=tuple(
+                map(attribute_predicate_schema, plan.access_predicates),
+            ),
+            filterPredicates=tuple(
+                map(attribute_predicate_schema, plan.filter_predicates),
+            ),
+            pageCount=plan.page_count,
+        )
@@ -0,0 +1,129 @@
+from typing import Annotated, Literal
+
+from annotated_types import Ge
+from pydantic import BaseModel, Field
+
+from tgdb.entities.numeration.number import Number
+from tgdb.entities.relation.predicate import (
+    AttributePredicate,
+    Bound,
+    ConjunctivePredicate,
+    EqualityPredicate,
+    PrefixPredicate,
+    RangePredicate,
+)
+from tgdb.entities.relation.scalar import Scalar
+
+
+class EqualityPredicateSchema(BaseModel):
+    type: Literal["equality"] = "equality"
+    attribute_number: Annotated[int, Ge(0)] = Field(alias="attributeNumber")
+    attribute_scalar: Scalar = Field(alias="attributeScalar")
+
+    @classmethod
+    def of(cls, predicate: EqualityPredicate) -> "EqualityPredicateSchema":
+        return cls(
+            attributeNumber=int(predicate.attribute_number),
+            attributeScalar=predicate.scalar,
+        )
+
+    def decoded(self) -> EqualityPredicate:
+        return EqualityPredicate(
+            Number(self.attribute_number),
+            self.attribute_scalar,
+        )
+
+
+class BoundSchema(BaseModel):
+    scalar: Scalar
+    is_inclusive: bool = Field(alias="isInclusive", default=True)
+
+    @classmethod
+    def of(cls, bound: Bound) -> "BoundSchema":
+        return cls(scalar=bound.scalar, isInclusive=bound.is_inclusive)
+
+    def decoded(self) -> Bound:
+        return Bound(self.scalar, self.is_inclusive)
+
+
+class RangePredicateSchema(BaseModel):
+    type: Literal["range"]
+    attribute_number: Annotated[int, Ge(0)] = Field(alias="attributeNumber")
+    min: BoundSchema | None = None
+    max: BoundSchema | None = None
+
+    @classmethod
+    def of(cls, predicate: RangePredicate) -> "RangePredicateSchema":
+        lower_bound = predicate.lower_bound
+        upper_bound = predicate.upper_bound
+
+        return cls(
+            type="range",
+            attributeNumber=int(predicate.attribute_number),
+            min=None if lower_bound is None else BoundSchema.of(lower_bound),
+            max=None if upper_bound is None else BoundSchema.of(upper_bound),
+        )
+
+    def decoded(self) -> RangePredicate:
+        """
+        :raises tgdb.entities.relation.predicate.InvalidRangeError:
+        """
+
+        return RangePredicate(
+            Number(self.attribute_number),
+            None if self.min is None else self.min.decoded(),
+            None if self.max is None else self.max.decoded(),
+        )
+
+
+class PrefixPredicateSchema(BaseModel):
+    type: Literal["prefix"]
+    attribute_number: Annotated[int, Ge(0)] = Field(alias="attributeNumber")
+    prefix: str
+
+    @classmethod
+    def of(cls, predicate: PrefixPredicate) -> "PrefixPredicateSchema":
+        return cls(
+            type="prefix",
+            attributeNumber=int(predicate.attribute_number),
+            prefix=predicate.prefix,
+        )
+
+    def decoded(self) -> PrefixPredicate:
+        return PrefixPredicate(Number(self.attribute_number), self.prefix)
+
+
+type AttributePredicateSchema = (
+    EqualityPredicateSchema | RangePredicateSchema | PrefixPredicateSchema
+)
+
+
+class ConjunctivePredicateSchema(BaseModel):
+    type: Literal["and"]
+    predicates: tuple[AttributePredicateSchema, ...] = Field(min_length=1)
+
+    def decoded(self) -> ConjunctivePredicate:
+        """
+        :raises tgdb.entities.relation.predicate.InvalidRangeError:
+        """
+
+        return ConjunctivePredicate(
+            tuple(predicate.decoded() for predicate in self.predicates),
+        )
+
+
+type PredicateSchema = AttributePredicateSchema | ConjunctivePredicateSchema
+
+
+def attribute_predicate_schema(
+    predicate: AttributePredicate,
+) -> AttributePredicateSchema:
+    match predicate:
+        case EqualityPredicate():
+            return EqualityPredicateSchema.of(predicate)
+
+        case RangePredicate():
+            return RangePredicateSchema.of(predicate)
+
+        case PrefixPredicate():
+            return PrefixPredicateSchema.of(predicate)
@@ -7,6 +7,7 @@ from tgdb.entities.horizon.horizon import (
     DoubleStartTransactionError,
     Horizon,
     NoTransactionError,
+    ReadOnlyTransactionError,
 )
 from tgdb.entities.horizon.horizon import (
     horizon as horizon_,
@@ -18,7 +19,11 @@ from tgdb.entities.horizon.transaction import (
     PreparedCommit,
 )
 from tgdb.entities.relation.tuple import tuple_
-from tgdb.entities.relation.tuple_effect import MutatedTuple, NewTuple
+from tgdb.entities.relation.tuple_effect import (
+    JustViewedTuple,
+    MutatedTuple,
+    NewTuple,
+)
 
 
 @fixture
@@ -510,14 +515,14 @@ def test_max_len() -> None:
 
 def test_max_transaction_age() -> None:
     """
-    ##
+    #
     |---
      |--
       |-
        |
     """
 
-    horizon = horizon_(max_len=1000, time=0, max_transaction_age=2)
+    horizon = horizon_(max_len=1000, time=0, max_transaction_age=1)
 
     horizon.start_transaction(1, UUID(int=1), IsolationLevel.serializable)
     assert len(horizon) == 1
@@ -584,3 +589,210 @@ def test_read_uncommited_commit(horizon: Horizon) -> None:
         UUID(int=1),
         frozenset({MutatedTuple(tuple_(tid=UUID(int=2)))}),
     )
+
+
+@mark.timeout(1)
+def test_max_transaction_age_with_prepared_transaction() -> None:
+    """
+    |-|-------
+      |--x
+    """
+
+    horizon = horizon_(max_len=1000, time=0, max_transaction_age=2)
+
+    horizon.start_transaction(1, UUID(int=1), IsolationLevel.serializable)
+    horizon.commit_transaction(2, UUID(int=1), [])
+    horizon.start_transaction(3, UUID(int=2), IsolationLevel.serializable)
+    horizon.move_to_future(10)
+
+    assert len(horizon) == 1
+    assert horizon.complete_commit(11, UUID(int=1)) == Commit(
+        UUID(int=1),
+        frozenset(),
+    )
+
+
+@mark.timeout(1)
+def test_max_len_with_prepared_transactions() -> None:
+    """
+    |-|----
+     |-|---
+       |x
+    """
+
+    horizon = horizon_(max_len=2, time=0, max_transaction_age=1000)
+
+    horizon.start_transaction(1, UUID(int=1), IsolationLevel.serializable)
+    horizon.start_transaction(2, UUID(int=2), IsolationLevel.serializable)
+    horizon.commit_transaction(3, UUID(int=1), [])
+    horizon.commit_transaction(4, UUID(int=2), [])
+    horizon.start_transaction(5, UUID(int=3), IsolationLevel.serializable)
+
+    assert len(horizon) == 2
+
+    with raises(NoTransactionError):
+        horizon.rollback_transaction(6, UUID(int=3))
+
+
+def test_conflict_with_transaction_prepared_before_start(
+    horizon: Horizon,
+) -> None:
+    """
+    |-|--|
+        |--|
+    """
+
+    horizon.start_transaction(1, UUID(int=1), IsolationLevel.serializable)
+    horizon.commit_transaction(
+        2,
+        UUID(int=1),
+        [MutatedTuple(tuple_("a", tid=UUID(int=1)))],
+    )
+    horizon.start_transaction(3, UUID(int=2), IsolationLevel.serializable)
+    horizon.complete_commit(4, UUID(int=1))
+
+    with raises(ConflictError):
+        horizon.commit_transaction(
+            5,
+            UUID(int=2),
+            [MutatedTuple(tuple_("b", tid=UUID(int=1)))],
+        )
+
+
+@mark.parametrize(
+    "isolation",
+    [
+        IsolationLevel.snapshot,
+        IsolationLevel.read_committed,
+        IsolationLevel.read_uncommited,
+    ],
+)
+def test_read_only_commit(horizon: Horizon, isolation: IsolationLevel) -> None:
+    """
+    |--r--|   (read only)
+      |w|-|
+    """
+
+    horizon.start_transaction(1, UUID(int=1), isolation, is_read_only=True)
+    horizon.start_transaction(2, UUID(int=2), IsolationLevel.serializable)
+
+    horizon.include(3, UUID(int=1), JustViewedTuple(UUID(int=100)))
+    horizon.commit_transaction(
+        4,
+        UUID(int=2),
+        [MutatedTuple(tuple_("a", tid=UUID(int=100)))],
+    )
+    horizon.complete_commit(5, UUID(int=2))
+
+    commit = horizon.commit_transaction(6, UUID(int=1), [])
+
+    assert commit == Commit(UUID(int=1), frozenset())
+    assert not horizon
+
+
+def test_read_only_serializable_conflict(horizon: Horizon) -> None:
+    """
+    |--r--|   (read only)
+      |w|-|
+    """
+
+    horizon.start_transaction(
+        1,
+        UUID(int=1),
+        IsolationLevel.serializable,
+        is_read_only=True,
+    )
+    horizon.start_transaction(2, UUID(int=2), IsolationLevel.serializable)
+
+    horizon.include(3, UUID(int=1), JustViewedTuple(UUID(int=100)))
+    horizon.commit_transaction(
+        4,
+        UUID(int=2),
+        [MutatedTuple(tuple_("a", tid=UUID(int=100)))],
+    )
+    horizon.complete_commit(5, UUID(int=2))
+
+    with raises(ConflictError):
+        horizon.commit_transaction(6, UUID(int=1), [])
+
+    assert not horizon
+
+
+def test_read_only_serializable_commit(horizon: Horizon) -> None:
+    """
+    |--r--|   (read only)
+      |w|-|
+    """
+
+    horizon.start_transaction(
+        1,
+        UUID(int=1),
+        IsolationLevel.serializable,
+        is_read_only=True,
+    )
+    horizon.start_transaction(2, UUID(int=2), IsolationLevel.serializable)
+
+    horizon.include(3, UUID(int=1), JustViewedTuple(UUID(int=100)))
+    horizon.commit_transaction(
+        4,
+        UUID(int=2),
+        [MutatedTuple(tuple_("a", tid=UUID(int=101)))],
+    )
+    horizon.complete_commit(5, UUID(int=2))
+
+    commit = horizon.commit_transaction(6, UUID(int=1), [])
+
+    assert commit == Commit(UUID(int=1), frozenset())
+    assert not horizon
+
+
+def test_read_only_commit_with_writes(horizon: Horizon) -> None:
+    horizon.start_transaction(
+        1,
+        UUID(int=1),
+        IsolationLevel.serializable,
+        is_read_only=True,
+    )
+
+    with raises(ReadOnlyTransactionError):
+        horizon.commit_transaction(
+            2,
+            UUID(int=1),
+            [NewTuple(tuple_("a", tid=UUID(int=100)))],
+        )
+
+    assert not horizon
+
+
+def test_conflict_with_many_viewed_tuples(horizon: Horizon) -> None:
+    """
+    |-rr----|
+      |w|-|
+    """
+
+    horizon.start_transaction(1, UUID(int=1), IsolationLevel.serializable)
+    horizon.start_transaction(2, UUID(int=2), IsolationLevel.serializable)
+
+    horizon.include_many(
+        3,
+        UUID(int=1),
+        [JustViewedTuple(UUID(int=100)), JustViewedTuple(UUID(int=101))],
+    )
+    horizon.commit_transaction(
+        4,
+        UUID(int=2),
+        [MutatedTuple(tuple_("a", tid=UUID(int=101)))],
+    )
+    horizon.complete_commit(5, UUID(int=2))
+
+    with raises(ConflictError):
+        horizon.commit_transaction(6, UUID(int=1), [])
+
+
+def test_many_viewed_tuples_of_old_transaction() -> None:
+    horizon = horizon_(max_len=1000, time=0, max_transaction_age=2)
+
+    horizon.start_transaction(1, UUID(int=1), IsolationLevel.serializable)
+
+    with raises(NoTransactionError):
+        horizon.include_many(4, UUID(int=1), [JustViewedTuple(UUID(int=100))])
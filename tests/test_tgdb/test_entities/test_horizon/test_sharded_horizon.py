@@ -0,0 +1,225 @@
+from uuid import UUID
+
+from pytest import fixture, raises
+
+from tgdb.entities.horizon.claim import Claim
+from tgdb.entities.horizon.horizon import (
+    Horizon,
+    HorizonAlwaysWithoutTransactionsError,
+    NoTransactionError,
+    TransactionCommittingError,
+    sharded_horizons,
+)
+from tgdb.entities.horizon.transaction import (
+    Commit,
+    ConflictError,
+    IsolationLevel,
+)
+from tgdb.entities.relation.tuple import tuple_
+from tgdb.entities.relation.tuple_effect import MutatedTuple
+
+
+@fixture
+def horizons() -> tuple[Horizon, Horizon]:
+    horizon1, horizon2 = sharded_horizons(0, 1000, 1_000_000_000, 2)
+    return horizon1, horizon2
+
+
+def test_without_shards() -> None:
+    with raises(HorizonAlwaysWithoutTransactionsError):
+        sharded_horizons(0, 1000, 1_000_000_000, 0)
+
+
+def test_conflict_between_shards(horizons: tuple[Horizon, Horizon]) -> None:
+    """
+    |---||   (shard 1)
+       |---| (shard 2)
+    """
+
+    horizon1, horizon2 = horizons
+
+    horizon1.start_transaction(1, UUID(int=1), IsolationLevel.serializable)
+    horizon2.start_transaction(2, UUID(int=2), IsolationLevel.serializable)
+
+    horizon1.commit_transaction(
+        3,
+        UUID(int=1),
+        [MutatedTuple(tuple_("a", tid=UUID(int=1)))],
+    )
+    horizon1.complete_commit(4, UUID(int=1))
+
+    with raises(ConflictError):
+        horizon2.commit_transaction(
+            5,
+            UUID(int=2),
+            [MutatedTuple(tuple_("b", tid=UUID(int=1)))],
+        )
+
+    assert not horizon2
+
+
+def test_claim_conflict_between_shards(
+    horizons: tuple[Horizon, Horizon],
+) -> None:
+    """
+    |---|    (shard 1)
+      |---|  (shard 2)
+    """
+
+    horizon1, horizon2 = horizons
+    claim = Claim(UUID(int=10), "x")
+
+    horizon1.start_transaction(1, UUID(int=1), IsolationLevel.serializable)
+    horizon2.start_transaction(2, UUID(int=2), IsolationLevel.serializable)
+
+    horizon1.commit_transaction(3, UUID(int=1), [claim])
+
+    with raises(ConflictError) as error:
+        horizon2.commit_transaction(4, UUID(int=2), [claim])
+
+    assert error.value == ConflictError(UUID(int=2), frozenset({claim}))
+
+
+def test_sequential_transactions_between_shards(
+    horizons: tuple[Horizon, Horizon],
+) -> None:
+    """
+    |--|-|        (shard 1)
+           |--|-| (shard 2)
+    """
+
+    horizon1, horizon2 = horizons
+
+    horizon1.start_transaction(1, UUID(int=1), IsolationLevel.serializable)
+    horizon1.commit_transaction(
+        2,
+        UUID(int=1),
+        [MutatedTuple(tuple_("a", tid=UUID(int=1)))],
+    )
+    horizon1.complete_commit(3, UUID(int=1))
+
+    horizon2.start_transaction(4, UUID(int=2), IsolationLevel.serializable)
+    horizon2.commit_transaction(
+        5,
+        UUID(int=2),
+        [MutatedTuple(tuple_("b", tid=UUID(int=1)))],
+    )
+    commit = horizon2.complete_commit(6, UUID(int=2))
+
+    assert commit == Commit(
+        UUID(int=2),
+        {MutatedTuple(tuple_("b", tid=UUID(int=1)))},
+    )
+
+
+def test_rollbacked_transaction_between_shards(
+    horizons: tuple[Horizon, Horizon],
+) -> None:
+    """
+    |--|x    (shard 1)
+      |---|  (shard 2)
+    """
+
+    horizon1, horizon2 = horizons
+
+    horizon1.start_transaction(1, UUID(int=1), IsolationLevel.serializable)
+    horizon2.start_transaction(2, UUID(int=2), IsolationLevel.serializable)
+
+    horizon1.commit_transaction(
+        3,
+        UUID(int=1),
+        [MutatedTuple(tuple_("a", tid=UUID(int=1)))],
+    )
+
+    with raises(TransactionCommittingError):
+        horizon1.rollback_transaction(4, UUID(int=1))
+
+    horizon2.commit_transaction(
+        5,
+        UUID(int=2),
+        [MutatedTuple(tuple_("b", tid=UUID(int=1)))],
+    )
+    commit = horizon2.complete_commit(6, UUID(int=2))
+
+    assert commit.xid == UUID(int=2)
+
+
+def test_disjoint_transactions_between_shards(
+    horizons: tuple[Horizon, Horizon],
+) -> None:
+    """
+    |---|    (shard 1)
+      |---|  (shard 2)
+    """
+
+    horizon1, horizon2 = horizons
+
+    horizon1.start_transaction(1, UUID(int=1), IsolationLevel.serializable)
+    horizon2.start_transaction(2, UUID(int=2), IsolationLevel.serializable)
+
+    horizon1.commit_transaction(
+        3,
+        UUID(int=1),
+        [MutatedTuple(tuple_("a", tid=UUID(int=1)))],
+    )
+    horizon2.commit_transaction(
+        4,
+        UUID(int=2),
+        [MutatedTuple(tuple_("b", tid=UUID(int=2)))],
+    )
+
+    assert horizon1.complete_commit(5, UUID(int=1)).xid == UUID(int=1)
+    assert horizon2.complete_commit(6, UUID(int=2)).xid == UUID(int=2)
+
+
+def test_expiration_in_idle_shard() -> None:
+    """
+    |---------x (shard 1, expired)
+      |w|-| |   (shard 2)
+    """
+
+    horizon1, horizon2 = sharded_horizons(0, 1000, 10, 2)
+
+    horizon1.start_transaction(1, UUID(int=1), IsolationLevel.snapshot)
+
+    horizon2.start_transaction(2, UUID(int=2), IsolationLevel.serializable)
+    horizon2.commit_transaction(
+        3,
+        UUID(int=2),
+        [MutatedTuple(tuple_("a", tid=UUID(int=100)))],
+    )
+    horizon2.complete_commit(4, UUID(int=2))
+
+    assert horizon2._coordinator._versions_by_tid  # noqa: SLF001
+
+    horizon2.start_transaction(20, UUID(int=3), IsolationLevel.serializable)
+
+    assert not horizon2._coordinator._versions_by_tid  # noqa: SLF001
+
+    with raises(NoTransactionError):
+        horizon1.rollback_transaction(21, UUID(int=1))
+
+
+def test_start_in_idle_shard() -> None:
+    """
+    |-|                      (shard 1)
+                     |--|-|  (shard 2)
+    """
+
+    horizon1, horizon2 = sharded_horizons(0, 1000, 10, 2)
+
+    horizon1.start_transaction(99, UUID(int=1), IsolationLevel.serializable)
+    horizon1.rollback_transaction(100, UUID(int=1))
+
+    horizon2.start_transaction(200, UUID(int=2), IsolationLevel.serializable)
+
+    assert len(horizon2) == 1
+
+    horizon2.commit_transaction(
+        201,
+        UUID(int=2),
+        [MutatedTuple(tuple_("a", tid=UUID(int=1)))],
+    )
+    commit = horizon2.complete_commit(202, UUID(int=2))
+
+    assert commit.xid == UUID(int=2)
@@ -0,0 +1,381 @@
+from uuid import UUID
+
+from pytest import fixture, raises
+
+from tgdb.entities.horizon.horizon import Horizon, NoTransactionError
+from tgdb.entities.horizon.horizon import horizon as horizon_
+from tgdb.entities.horizon.transaction import (
+    ConflictError,
+    IsolationLevel,
+    SnapshotTooOldError,
+)
+from tgdb.entities.numeration.number import Number
+from tgdb.entities.relation.predicate import EqualityPredicate
+from tgdb.entities.relation.relation import RelationSchemaID
+from tgdb.entities.relation.tuple import Tuple, tuple_
+from tgdb.entities.relation.tuple_effect import (
+    DeletedTuple,
+    JustViewedTuple,
+    MutatedTuple,
+    NewTuple,
+)
+
+
+relation_number = Number(0)
+predicate = EqualityPredicate(Number(1), "x")
+
+x1 = tuple_(1, "x", tid=UUID(int=100))
+x2 = tuple_(2, "x", tid=UUID(int=100))
+y = tuple_(3, "x", tid=UUID(int=200))
+
+
+@fixture
+def horizon() -> Horizon:
+    return horizon_(0, 1000, 1_000_000_000)
+
+
+def view(
+    horizon: Horizon,
+    time: int,
+    xid: int,
+    *tuples: Tuple,
+) -> list[Tuple]:
+    return list(
+        horizon.visible_tuples(
+            time,
+            UUID(int=xid),
+            relation_number,
+            predicate,
+            tuples,
+            is_exhaustive=True,
+        ),
+    )
+
+
+def test_snapshot_without_read_conflict(horizon: Horizon) -> None:
+    """
+    |--r--|-|    (snapshot)
+      |--w|-|    (serializable)
+    """
+
+    horizon.start_transaction(1, UUID(int=1), IsolationLevel.snapshot)
+    horizon.start_transaction(2, UUID(int=2), IsolationLevel.serializable)
+
+    horizon.include(3, UUID(int=1), JustViewedTuple(x1.tid))
+    horizon.commit_transaction(4, UUID(int=2), [MutatedTuple(x2)])
+    horizon.complete_commit(5, UUID(int=2))
+
+    horizon.commit_transaction(6, UUID(int=1), [NewTuple(y)])
+    commit = horizon.complete_commit(7, UUID(int=1))
+
+    assert commit.effect == {NewTuple(y)}
+
+
+def test_snapshot_write_conflict(horizon: Horizon) -> None:
+    """
+    |----w|  (snapshot)
+      |-w|-| (snapshot)
+    """
+
+    horizon.start_transaction(1, UUID(int=1), IsolationLevel.snapshot)
+    horizon.start_transaction(2, UUID(int=2), IsolationLevel.snapshot)
+
+    horizon.commit_transaction(3, UUID(int=2), [MutatedTuple(x2)])
+    horizon.complete_commit(4, UUID(int=2))
+
+    with raises(ConflictError):
+        horizon.commit_transaction(5, UUID(int=1), [DeletedTuple(x1.tid)])
+
+
+def test_read_committed_without_write_conflict(horizon: Horizon) -> None:
+    """
+    |----w|-|  (read committed)
+      |-w|-|   (read committed)
+    """
+
+    horizon.start_transaction(1, UUID(int=1), IsolationLevel.read_committed)
+    horizon.start_transaction(2, UUID(int=2), IsolationLevel.read_committed)
+
+    horizon.commit_transaction(3, UUID(int=2), [MutatedTuple(x2)])
+    horizon.complete_commit(4, UUID(int=2))
+    horizon.commit_transaction(5, UUID(int=1), [DeletedTuple(x1.tid)])
+    commit = horizon.complete_commit(6, UUID(int=1))
+
+    assert commit.effect == {DeletedTuple(x1.tid)}
+
+
+def test_snapshot_repeatable_read(horizon: Horizon) -> None:
+    """
+    |-r---r-  (snapshot)
+       |w|-|  (serializable)
+    """
+
+    horizon.start_transaction(1, UUID(int=1), IsolationLevel.snapshot)
+
+    assert view(horizon, 2, 1, x1) == [x1]
+
+    horizon.start_transaction(3, UUID(int=2), IsolationLevel.serializable)
+    horizon.commit_transaction(
+        4,
+        UUID(int=2),
+        [MutatedTuple(x2)],
+        {x1.tid: x1},
+    )
+    horizon.complete_commit(5, UUID(int=2))
+
+    assert view(horizon, 6, 1, x2) == [x1]
+
+
+def test_snapshot_without_uncompleted_commit(horizon: Horizon) -> None:
+    """
+    |w|     (serializable)
+       |-r- (snapshot)
+    """
+
+    horizon.start_transaction(1, UUID(int=2), IsolationLevel.serializable)
+    horizon.commit_transaction(2, UUID(int=2), [NewTuple(y)])
+
+    horizon.start_transaction(3, UUID(int=1), IsolationLevel.snapshot)
+
+    assert view(horizon, 4, 1, y) == []
+
+
+def test_snapshot_without_later_tuple(horizon: Horizon) -> None:
+    """
+    |------r- (snapshot)
+      |w|-|   (serializable)
+    """
+
+    horizon.start_transaction(1, UUID(int=1), IsolationLevel.snapshot)
+
+    horizon.start_transaction(2, UUID(int=2), IsolationLevel.serializable)
+    horizon.commit_transaction(3, UUID(int=2), [NewTuple(y)])
+    horizon.complete_commit(4, UUID(int=2))
+
+    assert view(horizon, 5, 1, y) == []
+
+
+def test_snapshot_too_old(horizon: Horizon) -> None:
+    """
+    |------r (snapshot)
+      |w|-|  (serializable)
+    """
+
+    horizon.start_transaction(1, UUID(int=1), IsolationLevel.snapshot)
+
+    horizon.start_transaction(2, UUID(int=2), IsolationLevel.serializable)
+    horizon.commit_transaction(3, UUID(int=2), [MutatedTuple(x2)])
+    horizon.complete_commit(4, UUID(int=2))
+
+    with raises(SnapshotTooOldError):
+        view(horizon, 5, 1, x2)
+
+    with raises(NoTransactionError):
+        view(horizon, 6, 1)
+
+
+def test_read_committed_with_unapplied_commits(horizon: Horizon) -> None:
+    """
+    |w|-|       (serializable)
+      |w|-|     (serializable)
+           |-r- (read committed)
+    """
+
+    horizon.start_transaction(1, UUID(int=1), IsolationLevel.read_committed)
+    assert view(horizon, 2, 1, x1, y) == [x1, y]
+
+    horizon.start_transaction(3, UUID(int=2), IsolationLevel.serializable)
+    horizon.commit_transaction(4, UUID(int=2), [MutatedTuple(x2)])
+    horizon.start_transaction(5, UUID(int=3), IsolationLevel.serializable)
+    horizon.commit_transaction(6, UUID(int=3), [DeletedTuple(y.tid)])
+    horizon.complete_commit(7, UUID(int=2))
+    horizon.complete_commit(8, UUID(int=3))
+
+    assert view(horizon, 9, 1, x1, y) == [x2]
+
+
+def test_read_committed_without_uncompleted_commits(horizon: Horizon) -> None:
+    """
+    |-r--r- (read committed)
+      |w|   (serializable)
+    """
+
+    horizon.start_transaction(1, UUID(int=1), IsolationLevel.read_committed)
+    assert view(horizon, 2, 1, x1) == [x1]
+
+    horizon.start_transaction(3, UUID(int=2), IsolationLevel.serializable)
+    horizon.commit_transaction(
+        4,
+        UUID(int=2),
+        [MutatedTuple(x2)],
+        {x1.tid: x1},
+    )
+
+    assert view(horizon, 5, 1, x2) == [x1]
+
+
+def test_read_committed_without_pre_image(horizon: Horizon) -> None:
+    """
+    |w|     (serializable)
+      |-r-  (read committed)
+    """
+
+    horizon.start_transaction(1, UUID(int=2), IsolationLevel.serializable)
+    horizon.commit_transaction(2, UUID(int=2), [MutatedTuple(x2)])
+
+    horizon.start_transaction(3, UUID(int=1), IsolationLevel.read_committed)
+
+    assert view(horizon, 4, 1, x2) == [x2]
+    assert view(horizon, 5, 1) == []
+
+
+def test_versions_outside_predicate(horizon: Horizon) -> None:
+    """
+    |-r-----r- (read committed)
+      |w|-|    (serializable)
+    """
+
+    z = tuple_(4, "z", tid=x1.tid)
+
+    horizon.start_transaction(1, UUID(int=1), IsolationLevel.read_committed)
+    assert view(horizon, 2, 1, x1) == [x1]
+
+    horizon.start_transaction(3, UUID(int=2), IsolationLevel.serializable)
+    horizon.commit_transaction(4, UUID(int=2), [MutatedTuple(z)])
+    horizon.complete_commit(5, UUID(int=2))
+
+    assert view(horizon, 6, 1, x1) == []
+
+
+def test_snapshot_with_deleted_tuple(horizon: Horizon) -> None:
+    """
+    |-r----r- (snapshot)
+      |w|-|   (serializable)
+    """
+
+    horizon.start_transaction(1, UUID(int=1), IsolationLevel.snapshot)
+    assert view(horizon, 2, 1, x1, y) == [x1, y]
+
+    horizon.start_transaction(3, UUID(int=2), IsolationLevel.serializable)
+    horizon.commit_transaction(
+        4,
+        UUID(int=2),
+        [DeletedTuple(y.tid)],
+        {y.tid: y},
+    )
+    horizon.complete_commit(5, UUID(int=2))
+
+    assert view(horizon, 6, 1, x1) == [x1, y]
+
+
+def test_snapshot_with_pre_image_of_absent_tuple(horizon: Horizon) -> None:
+    """
+    |------r- (snapshot)
+      |w|-|   (serializable)
+    """
+
+    horizon.start_transaction(1, UUID(int=1), IsolationLevel.snapshot)
+
+    horizon.start_transaction(2, UUID(int=2), IsolationLevel.serializable)
+    horizon.commit_transaction(
+        3,
+        UUID(int=2),
+        [DeletedTuple(y.tid)],
+        {y.tid: None},
+    )
+    horizon.complete_commit(4, UUID(int=2))
+
+    assert view(horizon, 5, 1) == []
+
+
+def test_snapshot_too_old_for_deleted_tuple(horizon: Horizon) -> None:
+    """
+    |------r- (snapshot)
+      |w|-|   (serializable)
+    """
+
+    horizon.start_transaction(1, UUID(int=1), IsolationLevel.snapshot)
+
+    horizon.start_transaction(2, UUID(int=2), IsolationLevel.serializable)
+    horizon.commit_transaction(3, UUID(int=2), [DeletedTuple(y.tid)])
+    horizon.complete_commit(4, UUID(int=2))
+
+    with raises(SnapshotTooOldError):
+        view(horizon, 5, 1, x1)
+
+
+def test_snapshot_without_tuple_outside_predicate(horizon: Horizon) -> None:
+    """
+    |------r- (snapshot)
+      |w|-|   (serializable)
+    """
+
+    z = tuple_(4, "zzz", tid=x1.tid)
+
+    horizon.start_transaction(1, UUID(int=1), IsolationLevel.snapshot)
+
+    horizon.start_transaction(2, UUID(int=2), IsolationLevel.serializable)
+    horizon.commit_transaction(3, UUID(int=2), [MutatedTuple(z)])
+    horizon.complete_commit(4, UUID(int=2))
+
+    assert view(horizon, 5, 1) == []
+
+
+def test_snapshot_without_tuple_of_other_relation(horizon: Horizon) -> None:
+    """
+    |------r- (snapshot)
+      |w|-|   (serializable)
+    """
+
+    other_x = tuple_(
+        4,
+        "x",
+        tid=x1.tid,
+        relation_schema_id=RelationSchemaID(Number(1), Number(0)),
+    )
+
+    horizon.start_transaction(1, UUID(int=1), IsolationLevel.snapshot)
+
+    horizon.start_transaction(2, UUID(int=2), IsolationLevel.serializable)
+    horizon.commit_transaction(3, UUID(int=2), [MutatedTuple(other_x)])
+    horizon.complete_commit(4, UUID(int=2))
+
+    assert view(horizon, 5, 1) == []
+
+
+def test_snapshot_too_old_for_tuple_in_predicate(horizon: Horizon) -> None:
+    """
+    |------r- (snapshot)
+      |w|-|   (serializable)
+    """
+
+    horizon.start_transaction(1, UUID(int=1), IsolationLevel.snapshot)
+
+    horizon.start_transaction(2, UUID(int=2), IsolationLevel.serializable)
+    horizon.commit_transaction(3, UUID(int=2), [MutatedTuple(x2)])
+    horizon.complete_commit(4, UUID(int=2))
+
+    with raises(SnapshotTooOldError):
+        view(horizon, 5, 1)
+
+
+def test_forgotten_versions(horizon: Horizon) -> None:
+    """
+    |w|-|         (serializable)
+          |-r-|   (snapshot)
+            |w|-| (serializable)
+    """
+
+    horizon.start_transaction(1, UUID(int=2), IsolationLevel.serializable)
+    horizon.commit_transaction(2, UUID(int=2), [MutatedTuple(x1)])
+    horizon.complete_commit(3, UUID(int=2))
+
+    horizon.start_transaction(4, UUID(int=1), IsolationLevel.snapshot)
+    assert view(horizon, 5, 1, x1) == [x1]
+
+    horizon.start_transaction(6, UUID(int=3), IsolationLevel.serializable)
+    horizon.commit_transaction(7, UUID(int=3), [MutatedTuple(x2)])
+    horizon.rollback_transaction(8, UUID(int=1))
+    horizon.complete_commit(9, UUID(int=3))
+
+    assert not horizon._coordinator._versions_by_tid  # noqa: SLF001
@@ -0,0 +1,114 @@
+from datetime import UTC, datetime, timedelta, timezone
+from uuid import UUID
+
+from pytest import mark, raises
+
+from tgdb.entities.numeration.number import Number
+from tgdb.entities.relation.predicate import (
+    Bound,
+    ConjunctivePredicate,
+    EqualityPredicate,
+    InvalidRangeError,
+    PrefixPredicate,
+    RangePredicate,
+    conjuncts,
+)
+from tgdb.entities.relation.scalar import Scalar
+from tgdb.entities.relation.tuple import tuple_
+
+
+@mark.parametrize(
+    ("scalar", "result"),
+    [(1, True), (2, False), (True, False), ("1", False)],
+)
+def test_equality(scalar: Scalar, result: bool) -> None:  # noqa: FBT001
+    predicate = EqualityPredicate(Number(0), 1)
+
+    assert predicate.matches(tuple_(scalar, tid=UUID(int=0))) is result
+
+
+@mark.parametrize(
+    ("scalar", "result"),
+    [(0, False), (1, True), (4, True), (5, False), ("2", False), (None, False)],
+)
+def test_range(scalar: Scalar, result: bool) -> None:  # noqa: FBT001
+    predicate = RangePredicate(
+        Number(0),
+        Bound(1, is_inclusive=True),
+        Bound(5, is_inclusive=False),
+    )
+
+    assert predicate.matches(tuple_(scalar, tid=UUID(int=0))) is result
+
+
+@mark.parametrize(
+    ("lower_bound", "upper_bound"),
+    [
+        (None, None),
+        (Bound(1, is_inclusive=True), Bound("5", is_inclusive=True)),
+        (Bound(None, is_inclusive=True), None),
+    ],
+)
+def test_invalid_range(
+    lower_bound: Bound | None,
+    upper_bound: Bound | None,
+) -> None:
+    with raises(InvalidRangeError):
+        RangePredicate(Number(0), lower_bound, upper_bound)
+
+
+@mark.parametrize(
+    ("scalar", "result"),
+    [("ab", True), ("abc", True), ("a", False), (1, False)],
+)
+def test_prefix(scalar: Scalar, result: bool) -> None:  # noqa: FBT001
+    predicate = PrefixPredicate(Number(0), "ab")
+
+    assert predicate.matches(tuple_(scalar, tid=UUID(int=0))) is result
+
+
+def test_missing_attribute() -> None:
+    predicate = PrefixPredicate(Number(1), "ab")
+
+    assert not predicate.matches(tuple_("ab", tid=UUID(int=0)))
+
+
+@mark.parametrize(
+    ("scalars", "result"),
+    [(("ab", 1), True), (("ab", 2), False), (("b", 1), False)],
+)
+def test_conjunction(scalars: tuple[str, int], result: bool) -> None:  # noqa: FBT001
+    predicate = ConjunctivePredicate((
+        PrefixPredicate(Number(0), "a"),
+        EqualityPredicate(Number(1), 1),
+    ))
+
+    assert predicate.matches(tuple_(*scalars, tid=UUID(int=0))) is result
+
+
+def test_conjuncts() -> None:
+    predicate = PrefixPredicate(Number(0), "a")
+
+    assert conjuncts(predicate) == (predicate,)
+    assert conjuncts(ConjunctivePredicate((predicate,))) == (predicate,)
+
+
+@mark.parametrize(
+    ("scalar", "result"),
+    [
+        (datetime(2000, 1, 1, 12, tzinfo=UTC), True),
+        (datetime(2000, 1, 1, 13, tzinfo=timezone(timedelta(hours=2))), False),
+        (datetime(2000, 1, 1, 13), False),  # noqa: DTZ001
+    ],
+)
+def test_range_with_mixed_datetimes(
+    scalar: Scalar,
+    result: bool,  # noqa: FBT001
+) -> None:
+    predicate = RangePredicate(
+        Number(0),
+        Bound(datetime(2000, 1, 1, 12), is_inclusive=True),  # noqa: DTZ001
+        Bound(datetime(2000, 1, 1, 13), is_inclusive=False),  # noqa: DTZ001
+    )
+
+    assert predicate.matches(tuple_(scalar, tid=UUID(int=0))) is result
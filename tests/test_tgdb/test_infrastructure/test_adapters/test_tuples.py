@@ -0,0 +1,59 @@
+from collections.abc import Sequence
+from uuid import UUID
+
+from in_memory_db import InMemoryDb
+from pytest import raises
+
+from tgdb.entities.horizon.transaction import TransactionEffect
+from tgdb.entities.relation.tuple import tuple_
+from tgdb.entities.relation.tuple_effect import NewTuple
+from tgdb.infrastructure.adapters.tuples import (
+    InMemoryTuples,
+    UnappliedEffectTuples,
+)
+from tgdb.infrastructure.unapplied_effects import UnappliedEffects
+
+
+class FailingTuples(InMemoryTuples):
+    async def map(
+        self,
+        effects: Sequence[TransactionEffect],  # noqa: ARG002
+    ) -> None:
+        raise ValueError
+
+    async def map_idempotently(
+        self,
+        effects: Sequence[TransactionEffect],  # noqa: ARG002
+    ) -> None:
+        raise ValueError
+
+
+x = tuple_(1, "x", tid=UUID(int=1))
+
+
+async def test_failed_map() -> None:
+    unapplied_effects = UnappliedEffects()
+    tuples = UnappliedEffectTuples(
+        FailingTuples(InMemoryDb()),
+        unapplied_effects,
+    )
+    unapplied_effects.push([{NewTuple(x)}])
+
+    with raises(ValueError):  # noqa: PT011
+        await tuples.map([{NewTuple(x)}])
+
+    assert not unapplied_effects
+
+
+async def test_failed_idempotent_map() -> None:
+    unapplied_effects = UnappliedEffects()
+    tuples = UnappliedEffectTuples(
+        FailingTuples(InMemoryDb()),
+        unapplied_effects,
+    )
+    unapplied_effects.push([{NewTuple(x)}])
+
+    with raises(ValueError):  # noqa: PT011
+        await tuples.map_idempotently([{NewTuple(x)}])
+
+    assert not unapplied_effects
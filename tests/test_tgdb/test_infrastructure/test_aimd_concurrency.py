@@ -0,0 +1,67 @@
+from asyncio import create_task, sleep
+
+from tgdb.infrastructure.aimd_concurrency import AimdConcurrency
+
+
+async def test_additive_increase() -> None:
+    concurrency = AimdConcurrency(2, 3, 1)
+
+    number = await concurrency.acquire()
+    concurrency.release(number, 0.5, is_overloaded=False)
+
+    assert concurrency.window() == 2.5
+
+
+async def test_max_window() -> None:
+    concurrency = AimdConcurrency(3, 3, 1)
+
+    number = await concurrency.acquire()
+    concurrency.release(number, 0.5, is_overloaded=False)
+
+    assert concurrency.window() == 3
+
+
+async def test_multiplicative_decrease() -> None:
+    concurrency = AimdConcurrency(8, 8, 1)
+
+    number = await concurrency.acquire()
+    concurrency.release(number, 0.5, is_overloaded=True)
+    number = await concurrency.acquire()
+    concurrency.release(number, 2, is_overloaded=False)
+
+    assert concurrency.window() == 2
+
+
+async def test_one_decrease_per_window() -> None:
+    concurrency = AimdConcurrency(8, 8, 1)
+
+    first_number = await concurrency.acquire()
+    second_number = await concurrency.acquire()
+    concurrency.release(first_number, 0.5, is_overloaded=True)
+    concurrency.release(second_number, 0.5, is_overloaded=True)
+
+    assert concurrency.window() == 4
+
+
+async def test_min_window() -> None:
+    concurrency = AimdConcurrency(1, 8, 1)
+
+    number = await concurrency.acquire()
+    concurrency.release(number, 0.5, is_overloaded=True)
+
+    assert concurrency.window() == 1
+
+
+async def test_acquire_waits_for_window() -> None:
+    concurrency = AimdConcurrency(1, 1, 1)
+    number = await concurrency.acquire()
+
+    waiting = create_task(concurrency.acquire())
+    await sleep(0)
+
+    assert not waiting.done()
+
+    concurrency.release(number, 0.5, is_overloaded=False)
+    await waiting
+
+    assert concurrency.in_flight_count() == 1
@@ -0,0 +1,69 @@
+from asyncio import gather
+from collections.abc import Mapping, Sequence
+
+from pytest import fixture, mark, raises
+
+from tgdb.infrastructure.async_batching import AsyncBatching
+
+
+type Batching = AsyncBatching[int, str]
+
+
+@fixture
+def batches() -> list[Sequence[int]]:
+    return list()
+
+
+@fixture
+def batching(batches: list[Sequence[int]]) -> Batching:
+    async def values(keys: Sequence[int]) -> Mapping[int, str]:  # noqa: RUF029
+        batches.append(keys)
+
+        return {key: str(key) for key in keys if key >= 0}
+
+    return AsyncBatching(values)
+
+
+@mark.parametrize("object_", ["result", "batches"])
+async def test_concurrent_keys(
+    batching: Batching,
+    batches: list[Sequence[int]],
+    object_: str,
+) -> None:
+    result = await gather(*map(batching, [1, 2, 3]))
+
+    if object_ == "result":
+        assert result == ["1", "2", "3"]
+
+    if object_ == "batches":
+        assert batches == [(1, 2, 3)]
+
+
+@mark.parametrize("object_", ["result", "batches"])
+async def test_concurrent_same_keys(
+    batching: Batching,
+    batches: list[Sequence[int]],
+    object_: str,
+) -> None:
+    result = await gather(*map(batching, [1, 1, 2, 1]))
+
+    if object_ == "result":
+        assert result == ["1", "1", "2", "1"]
+
+    if object_ == "batches":
+        assert batches == [(1, 2)]
+
+
+async def test_sequential_keys(
+    batching: Batching,
+    batches: list[Sequence[int]],
+) -> None:
+    await batching(1)
+    await batching(1)
+
+    assert batches == [(1,), (1,)]
+
+
+async def test_without_value(batching: Batching) -> None:
+    with raises(KeyError):
+        await batching(-1)
@@ -0,0 +1,42 @@
+from pytest import mark, raises
+
+from tgdb.infrastructure.blob_compression import (
+    BlobCompression,
+    InvalidBlobError,
+    compressed_blob,
+    decompressed_blob,
+    is_blob_compression_available,
+)
+
+
+blob = b'[{"type":"commit","xid":"00000000-0000-0000-0000-000000000000"}]' * 20
+
+
+@mark.parametrize(
+    "compression",
+    [
+        compression
+        for compression in BlobCompression
+        if is_blob_compression_available(compression)
+    ],
+)
+def test_isomorphism(compression: BlobCompression) -> None:
+    assert decompressed_blob(compressed_blob(blob, compression)) == blob
+
+
+@mark.parametrize(
+    "compression",
+    [BlobCompression.zlib, BlobCompression.lzma],
+)
+def test_compression(compression: BlobCompression) -> None:
+    assert len(compressed_blob(blob, compression)) < len(blob)
+
+
+def test_uncompressed_blob() -> None:
+    assert compressed_blob(blob, BlobCompression.none) == blob
+    assert decompressed_blob(blob) == blob
+
+
+def test_invalid_blob() -> None:
+    with raises(InvalidBlobError):
+        decompressed_blob(b"\x00tgdb\x01\x09")
@@ -0,0 +1,128 @@
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta, timezone
+from uuid import UUID
+
+from pytest import mark, raises
+
+from tgdb.entities.horizon.transaction import Commit, PreparedCommit
+from tgdb.entities.numeration.number import Number
+from tgdb.entities.relation.relation import RelationSchemaID
+from tgdb.entities.relation.scalar import Scalar
+from tgdb.entities.relation.tuple import Tuple
+from tgdb.entities.relation.tuple_effect import (
+    DeletedTuple,
+    MigratedTuple,
+    MutatedTuple,
+    NewTuple,
+)
+from tgdb.infrastructure.commit_codec import (
+    InvalidEncodedCommitsError,
+    decoded_commit_log_segment,
+    decoded_commits,
+    encoded_commit_log_segment,
+    encoded_commits,
+)
+from tgdb.infrastructure.commit_log import CommitLogSegment
+
+
+schema_id = RelationSchemaID(Number(3), Number(1))
+
+
+def tuple_(*scalars: Scalar) -> Tuple:
+    return Tuple(UUID(int=len(scalars)), schema_id, scalars)
+
+
+@mark.parametrize(
+    "scalar",
+    [
+        None,
+        True,
+        False,
+        0,
+        -1,
+        255,
+        -(2**200),
+        2**200,
+        -(2**3000),
+        2**3000,
+        "",
+        "hello",
+        "\ud800",
+        datetime(2000, 1, 1, 12, 30, 15, 999),  # noqa: DTZ001
+        datetime(1, 1, 1),  # noqa: DTZ001
+        datetime(9999, 12, 31, tzinfo=UTC),
+        datetime(2000, 1, 1, tzinfo=timezone(timedelta(hours=-3))),
+        UUID(int=42),
+    ],
+)
+def test_scalar_isomorphism(scalar: Scalar) -> None:
+    commits = (Commit(UUID(int=1), frozenset({NewTuple(tuple_(scalar))})),)
+
+    (decoded_commit,) = decoded_commits(encoded_commits(commits))
+    (decoded_effect,) = decoded_commit.effect
+
+    assert isinstance(decoded_effect, NewTuple)
+
+    (decoded_scalar,) = decoded_effect.tuple.scalars
+
+    assert decoded_scalar == scalar
+    assert type(decoded_scalar) is type(scalar)
+
+    if isinstance(scalar, datetime) and isinstance(decoded_scalar, datetime):
+        assert decoded_scalar.utcoffset() == scalar.utcoffset()
+
+
+def test_commits_isomorphism() -> None:
+    commits = (
+        Commit(
+            UUID(int=1),
+            frozenset({
+                NewTuple(tuple_(1, "a")),
+                DeletedTuple(UUID(int=100)),
+            }),
+        ),
+        PreparedCommit(
+            UUID(int=2),
+            frozenset({
+                MutatedTuple(tuple_(None)),
+                MigratedTuple(tuple_(True, 2, "b")),  # noqa: FBT003
+            }),
+        ),
+        Commit(UUID(int=3), frozenset()),
+    )
+
+    assert decoded_commits(encoded_commits(commits)) == commits
+
+
+def test_segment_isomorphism() -> None:
+    segment = CommitLogSegment[Sequence[Commit | PreparedCommit]](
+        5,
+        3,
+        (PreparedCommit(UUID(int=1), frozenset({NewTuple(tuple_(1))})),),
+    )
+
+    decoded_segment = decoded_commit_log_segment(
+        encoded_commit_log_segment(segment),
+    )
+
+    assert decoded_segment == segment
+
+
+@mark.parametrize(
+    "encoded",
+    [
+        b"",
+        b"[]",
+        encoded_commits(())[:-1],
+        encoded_commits(()) + b"\x00",
+        encoded_commits((Commit(UUID(int=1), frozenset()),))[:-1],
+    ],
+)
+def test_invalid_commits(encoded: bytes) -> None:
+    with raises(InvalidEncodedCommitsError):
+        decoded_commits(encoded)
+
+
+def test_invalid_segment() -> None:
+    with raises(InvalidEncodedCommitsError):
+        decoded_commit_log_segment(b"[]")
@@ -0,0 +1,56 @@
+from tgdb.infrastructure.commit_log import CommitLog
+
+
+def test_checkpoint_without_batches() -> None:
+    log = CommitLog[list[int]]()
+
+    assert log.checkpoint() == 0
+
+
+def test_checkpoint_after_release() -> None:
+    log = CommitLog[list[int]]()
+    first_batch = [1]
+    second_batch = [2]
+
+    log.append(first_batch)
+    log.append(second_batch)
+
+    assert log.checkpoint() == 0
+
+    log.release(second_batch)
+
+    assert log.checkpoint() == 0
+
+    log.release(first_batch)
+
+    assert log.checkpoint() == 2
+
+
+def test_continue_from() -> None:
+    log = CommitLog[list[int]]()
+    log.continue_from(10)
+
+    assert log.append([1]) == 11
+    assert log.checkpoint() == 10
+
+
+def test_compaction_keeps_last_segment() -> None:
+    log = CommitLog[list[int]]()
+    batches = [[1], [2], [3]]
+
+    for segment_id, batch in enumerate(batches):
+        sequence_number = log.append(batch)
+        log.set_segment_id(sequence_number, segment_id)
+
+    log.release(batches[0])
+    log.release(batches[2])
+
+    assert log.compactable_segment_ids() == [0]
+
+    log.release(batches[1])
+
+    assert log.compactable_segment_ids() == [0, 1]
+
+    log.compact([0, 1])
+
+    assert log.compactable_segment_ids() == []
@@ -0,0 +1,58 @@
+from pytest import mark
+
+from tgdb.infrastructure.eviction import (
+    EvictionPolicy,
+    LfuEviction,
+    LruEviction,
+    eviction,
+)
+
+
+def test_lru_victim_without_keys() -> None:
+    assert LruEviction[int]().victim() is None
+
+
+def test_lru_victim_order() -> None:
+    lru = LruEviction[int]()
+    lru.add(1)
+    lru.add(2)
+    lru.add(3)
+    lru.touch(1)
+
+    assert lru.victim() == 2
+
+    lru.remove(2)
+
+    assert lru.victim() == 3
+
+
+def test_lfu_victim_without_keys() -> None:
+    assert LfuEviction[int]().victim() is None
+
+
+def test_lfu_victim_order() -> None:
+    lfu = LfuEviction[int]()
+    lfu.add(1)
+    lfu.add(2)
+    lfu.add(3)
+    lfu.touch(1)
+    lfu.touch(1)
+    lfu.touch(2)
+
+    assert lfu.victim() == 3
+
+    lfu.remove(3)
+
+    assert lfu.victim() == 2
+
+    lfu.remove(2)
+
+    assert lfu.victim() == 1
+
+
+@mark.parametrize(
+    ("policy", "type_"),
+    [(EvictionPolicy.lru, LruEviction), (EvictionPolicy.lfu, LfuEviction)],
+)
+def test_eviction(policy: EvictionPolicy, type_: type) -> None:
+    assert isinstance(eviction(policy), type_)
@@ -1,3 +1,4 @@
+from datetime import UTC, datetime, timedelta, timezone
 from uuid import UUID
 
 from pytest import mark
@@ -5,7 +6,10 @@ from pytest import mark
 from tgdb.entities.numeration.number import Number
 from tgdb.entities.relation.relation import RelationSchemaID
 from tgdb.entities.relation.tuple import Tuple, tuple_
-from tgdb.infrastructure.heap_tuple_encoding import HeapTupleEncoding
+from tgdb.infrastructure.heap_tuple_encoding import (
+    HeapTupleCodec,
+    HeapTupleEncoding,
+)
 
 
 @mark.parametrize(
@@ -37,3 +41,130 @@ def test_isomorphism(tuple_: Tuple) -> None:
     )
 
     assert decoded_tuple == tuple_
+
+
+@mark.parametrize(
+    "page",
+    [
+        tuple(),
+        (tuple_(1, 2, 3, tid=UUID(int=0)),),
+        (
+            tuple_(1, "x", tid=UUID(int=0)),
+            tuple_(None, tid=UUID(int=1)),
+            tuple_(
+                True,  # noqa: FBT003
+                UUID(int=2),
+                tid=UUID(int=2),
+                relation_schema_id=RelationSchemaID(Number(3), Number(4)),
+            ),
+        ),
+    ],
+)
+def test_page_isomorphism(page: tuple[Tuple, ...]) -> None:
+    decoded_page = HeapTupleEncoding.decoded_page(
+        HeapTupleEncoding.encoded_page(
+            map(HeapTupleEncoding.encoded_tuple, page),
+        ),
+    )
+
+    assert decoded_page == page
+
+
+def test_tuple_as_page() -> None:
+    tuple__ = tuple_(1, "x", tid=UUID(int=0))
+
+    decoded_page = HeapTupleEncoding.decoded_page(
+        HeapTupleEncoding.encoded_tuple(tuple__),
+    )
+
+    assert decoded_page == (tuple__,)
+
+
+@mark.parametrize(
+    "tuple_",
+    [
+        tuple_(1, 2, 3, tid=UUID(int=0)),
+        tuple_(
+            -1,
+            "-1",
+            True,  # noqa: FBT003
+            -(2**70),
+            None,
+            UUID(int=2**128 - 1),
+            datetime(9999, 12, 31, 23, 59, 59, 999999),  # noqa: DTZ001
+            datetime(1, 1, 1, tzinfo=timezone(timedelta(hours=-14))),
+            datetime(2000, 1, 1, tzinfo=UTC),
+            tid=UUID(int=2**128 - 1),
+        ),
+        tuple_(tid=UUID(int=0)),
+        tuple_(None, "as一d", tid=UUID(int=0)),
+        tuple_(
+            None,
+            tid=UUID(int=100000),
+            relation_schema_id=RelationSchemaID(Number(1000), Number(200_000)),
+        ),
+    ],
+)
+def test_compact_isomorphism(tuple_: Tuple) -> None:
+    decoded_tuple = HeapTupleEncoding.decoded_tuple(
+        HeapTupleEncoding.encoded_tuple(tuple_, HeapTupleCodec.compact),
+    )
+
+    assert decoded_tuple == tuple_
+    assert [type(it) for it in decoded_tuple] == [type(it) for it in tuple_]
+
+
+def test_mixed_codec_page_isomorphism() -> None:
+    page = (
+        tuple_(1, "x", tid=UUID(int=0)),
+        tuple_(UUID(int=2), tid=UUID(int=1)),
+        tuple_(None, 2, tid=UUID(int=2)),
+    )
+    codecs = (HeapTupleCodec.text, HeapTupleCodec.compact, HeapTupleCodec.text)
+
+    decoded_page = HeapTupleEncoding.decoded_page(
+        HeapTupleEncoding.encoded_page(
+            map(HeapTupleEncoding.encoded_tuple, page, codecs),
+        ),
+    )
+
+    assert decoded_page == page
+
+
+def test_compact_tuple_is_shorter() -> None:
+    tuple__ = tuple_(
+        UUID(int=2**128 - 1),
+        123456789,
+        datetime(2000, 1, 1, tzinfo=UTC),
+        tid=UUID(int=2**128 - 1),
+    )
+
+    text_len = len(HeapTupleEncoding.encoded_tuple(tuple__))
+    compact_len = len(
+        HeapTupleEncoding.encoded_tuple(tuple__, HeapTupleCodec.compact),
+    )
+
+    assert compact_len * 2 < text_len
+
+
+def test_compact_attribute_id_in_encoded_tuple() -> None:
+    tuple__ = tuple_(1, UUID(int=5), "x", tid=UUID(int=7))
+    encoded_tuple = HeapTupleEncoding.encoded_tuple(
+        tuple__,
+        HeapTupleCodec.compact,
+    )
+
+    for attribute_number, scalar in enumerate(tuple__):
+        attribute_id = HeapTupleEncoding.id_of_encoded_tuple_with_attribute(
+            0,
+            attribute_number,
+            scalar,
+            HeapTupleCodec.compact,
+        )
+        assert attribute_id in encoded_tuple
+
+    tid_id = HeapTupleEncoding.id_of_encoded_tuple_with_tid(
+        tuple__.tid,
+        HeapTupleCodec.compact,
+    )
+    assert encoded_tuple.startswith(tid_id)
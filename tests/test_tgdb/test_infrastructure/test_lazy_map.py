@@ -59,3 +59,12 @@ async def test_get_uncached_invalid_value(map_: Map) -> None:
         await map_[-10]
 
     assert map_.cache_map() == OrderedDict({-10: NoExternalValue()})
+
+
+def test_set_external_value() -> None:
+    external_map = dict[int, str]()
+    map_ = LazyMap(100, external_value, external_map.__setitem__)
+
+    map_[1] = "X"
+
+    assert external_map == {1: "X"}
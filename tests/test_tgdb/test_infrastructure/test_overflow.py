@@ -0,0 +1,44 @@
+from tgdb.infrastructure.overflow import AdaptiveOverflow
+
+
+def test_adaptive_overflow_without_observations() -> None:
+    overflow = AdaptiveOverflow(5000, 0.1, 0.5)
+
+    assert overflow.len() == 5000
+    assert overflow.timeout_seconds() == 0.1
+
+
+def test_light_load() -> None:
+    overflow = AdaptiveOverflow(5000, 0.1, 0.5)
+
+    overflow.observe_value(0)
+    overflow.observe_value(10)
+
+    assert overflow.len() == 1
+
+
+def test_heavy_load() -> None:
+    overflow = AdaptiveOverflow(5000, 0.1, 0.5)
+
+    overflow.observe_value(0)
+    overflow.observe_value(0.001)
+
+    assert overflow.len() == 100
+
+
+def test_slow_batches_shrink_timeout() -> None:
+    overflow = AdaptiveOverflow(5000, 1, 0.5)
+
+    overflow.observe_value(0)
+    overflow.observe_value(0.001)
+    overflow.observe_batch(0.4)
+
+    assert round(overflow.timeout_seconds(), 6) == 0.1
+    assert overflow.len() == 100
+
+
+def test_min_timeout() -> None:
+    overflow = AdaptiveOverflow(5000, 1, 0.5)
+    overflow.observe_batch(2)
+
+    assert overflow.timeout_seconds() > 0
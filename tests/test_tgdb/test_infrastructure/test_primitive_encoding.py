@@ -0,0 +1,41 @@
+from datetime import UTC, datetime, timedelta, timezone
+from itertools import pairwise
+from uuid import UUID
+
+from pytest import mark
+
+from tgdb.infrastructure.primitive_encoding import (
+    Primitive,
+    empty_table,
+    ordered_encoded_primitive,
+)
+
+
+@mark.parametrize(
+    "primitives",
+    [
+        [-1000, -999, -12, -5, -1, 0, 1, 5, 12, 999, 1000, 10**30],
+        [False, True],
+        ["", "a", "ab", "b", "ba"],
+        [
+            datetime(1, 1, 1),  # noqa: DTZ001
+            datetime(999, 1, 1),  # noqa: DTZ001
+            datetime(2025, 1, 1, 0, 0, 0, 1),  # noqa: DTZ001
+            datetime(2025, 1, 1, 0, 1),  # noqa: DTZ001
+        ],
+        [
+            datetime(2025, 1, 1, 3, tzinfo=timezone(timedelta(hours=5))),
+            datetime(2025, 1, 1, tzinfo=UTC),
+            datetime(2025, 1, 1, 1, tzinfo=timezone(timedelta(hours=-1))),
+        ],
+        [UUID(int=0), UUID(int=15), UUID(int=16), UUID(int=2**127)],
+    ],
+)
+def test_ordered_encoding(primitives: list[Primitive]) -> None:
+    encoded_primitives = [
+        ordered_encoded_primitive(primitive, empty_table)
+        for primitive in primitives
+    ]
+
+    for first, second in pairwise(encoded_primitives):
+        assert first < second
@@ -0,0 +1,203 @@
+from contextlib import suppress
+from pathlib import Path
+from uuid import UUID
+
+from pytest import fixture, mark
+
+from tgdb.entities.numeration.number import Number
+from tgdb.entities.relation.predicate import (
+    AttributePredicate,
+    Bound,
+    PrefixPredicate,
+    RangePredicate,
+)
+from tgdb.entities.relation.relation import RelationSchemaID
+from tgdb.entities.relation.tuple import tuple_
+from tgdb.infrastructure.telethon.attribute_index import AttributeIndex
+
+
+schema_id = RelationSchemaID(Number(1), Number(0))
+
+
+@fixture
+def path(tmp_path: Path) -> Path:
+    return tmp_path / "index"
+
+
+@mark.parametrize("object_", ["x", "y", "not_indexed_relation"])
+def test_page_changes(path: Path, object_: str) -> None:
+    with AttributeIndex(path) as index:
+        index.add_relation(Number(1))
+
+        index.set_page(
+            10,
+            (
+                tuple_("x", 1, tid=UUID(int=1), relation_schema_id=schema_id),
+                tuple_("y", 2, tid=UUID(int=2), relation_schema_id=schema_id),
+            ),
+        )
+        index.set_page(
+            11,
+            (tuple_("x", 3, tid=UUID(int=3), relation_schema_id=schema_id),),
+        )
+        index.set_page(
+            10,
+            (tuple_("x", 1, tid=UUID(int=1), relation_schema_id=schema_id),),
+        )
+        index.set_page(12, (tuple_("x", 4, tid=UUID(int=4)),))
+
+        if object_ == "x":
+            assert index.message_ids(Number(1), Number(0), "x") == [10, 11]
+
+        if object_ == "y":
+            assert index.message_ids(Number(1), Number(0), "y") == []
+
+        if object_ == "not_indexed_relation":
+            assert not index.is_relation_indexed(Number(0))
+
+
+@mark.parametrize("object_", ["relation", "message_ids"])
+def test_warm_start(path: Path, object_: str) -> None:
+    with AttributeIndex(path) as index:
+        index.add_relation(Number(1))
+
+        for message_id in range(10):
+            index.set_page(
+                message_id,
+                (tuple_(1, tid=UUID(int=1), relation_schema_id=schema_id),),
+            )
+            index.set_page(message_id, tuple())
+
+        index.set_page(
+            100,
+            (tuple_(1, tid=UUID(int=1), relation_schema_id=schema_id),),
+        )
+
+    with AttributeIndex(path) as index:
+        if object_ == "relation":
+            assert index.is_relation_indexed(Number(1))
+
+        if object_ == "message_ids":
+            assert index.message_ids(Number(1), Number(0), 1) == [100]
+
+
+@mark.parametrize(
+    ("predicate", "message_ids"),
+    [
+        (
+            RangePredicate(
+                Number(1),
+                Bound(-5, is_inclusive=True),
+                Bound(20, is_inclusive=False),
+            ),
+            [1, 2],
+        ),
+        (
+            RangePredicate(Number(1), Bound(-5, is_inclusive=False), None),
+            [2, 3],
+        ),
+        (RangePredicate(Number(1), None, Bound(-5, is_inclusive=True)), [1]),
+        (
+            RangePredicate(Number(0), Bound("ab", is_inclusive=True), None),
+            [2, 3, 4],
+        ),
+        (PrefixPredicate(Number(0), "ab"), [2, 3]),
+        (PrefixPredicate(Number(0), "y"), []),
+    ],
+)
+def test_predicates(
+    path: Path,
+    predicate: AttributePredicate,
+    message_ids: list[int],
+) -> None:
+    with AttributeIndex(path) as index:
+        index.add_relation(Number(1))
+
+        pages: list[tuple[int, tuple[str, int | str]]] = [
+            (1, ("a", -5)),
+            (2, ("ab", 12)),
+            (3, ("abc", 20)),
+            (4, ("x", "20")),
+        ]
+
+        for message_id, scalars in pages:
+            index.set_page(
+                message_id,
+                (
+                    tuple_(
+                        *scalars,
+                        tid=UUID(int=message_id),
+                        relation_schema_id=schema_id,
+                    ),
+                ),
+            )
+
+        assert index.message_ids_with_predicate(Number(1), predicate) == (
+            message_ids
+        )
+
+
+def test_torn_record(path: Path) -> None:
+    with AttributeIndex(path) as index:
+        index.add_relation(Number(1))
+        index.set_page(
+            10,
+            (tuple_(1, tid=UUID(int=1), relation_schema_id=schema_id),),
+        )
+
+    with path.open("ab") as file:
+        file.write(b"\x01torn")
+
+    with AttributeIndex(path) as index:
+        index.set_page(
+            11,
+            (tuple_(1, tid=UUID(int=2), relation_schema_id=schema_id),),
+        )
+
+    with AttributeIndex(path) as index:
+        assert not index.is_dirty()
+        assert index.message_ids(Number(1), Number(0), 1) == [10, 11]
+
+
+def test_dirty_index(path: Path) -> None:
+    with suppress(ValueError), AttributeIndex(path) as index:
+        index.add_relation(Number(1))
+        index.set_page(
+            10,
+            (tuple_(1, tid=UUID(int=1), relation_schema_id=schema_id),),
+        )
+        raise ValueError
+
+    with AttributeIndex(path) as index:
+        assert index.is_dirty()
+        assert not index.is_relation_indexed(Number(1))
+
+        index.set_page(
+            11,
+            (tuple_(1, tid=UUID(int=2), relation_schema_id=schema_id),),
+        )
+        index.mark_rebuilt()
+
+    with AttributeIndex(path) as index:
+        assert not index.is_dirty()
+        assert index.message_ids(Number(1), Number(0), 1) == [11]
+
+
+def test_existing_relation(path: Path) -> None:
+    with AttributeIndex(path) as index:
+        index.add_existing_relation(Number(1))
+
+        assert index.is_dirty()
+        assert not index.is_relation_indexed(Number(1))
+
+        index.set_page(
+            10,
+            (tuple_(1, tid=UUID(int=1), relation_schema_id=schema_id),),
+        )
+        index.mark_rebuilt()
+
+    with AttributeIndex(path) as index:
+        index.add_existing_relation(Number(1))
+
+        assert not index.is_dirty()
+        assert index.message_ids(Number(1), Number(0), 1) == [10]
@@ -0,0 +1,92 @@
+from typing import cast
+
+from pytest import raises
+from telethon import TelegramClient
+from telethon.errors import FloodWaitError
+
+from tgdb.infrastructure.telethon.client_pool import (
+    TelegramCallKind,
+    TelegramClientPool,
+)
+
+
+class Clock:
+    now: float = 0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def clients(count: int) -> tuple[TelegramClient, ...]:
+    return tuple(cast(TelegramClient, object()) for _ in range(count))
+
+
+def test_without_clients() -> None:
+    with raises(ValueError):  # noqa: PT011
+        TelegramClientPool(())
+
+
+def test_round_robin_without_load() -> None:
+    pool_clients = clients(3)
+    pool = TelegramClientPool(pool_clients, 1, 10, 8, 64, 2, Clock())
+
+    assert [pool() for _ in range(6)] == [*pool_clients, *pool_clients]
+
+
+def test_client_without_tokens_is_skipped() -> None:
+    pool_clients = clients(2)
+    clock = Clock()
+    pool = TelegramClientPool(pool_clients, 1, 2, 8, 64, 2, clock)
+
+    pool()
+    pool()
+    pool()
+
+    assert pool() is pool_clients[1]
+
+    clock.now = 2
+
+    assert pool() is pool_clients[0]
+
+
+def test_picked_client_is_in_flight_until_release() -> None:
+    pool_clients = clients(2)
+    pool = TelegramClientPool(pool_clients, 1, 10, 8, 64, 2, Clock())
+
+    client = pool()
+
+    assert pool.utilization()[0].in_flight_call_count == 1
+    assert pool() is pool_clients[1]
+
+    pool.release(client)
+
+    assert pool.utilization()[0].in_flight_call_count == 0
+
+
+async def test_flood_wait_parks_client() -> None:
+    pool_clients = clients(2)
+    pool = TelegramClientPool(pool_clients, 1, 10, 8, 64, 2, Clock())
+    used_clients = list[TelegramClient]()
+
+    async def operation(client: TelegramClient) -> TelegramClient:  # noqa: RUF029
+        used_clients.append(client)
+
+        if client is pool_clients[0]:
+            raise FloodWaitError(None, 30)  # type: ignore[no-untyped-call]
+
+        return client
+
+    assert await pool.run(TelegramCallKind.search, operation) is pool_clients[1]
+    assert await pool.run(TelegramCallKind.search, operation) is pool_clients[1]
+    assert used_clients == [pool_clients[0], *[pool_clients[1]] * 2]
+
+    first_utilization, second_utilization = pool.utilization()
+
+    assert first_utilization.flood_wait_count == 1
+    assert first_utilization.parked_seconds == 30
+    assert first_utilization.in_flight_call_count == 0
+    assert second_utilization.call_count == 2
+    assert second_utilization.parked_seconds == 0
+
+    assert 4 < pool.concurrency_window(TelegramCallKind.search) < 5
+    assert pool.concurrency_window(TelegramCallKind.insert) == 8
@@ -0,0 +1,76 @@
+from asyncio import gather
+from dataclasses import dataclass, field
+from typing import cast
+from uuid import UUID
+
+from telethon import TelegramClient
+
+from tgdb.entities.relation.tuple import tuple_
+from tgdb.infrastructure.heap_tuple_encoding import HeapTupleEncoding
+from tgdb.infrastructure.telethon.client_pool import TelegramClientPool
+from tgdb.infrastructure.telethon.lazy_map import message_index_lazy_map
+
+
+@dataclass(frozen=True)
+class Message:
+    id: int
+    text: str
+    sender_id: int = 1
+
+
+@dataclass
+class Client:
+    messages: list[Message]
+    calls: list[str | None] = field(default_factory=list)
+
+    async def get_messages(
+        self,
+        chat_id: int,  # noqa: ARG002
+        *,
+        limit: int,
+        search: str | None = None,
+        offset_id: int = 0,
+    ) -> list[Message]:
+        self.calls.append(search)
+
+        if search is not None:
+            return [it for it in self.messages if search in it.text][:limit]
+
+        return [
+            it for it in self.messages if not offset_id or it.id < offset_id
+        ][:limit]
+
+
+def message(message_id: int) -> Message:
+    page_tuple = tuple_(message_id, tid=UUID(int=message_id))
+    text = HeapTupleEncoding.encoded_tuple(page_tuple)
+
+    return Message(message_id, text)
+
+
+async def test_scan_of_old_tuples() -> None:
+    client = Client([message(id_) for id_ in reversed(range(1, 1501))])
+    pool = TelegramClientPool([cast(TelegramClient, client)], 1000, 1000)
+    lazy_map = message_index_lazy_map(pool, 100)
+
+    message_indexes = await gather(
+        lazy_map[0, UUID(int=1)],
+        lazy_map[0, UUID(int=2)],
+    )
+
+    assert list(message_indexes) == [(1, 1), (2, 1)]
+    assert len(client.calls) == 3
+
+
+async def test_scan_of_recent_tuples() -> None:
+    client = Client([message(id_) for id_ in reversed(range(1, 1501))])
+    pool = TelegramClientPool([cast(TelegramClient, client)], 1000, 1000)
+    lazy_map = message_index_lazy_map(pool, 100)
+
+    message_indexes = await gather(
+        lazy_map[0, UUID(int=1499)],
+        lazy_map[0, UUID(int=1500)],
+    )
+
+    assert list(message_indexes) == [(1499, 1), (1500, 1)]
+    assert client.calls == [None]
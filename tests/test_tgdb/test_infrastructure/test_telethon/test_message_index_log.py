@@ -0,0 +1,61 @@
+from pathlib import Path
+from uuid import UUID
+
+from pytest import mark
+
+from tgdb.infrastructure.lazy_map import NoExternalValue
+from tgdb.infrastructure.telethon.message_index_log import MessageIndexLog
+
+
+@mark.parametrize("object_", ["message_index", "deleted_message_index"])
+def test_warm_start(tmp_path: Path, object_: str) -> None:
+    path = tmp_path / "log"
+
+    with MessageIndexLog(path) as log:
+        log[-1, UUID(int=1)] = (10, 20)
+        log[-1, UUID(int=2)] = (11, 20)
+        log[-1, UUID(int=2)] = None
+
+    with MessageIndexLog(path) as log:
+        if object_ == "message_index":
+            assert log.get((-1, UUID(int=1))) == (10, 20)
+
+        if object_ == "deleted_message_index":
+            assert log.get((-1, UUID(int=2))) is None
+
+
+def test_unknown_tid(tmp_path: Path) -> None:
+    with MessageIndexLog(tmp_path / "log") as log:
+        assert log.get((-1, UUID(int=1))) is NoExternalValue()
+
+
+def test_compaction(tmp_path: Path) -> None:
+    path = tmp_path / "log"
+
+    with MessageIndexLog(path) as log:
+        for message_id in range(1, 11):
+            log[-1, UUID(int=1)] = (message_id, 20)
+
+    with MessageIndexLog(path) as log:
+        assert log.get((-1, UUID(int=1))) == (10, 20)
+
+    with MessageIndexLog(path) as log:
+        assert len(log) == 1
+        assert path.stat().st_size == 40
+
+
+def test_torn_record(tmp_path: Path) -> None:
+    path = tmp_path / "log"
+
+    with MessageIndexLog(path) as log:
+        log[-1, UUID(int=1)] = (10, 20)
+
+    with path.open("ab") as file:
+        file.write(b"torn")
+
+    with MessageIndexLog(path) as log:
+        log[-1, UUID(int=2)] = (11, 20)
+
+    with MessageIndexLog(path) as log:
+        assert log.get((-1, UUID(int=1))) == (10, 20)
+        assert log.get((-1, UUID(int=2))) == (11, 20)
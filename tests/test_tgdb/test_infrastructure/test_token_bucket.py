@@ -0,0 +1,19 @@
+from tgdb.infrastructure.token_bucket import TokenBucket
+
+
+def test_take_until_empty() -> None:
+    bucket = TokenBucket(1, 2, 0)
+
+    assert bucket.take(0)
+    assert bucket.take(0)
+    assert not bucket.take(0)
+
+
+def test_refill() -> None:
+    bucket = TokenBucket(2, 2, 0)
+    bucket.take(0)
+    bucket.take(0)
+
+    assert bucket.seconds_until_token(0) == 0.5
+    assert bucket.take(0.5)
+    assert bucket.tokens(10) == 2
@@ -0,0 +1,88 @@
+from uuid import UUID
+
+from pytest import fixture
+
+from tgdb.entities.numeration.number import Number
+from tgdb.entities.relation.tuple import tuple_
+from tgdb.entities.relation.tuple_effect import (
+    DeletedTuple,
+    MutatedTuple,
+    NewTuple,
+)
+from tgdb.infrastructure.eviction import LruEviction
+from tgdb.infrastructure.tuple_cache import (
+    TupleCache,
+    TupleCacheKey,
+    tuple_cache_key,
+)
+
+
+@fixture
+def cache() -> TupleCache:
+    return TupleCache(100_000, LruEviction())
+
+
+@fixture
+def key() -> TupleCacheKey:
+    return tuple_cache_key(Number(0), Number(0), 1)
+
+
+def test_miss(cache: TupleCache, key: TupleCacheKey) -> None:
+    assert cache.tuples(key) is None
+    assert cache.stats().misses == 1
+
+
+def test_hit(cache: TupleCache, key: TupleCacheKey) -> None:
+    tuples = (tuple_(1, "a", tid=UUID(int=1)),)
+
+    cache.set_tuples(key, tuples, cache.version())
+
+    assert cache.tuples(key) == tuples
+    assert cache.stats().hits == 1
+
+
+def test_set_with_stale_version(cache: TupleCache, key: TupleCacheKey) -> None:
+    version = cache.version()
+    cache.map([])
+    cache.set_tuples(key, (tuple_(1, tid=UUID(int=1)),), version)
+
+    assert cache.tuples(key) is None
+
+
+def test_map_new_tuple(cache: TupleCache, key: TupleCacheKey) -> None:
+    cache.set_tuples(key, (), cache.version())
+    cache.map([NewTuple(tuple_(1, tid=UUID(int=1)))])
+
+    assert cache.tuples(key) == (tuple_(1, tid=UUID(int=1)),)
+
+
+def test_map_mutated_tuple(cache: TupleCache, key: TupleCacheKey) -> None:
+    other_key = tuple_cache_key(Number(0), Number(0), 2)
+
+    cache.set_tuples(key, (tuple_(1, "a", tid=UUID(int=1)),), cache.version())
+    cache.set_tuples(other_key, (), cache.version())
+    cache.map([MutatedTuple(tuple_(2, "a", tid=UUID(int=1)))])
+
+    assert cache.tuples(key) == ()
+    assert cache.tuples(other_key) == (tuple_(2, "a", tid=UUID(int=1)),)
+
+
+def test_map_deleted_tuple(cache: TupleCache, key: TupleCacheKey) -> None:
+    cache.set_tuples(key, (tuple_(1, tid=UUID(int=1)),), cache.version())
+    cache.map([DeletedTuple(UUID(int=1))])
+
+    assert cache.tuples(key) == ()
+    assert cache.stats().tuple_count == 0
+
+
+def test_eviction_by_size() -> None:
+    cache = TupleCache(800, LruEviction())
+    first_key = tuple_cache_key(Number(0), Number(0), 1)
+    second_key = tuple_cache_key(Number(0), Number(0), 2)
+
+    cache.set_tuples(first_key, (tuple_(1, tid=UUID(int=1)),), 0)
+    cache.set_tuples(second_key, (tuple_(2, tid=UUID(int=2)),), 0)
+
+    assert cache.tuples(first_key) is None
+    assert cache.tuples(second_key) == (tuple_(2, tid=UUID(int=2)),)
+    assert cache.stats().size <= 800
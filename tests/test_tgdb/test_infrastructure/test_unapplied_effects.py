@@ -0,0 +1,167 @@
+from uuid import UUID
+
+from pytest import fixture
+
+from tgdb.entities.numeration.number import Number
+from tgdb.entities.relation.predicate import EqualityPredicate
+from tgdb.entities.relation.relation import RelationSchemaID
+from tgdb.entities.relation.tuple import tuple_
+from tgdb.entities.relation.tuple_effect import (
+    DeletedTuple,
+    MutatedTuple,
+    NewTuple,
+)
+from tgdb.infrastructure.unapplied_effects import UnappliedEffects
+
+
+relation_number = Number(0)
+predicate = EqualityPredicate(Number(1), "x")
+
+x1 = tuple_(1, "x", tid=UUID(int=1))
+x2 = tuple_(2, "x", tid=UUID(int=1))
+y = tuple_(3, "y", tid=UUID(int=1))
+z = tuple_(4, "x", tid=UUID(int=2))
+
+
+@fixture
+def effects() -> UnappliedEffects:
+    return UnappliedEffects()
+
+
+def test_without_effects(effects: UnappliedEffects) -> None:
+    tuples = (x1,)
+
+    overlaid_tuples = effects.overlaid_tuples(
+        relation_number,
+        predicate,
+        tuples,
+        is_exhaustive=True,
+    )
+
+    assert overlaid_tuples is tuples
+
+
+def test_new_tuple(effects: UnappliedEffects) -> None:
+    effects.push([{NewTuple(z)}])
+
+    overlaid_tuples = effects.overlaid_tuples(
+        relation_number,
+        predicate,
+        (x1,),
+        is_exhaustive=True,
+    )
+
+    assert list(overlaid_tuples) == [x1, z]
+
+
+def test_new_tuple_in_chunk(effects: UnappliedEffects) -> None:
+    effects.push([{NewTuple(z)}])
+
+    overlaid_tuples = effects.overlaid_tuples(
+        relation_number,
+        predicate,
+        (x1,),
+        is_exhaustive=False,
+    )
+
+    assert list(overlaid_tuples) == [x1]
+
+
+def test_new_tuple_of_other_relation(effects: UnappliedEffects) -> None:
+    other_z = tuple_(
+        4,
+        "x",
+        tid=UUID(int=2),
+        relation_schema_id=RelationSchemaID(Number(1), Number(0)),
+    )
+    effects.push([{NewTuple(other_z)}])
+
+    overlaid_tuples = effects.overlaid_tuples(
+        relation_number,
+        predicate,
+        (),
+        is_exhaustive=True,
+    )
+
+    assert not overlaid_tuples
+
+
+def test_mutated_tuple(effects: UnappliedEffects) -> None:
+    effects.push([{MutatedTuple(x2)}])
+
+    overlaid_tuples = effects.overlaid_tuples(
+        relation_number,
+        predicate,
+        (x1,),
+        is_exhaustive=True,
+    )
+
+    assert list(overlaid_tuples) == [x2]
+
+
+def test_tuple_mutated_outside_predicate(effects: UnappliedEffects) -> None:
+    effects.push([{MutatedTuple(y)}])
+
+    overlaid_tuples = effects.overlaid_tuples(
+        relation_number,
+        predicate,
+        (x1,),
+        is_exhaustive=True,
+    )
+
+    assert not overlaid_tuples
+
+
+def test_deleted_tuple(effects: UnappliedEffects) -> None:
+    effects.push([{DeletedTuple(x1.tid)}])
+
+    overlaid_tuples = effects.overlaid_tuples(
+        relation_number,
+        predicate,
+        (x1, z),
+        is_exhaustive=True,
+    )
+
+    assert list(overlaid_tuples) == [z]
+
+
+def test_last_effect(effects: UnappliedEffects) -> None:
+    effects.push([{NewTuple(x1)}, {MutatedTuple(x2)}])
+    effects.push([{DeletedTuple(x1.tid)}])
+    effects.apply([{NewTuple(x1)}, {MutatedTuple(x2)}])
+
+    overlaid_tuples = effects.overlaid_tuples(
+        relation_number,
+        predicate,
+        (x2,),
+        is_exhaustive=True,
+    )
+
+    assert not overlaid_tuples
+    assert len(effects) == 1
+
+
+def test_applied_effects(effects: UnappliedEffects) -> None:
+    effects.push([{NewTuple(x1)}, {MutatedTuple(x2), NewTuple(z)}])
+    effects.apply([{NewTuple(x1)}, {MutatedTuple(x2), NewTuple(z)}])
+
+    overlaid_tuples = effects.overlaid_tuples(
+        relation_number,
+        predicate,
+        (x1,),
+        is_exhaustive=True,
+    )
+
+    assert list(overlaid_tuples) == [x1]
+    assert len(effects) == 0
+
+
+def test_tuples_with_tids(effects: UnappliedEffects) -> None:
+    effects.push([{MutatedTuple(x2)}, {DeletedTuple(z.tid)}])
+
+    overlaid_tuples = effects.overlaid_tuples_with_tids(
+        (x1.tid, z.tid),
+        (x1, z),
+    )
+
+    assert list(overlaid_tuples) == [x2]